@@ -1,15 +1,65 @@
 """
 POINT D'ENTRÉE PRINCIPAL
+
+Modes:
+    python main.py                              # 1 processus (dashboard + API)
+    python main.py --mode multiprocess --api-workers 4
+        # processus pipeline (dashboard, WebSocket, contrôle) sur :5000
+        # + 4 processus API en lecture seule sur :5001 (état partagé mmap)
 """
 
+import argparse
 import sys
 import os
 
-# Ajouter src au path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Profil de démarrage: chronométrer les imports dès maintenant
+from src.core.monitoring.startup_profiler import startup_profiler
+from src.core.config.settings import config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Social Business Intelligence Platform")
+    parser.add_argument('--mode', choices=['single', 'multiprocess'], default=config.serving.mode,
+                        help="single: 1 processus; multiprocess: pipeline + workers API")
+    parser.add_argument('--api-workers', type=int, default=config.serving.api_workers,
+                        help="Processus API en lecture seule (mode multiprocess)")
+    args = parser.parse_args()
+
+    startup_profiler.install()
+
+    # Ajouter src au path
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+    # Lancer dashboard (composants lourds chargés en fond par start_warm_up)
+    from dashboard.app import app, socketio, start_warm_up, enable_shared_state
+
+    startup_profiler.mark('app_imported')
+
+    workers = None
+    if args.mode == 'multiprocess':
+        from src.dashboard.api import APIWorkerPool
+        from src.pipeline.shared_state import SharedStateWriter
+
+        enable_shared_state(SharedStateWriter(
+            config.serving.shared_state_path,
+            capacity=config.serving.shared_state_capacity
+        ))
+        workers = APIWorkerPool(
+            config.serving.shared_state_path,
+            host=config.serving.api_host,
+            port=config.serving.api_port,
+            workers=args.api_workers
+        )
+        workers.start()
+
+    try:
+        start_warm_up()
+        # Sans reloader: il relancerait un second processus (double démarrage à froid)
+        socketio.run(app, host='0.0.0.0', port=5000, debug=config.debug, use_reloader=False)
+    finally:
+        if workers is not None:
+            workers.stop()
 
-# Lancer dashboard
-from dashboard.app import app, socketio
 
 if __name__ == '__main__':
-    socketio.run(app, host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    main()
@@ -13,17 +13,31 @@ Technique clé: ThreadPoolExecutor + Pipeline IA
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import Counter
+import threading
 import time
 from datetime import datetime
 
-# NLP Libraries
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
 from src.core.models.social_data import SocialPost
+from src.core.models.post_batch import PostBatch
+
+
+# NLP Libraries: import différé (TextBlob/NLTK/VADER coûtent plusieurs
+# secondes au démarrage, payées au premier usage ou par warm_up())
+_engines = None
+_engines_lock = threading.Lock()
+
+
+def _load_engines():
+    """Importe TextBlob et VADER une seule fois par processus"""
+    global _engines
+    with _engines_lock:
+        if _engines is None:
+            from textblob import TextBlob
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            _engines = (TextBlob, SentimentIntensityAnalyzer)
+    return _engines
 
 
 class SentimentAnalyzer:
@@ -40,8 +54,10 @@ class SentimentAnalyzer:
         self.logger = logging.getLogger(__name__)
         self.max_workers = max_workers
         
-        # Initialiser les moteurs IA
-        self.vader_analyzer = SentimentIntensityAnalyzer()
+        # Moteurs IA initialisés au premier usage (voir warm_up)
+        self._textblob = None
+        self._vader_analyzer = None
+        self._init_lock = threading.Lock()
         
         # Statistiques
         self.stats = {
@@ -54,7 +70,37 @@ class SentimentAnalyzer:
         self.logger.info(f"  Threads: {max_workers}")
         self.logger.info(f" Moteurs IA: TextBlob + VADER")
     
-    def analyze_batch(self, posts: List[SocialPost]) -> List[SocialPost]:
+    def warm_up(self):
+        """
+        Charge les moteurs IA (imports + lexiques)
+        
+        Appelé au premier usage, ou en avance depuis un thread de fond
+        pour ne pas pénaliser le premier cycle d'analyse.
+        """
+        if self._vader_analyzer is not None:
+            return
+        
+        with self._init_lock:
+            if self._vader_analyzer is not None:
+                return
+            
+            start = time.time()
+            TextBlob, SentimentIntensityAnalyzer = _load_engines()
+            vader_analyzer = SentimentIntensityAnalyzer()
+            
+            # Premier appel TextBlob: charge le lexique de polarité
+            TextBlob("warm up").sentiment
+            
+            self._textblob = TextBlob
+            self._vader_analyzer = vader_analyzer
+            self.logger.info(f"🔥 Moteurs IA chargés en {time.time() - start:.2f}s")
+    
+    @property
+    def vader_analyzer(self):
+        self.warm_up()
+        return self._vader_analyzer
+    
+    def analyze_batch(self, posts: List[SocialPost]) -> PostBatch:
         """
         ANALYSE EN PARALLÈLE D'UN BATCH DE POSTS
         
@@ -68,10 +114,15 @@ class SentimentAnalyzer:
             posts: Liste de posts à analyser
             
         Returns:
-            Posts enrichis avec sentiment
+            Batch des posts enrichis avec sentiment (colonnes sentiment
+            calculées après l'analyse)
         """
         if not posts:
-            return []
+            return PostBatch.empty()
+        
+        # Hors des try (threads, posts): un moteur manquant remonte à
+        # l'appelant au lieu de donner un score 0.0 à chaque post
+        self.warm_up()
         
         start_time = time.time()
         analyzed_posts = []
@@ -107,21 +158,24 @@ class SentimentAnalyzer:
         
         except Exception as e:
             self.logger.error(f"💥 Erreur ThreadPoolExecutor: {e}")
-            return posts  # Retourner posts non analysés
+            return PostBatch.from_posts(posts)  # Retourner posts non analysés
         
-        # CALCUL MÉTRIQUES
+        # CALCUL MÉTRIQUES (colonnes construites une fois, réutilisées)
         analysis_time = time.time() - start_time
-        self._log_analysis_metrics(analyzed_posts, analysis_time)
+        batch = PostBatch.from_posts(analyzed_posts)
+        self._log_analysis_metrics(batch, analysis_time)
+        self._update_stats(len(batch), analysis_time)
         
-        # Mise à jour statistiques
-        self.stats['total_analyzed'] += len(analyzed_posts)
+        return batch
+    
+    def _update_stats(self, analyzed_count: int, analysis_time: float):
+        """Mise à jour statistiques"""
+        self.stats['total_analyzed'] += analyzed_count
         self.stats['analysis_count'] += 1
         self.stats['average_time'] = (
             (self.stats['average_time'] * (self.stats['analysis_count'] - 1) + analysis_time)
             / self.stats['analysis_count']
         )
-        
-        return analyzed_posts
     
     def _analyze_chunk(self, chunk: List[SocialPost], chunk_idx: int) -> List[SocialPost]:
         """
@@ -139,16 +193,7 @@ class SentimentAnalyzer:
             try:
                 # ANALYSE HYBRIDE: TextBlob + VADER
                 sentiment_score = self._hybrid_sentiment_analysis(post.content)
-                # Classification en catégories
-                sentiment_label = self._classify_sentiment(sentiment_score)
-                # Enrichir le post
-                post.sentiment = sentiment_label
-                post.sentiment_score = sentiment_score
-                # Calculer engagement rate
-                post.engagement_rate = self._calculate_engagement(post)
-                # Calculer business potential
-                post.business_potential = self._calculate_business_potential(post)
-                analyzed.append(post)
+                analyzed.append(self._enrich_post(post, sentiment_score))
             except Exception as e:
                 self.logger.debug(f"Erreur analyse post {post.id}: {e}")
                 # Ajouter sans analyse en cas d'erreur
@@ -157,6 +202,17 @@ class SentimentAnalyzer:
                 analyzed.append(post)
         return analyzed
     
+    def _enrich_post(self, post: SocialPost, sentiment_score: float) -> SocialPost:
+        """Enrichit un post à partir de son score sentiment"""
+        # Classification en catégories
+        post.sentiment = self._classify_sentiment(sentiment_score)
+        post.sentiment_score = sentiment_score
+        # Calculer engagement rate
+        post.engagement_rate = self._calculate_engagement(post)
+        # Calculer business potential
+        post.business_potential = self._calculate_business_potential(post)
+        return post
+    
     def _hybrid_sentiment_analysis(self, text: str) -> float:
         """
         ANALYSE HYBRIDE: TextBlob + VADER
@@ -174,13 +230,16 @@ class SentimentAnalyzer:
         if not text:
             return 0.0
         
+        # Moteurs déjà chargés par analyze_batch (sans effet dans ce cas)
+        self.warm_up()
+        
         try:
             # 1. TEXTBLOB ANALYSIS
-            blob = TextBlob(text)
+            blob = self._textblob(text)
             textblob_score = blob.sentiment.polarity  # [-1, 1]
             
             # 2. VADER ANALYSIS
-            vader_scores = self.vader_analyzer.polarity_scores(text)
+            vader_scores = self._vader_analyzer.polarity_scores(text)
             vader_score = vader_scores['compound']  # [-1, 1]
             
             # 3. SCORE HYBRIDE (moyenne pondérée)
@@ -267,10 +326,15 @@ class SentimentAnalyzer:
         
         return int(min(total_score / 10, 10))  # Normaliser sur 10
     
-    def get_sentiment_summary(self, posts: List[SocialPost]) -> Dict[str, Any]:
+    def get_sentiment_summary(self, posts: List[SocialPost],
+                              now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Génère un résumé des sentiments
         
+        Args:
+            posts: Posts à résumer
+            now: Horodatage du résumé (temps événement en replay)
+        
         Returns:
             Dictionnaire avec statistiques agrégées
         """
@@ -286,9 +350,10 @@ class SentimentAnalyzer:
                 'average_score': 0.0
             }
         
-        # Compter par catégorie
-        sentiment_counts = Counter(post.sentiment for post in posts if hasattr(post, 'sentiment'))
-        total = len(posts)
+        # Compter par catégorie (colonnes du batch: bincount, pas de boucle)
+        batch = PostBatch.from_posts(posts)
+        sentiment_counts = batch.sentiment_counts()
+        total = len(batch)
         
         # Calculer pourcentages
         percentages = {
@@ -296,9 +361,8 @@ class SentimentAnalyzer:
             for sentiment, count in sentiment_counts.items()
         }
         
-        # Score moyen
-        scores = [post.sentiment_score for post in posts if hasattr(post, 'sentiment_score')]
-        average_score = sum(scores) / len(scores) if scores else 0.0
+        # Score moyen (posts analysés)
+        average_score = batch.average_sentiment_score()
         
         return {
             'total': total,
@@ -309,7 +373,7 @@ class SentimentAnalyzer:
             'very_negative': sentiment_counts.get('very_negative', 0),
             'percentages': percentages,
             'average_score': average_score,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': (now or datetime.now()).isoformat()
         }
     
     def get_sentiment_by_category(self, posts: List[SocialPost]) -> Dict[str, Dict]:
@@ -342,7 +406,7 @@ class SentimentAnalyzer:
         
         return category_sentiments
     
-    def _log_analysis_metrics(self, posts: List[SocialPost], time_elapsed: float):
+    def _log_analysis_metrics(self, posts: PostBatch, time_elapsed: float):
         """Affiche les métriques d'analyse"""
         
         self.logger.info("=" * 70)
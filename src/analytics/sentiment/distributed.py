@@ -0,0 +1,436 @@
+"""
+DISTRIBUTED ANALYZER - ANALYSE SENTIMENT SUR PLUSIEURS NŒUDS
+=============================================================
+
+Responsabilités:
+1. Worker: serveur TCP qui calcule les scores sentiment (TextBlob + VADER)
+2. Coordinateur: découpe un batch en chunks de textes, les répartit sur
+   les workers disponibles et rassemble les scores
+3. Tolérance aux pannes: timeout par chunk, réassignation à un autre
+   worker, reconnexion différée, analyse locale en dernier recours
+4. Mode local: N processus workers sur 127.0.0.1 pour tester de bout
+   en bout sans cluster
+
+Protocole: multiprocessing.connection (messages pickle encadrés,
+authentification HMAC par authkey partagée). Seuls les textes
+transitent; classification, engagement et potentiel business restent
+calculés par le coordinateur.
+
+Sécurité: un message authentifié est désérialisé (pickle), donc
+exécutable. ANALYSIS_AUTHKEY est obligatoire (aucune clé par défaut)
+et un worker n'écoute que sur 127.0.0.1 sauf --host explicite.
+
+Usage:
+    # Sur chaque nœud d'analyse
+    ANALYSIS_AUTHKEY=secret python -m src.analytics.sentiment.distributed worker --port 6000
+
+    # Côté pipeline
+    ANALYSIS_WORKERS=node1:6000,node2:6000 ANALYSIS_AUTHKEY=secret python main.py
+
+    # Test local de bout en bout (3 workers, panne simulée, clé aléatoire
+    # si ANALYSIS_AUTHKEY n'est pas définie)
+    python -m src.analytics.sentiment.distributed demo --workers 3
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from typing import Any, Dict, List, Tuple
+
+from src.analytics.sentiment.analyzer import SentimentAnalyzer
+from src.core.models.social_data import SocialPost
+from src.core.models.post_batch import PostBatch
+
+Address = Tuple[str, int]
+
+
+def parse_worker_addresses(workers: str) -> List[Address]:
+    """'hôte:port,hôte:port' → [(hôte, port), ...]"""
+    addresses = []
+    for item in workers.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.rpartition(':')
+        addresses.append((host or '127.0.0.1', int(port)))
+    return addresses
+
+
+def require_authkey(authkey: bytes) -> bytes:
+    """
+    Raises:
+        ValueError: clé absente (ANALYSIS_AUTHKEY non définie)
+    """
+    if not authkey:
+        raise ValueError("Analyse distribuée: ANALYSIS_AUTHKEY doit être définie (clé partagée)")
+    return authkey
+
+
+# ============================================
+# WORKER (NŒUD D'ANALYSE)
+# ============================================
+
+class AnalysisWorkerServer:
+    """
+    Serveur d'analyse: un thread par connexion coordinateur
+
+    Requêtes:
+        ('analyze', chunk_id, [textes]) → ('ok', chunk_id, [scores])
+        ('ping', chunk_id, None)        → ('ok', chunk_id, pid)
+    """
+
+    def __init__(self, address: Address, authkey: bytes):
+        self.logger = logging.getLogger(__name__)
+        self.listener = Listener(address, authkey=require_authkey(authkey))
+        self.address = self.listener.address
+        self.analyzer = SentimentAnalyzer(max_workers=1)
+
+        self.stats = {
+            'connections': 0,
+            'chunks': 0,
+            'texts': 0,
+            'auth_failures': 0
+        }
+
+    def serve_forever(self):
+        self.analyzer.warm_up()
+        self.logger.info(f"🛰️  Worker d'analyse prêt sur {self.address[0]}:{self.address[1]}")
+
+        while True:
+            try:
+                conn = self.listener.accept()
+            except AuthenticationError:
+                self.stats['auth_failures'] += 1
+                self.logger.warning("⚠️  Connexion refusée: authkey invalide")
+                continue
+            except OSError:
+                break
+
+            self.stats['connections'] += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        with conn:
+            while True:
+                try:
+                    command, chunk_id, payload = conn.recv()
+                except (EOFError, OSError):
+                    return
+
+                if command == 'analyze':
+                    scores = [self.analyzer._hybrid_sentiment_analysis(text) for text in payload]
+                    self.stats['chunks'] += 1
+                    self.stats['texts'] += len(payload)
+                    conn.send(('ok', chunk_id, scores))
+                elif command == 'ping':
+                    conn.send(('ok', chunk_id, multiprocessing.current_process().pid))
+                else:
+                    conn.send(('error', chunk_id, f"commande inconnue: {command}"))
+
+    def close(self):
+        self.listener.close()
+
+
+# ============================================
+# COORDINATEUR (PIPELINE)
+# ============================================
+
+class RemoteWorker:
+    """Connexion coordinateur → worker (une requête à la fois)"""
+
+    def __init__(self, address: Address, authkey: bytes, timeout: float,
+                 reconnect_delay: float):
+        self.address = address
+        self.authkey = authkey
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+
+        self.conn = None
+        self.lost_until = 0.0
+        self.stats = {
+            'chunks': 0,
+            'failures': 0,
+            'busy_time': 0.0
+        }
+
+    @property
+    def name(self) -> str:
+        return f"{self.address[0]}:{self.address[1]}"
+
+    def available(self) -> bool:
+        return time.monotonic() >= self.lost_until
+
+    def analyze(self, chunk_id: int, texts: List[str]) -> List[float]:
+        """
+        Envoie un chunk et attend les scores
+
+        Raises:
+            OSError, EOFError, TimeoutError, RuntimeError: worker à écarter
+        """
+        start = time.time()
+        if self.conn is None:
+            self.conn = Client(self.address, authkey=self.authkey)
+
+        self.conn.send(('analyze', chunk_id, texts))
+        if not self.conn.poll(self.timeout):
+            raise TimeoutError(f"pas de réponse en {self.timeout:.0f}s")
+
+        status, reply_id, result = self.conn.recv()
+        if status != 'ok' or reply_id != chunk_id or len(result) != len(texts):
+            raise RuntimeError(f"réponse invalide ({status}): {result!r:.100}")
+
+        self.stats['chunks'] += 1
+        self.stats['busy_time'] += time.time() - start
+        return result
+
+    def mark_lost(self):
+        """Ferme la connexion; nouvel essai après reconnect_delay"""
+        self.stats['failures'] += 1
+        self.lost_until = time.monotonic() + self.reconnect_delay
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except OSError:
+                pass
+            self.conn = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'busy_time': round(self.stats['busy_time'], 2),
+            'available': self.available()
+        }
+
+
+class DistributedSentimentAnalyzer(SentimentAnalyzer):
+    """
+    SentimentAnalyzer dont le calcul des scores est réparti sur des
+    workers distants
+
+    Un thread par worker disponible tire les chunks d'une file commune:
+    un worker rapide traite plus de chunks. Un chunk en échec (connexion
+    perdue, timeout) est remis en file pour un autre worker; après
+    max_attempts échecs, ou si plus aucun worker n'est disponible, il
+    est analysé localement.
+    """
+
+    def __init__(self, workers: List[Address], authkey: bytes,
+                 chunk_size: int = 200, timeout: float = 30.0,
+                 max_attempts: int = 3, reconnect_delay: float = 5.0,
+                 max_workers: int = 4):
+        super().__init__(max_workers=max_workers)
+        require_authkey(authkey)
+        self.chunk_size = chunk_size
+        self.max_attempts = max_attempts
+        self.workers = [
+            RemoteWorker(address, authkey, timeout, reconnect_delay)
+            for address in workers
+        ]
+
+        self.stats.update({
+            'remote_chunks': 0,
+            'reassigned_chunks': 0,
+            'local_chunks': 0
+        })
+
+        self.logger.info(
+            f"🛰️  Analyse distribuée: {len(self.workers)} workers "
+            f"({', '.join(worker.name for worker in self.workers)})"
+        )
+
+    def analyze_batch(self, posts: List[SocialPost]) -> PostBatch:
+        if not posts:
+            return PostBatch.empty()
+
+        start_time = time.time()
+        chunks = [posts[i:i + self.chunk_size] for i in range(0, len(posts), self.chunk_size)]
+        self.logger.info(f"🧠 ANALYSE DISTRIBUÉE: {len(posts)} posts, {len(chunks)} chunks")
+
+        scores: Dict[int, List[float]] = {}
+        pending: queue.Queue = queue.Queue()
+        for chunk_id in range(len(chunks)):
+            pending.put(chunk_id)
+
+        attempts = [0] * len(chunks)
+        abandoned: List[int] = []
+        lock = threading.Lock()
+
+        def done() -> bool:
+            return len(scores) + len(abandoned) >= len(chunks)
+
+        def run(worker: RemoteWorker):
+            while not done():
+                try:
+                    chunk_id = pending.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                texts = [post.content for post in chunks[chunk_id]]
+                try:
+                    scores[chunk_id] = worker.analyze(chunk_id, texts)
+                except (OSError, EOFError, TimeoutError, RuntimeError) as e:
+                    worker.mark_lost()
+                    with lock:
+                        attempts[chunk_id] += 1
+                        if attempts[chunk_id] >= self.max_attempts:
+                            abandoned.append(chunk_id)
+                        else:
+                            self.stats['reassigned_chunks'] += 1
+                            pending.put(chunk_id)
+                    self.logger.warning(f"⚠️  Worker {worker.name} écarté (chunk {chunk_id}): {type(e).__name__} {e}")
+                    return
+
+        threads = [
+            threading.Thread(target=run, args=(worker,), name=f"analysis-{worker.name}", daemon=True)
+            for worker in self.workers if worker.available()
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Chunks restants (tous les workers perdus, ou abandonnés): analyse locale
+        analyzed_posts = []
+        for chunk_id, chunk in enumerate(chunks):
+            if chunk_id in scores:
+                self.stats['remote_chunks'] += 1
+                for post, score in zip(chunk, scores[chunk_id]):
+                    analyzed_posts.append(self._enrich_post(post, score))
+            else:
+                self.stats['local_chunks'] += 1
+                analyzed_posts.extend(self._analyze_chunk(chunk, chunk_id))
+
+        analysis_time = time.time() - start_time
+        self._log_analysis_metrics(analyzed_posts, analysis_time)
+        self._update_stats(len(analyzed_posts), analysis_time)
+        return PostBatch.from_posts(analyzed_posts)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'workers': {worker.name: worker.get_statistics() for worker in self.workers}
+        }
+
+
+# ============================================
+# WORKERS LOCAUX (TEST DE BOUT EN BOUT)
+# ============================================
+
+def _serve_local_worker(authkey: bytes, addresses):
+    """Processus worker local: port choisi par l'OS, publié au parent"""
+    logging.basicConfig(level=logging.WARNING)
+    server = AnalysisWorkerServer(('127.0.0.1', 0), authkey)
+    addresses.put(server.address)
+    server.serve_forever()
+
+
+class LocalWorkerCluster:
+    """N processus workers sur 127.0.0.1"""
+
+    def __init__(self, count: int, authkey: bytes):
+        self.count = count
+        self.authkey = authkey
+        self.processes: List[multiprocessing.Process] = []
+        self.addresses: List[Address] = []
+
+    def start(self, timeout: float = 60.0) -> List[Address]:
+        context = multiprocessing.get_context('spawn')
+        addresses = context.Queue()
+        for index in range(self.count):
+            process = context.Process(
+                target=_serve_local_worker,
+                args=(self.authkey, addresses),
+                name=f"analysis-worker-{index}",
+                daemon=True
+            )
+            process.start()
+            self.processes.append(process)
+
+        self.addresses = [tuple(addresses.get(timeout=timeout)) for _ in range(self.count)]
+        return self.addresses
+
+    def stop(self):
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join()
+
+
+# ============================================
+# CLI
+# ============================================
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    from src.core.config.settings import config
+
+    parser = argparse.ArgumentParser(description="Workers d'analyse sentiment distribuée")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    worker_parser = subparsers.add_parser('worker', help="Lancer un worker d'analyse")
+    worker_parser.add_argument('--host', default='127.0.0.1',
+                               help="Adresse d'écoute (0.0.0.0 pour les coordinateurs distants)")
+    worker_parser.add_argument('--port', type=int, default=6000)
+
+    demo_parser = subparsers.add_parser('demo', help="Test local de bout en bout (panne simulée)")
+    demo_parser.add_argument('--workers', type=int, default=3)
+    demo_parser.add_argument('--posts', type=int, default=5000)
+
+    args = parser.parse_args()
+    authkey = config.distributed.authkey.encode('utf-8')
+    if args.command == 'demo' and not authkey:
+        # Workers locaux lancés par ce processus: clé à usage unique
+        authkey = os.urandom(32)
+    elif not authkey:
+        parser.error("ANALYSIS_AUTHKEY doit être définie (clé partagée avec les coordinateurs)")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if args.command == 'worker':
+        AnalysisWorkerServer((args.host, args.port), authkey).serve_forever()
+    else:
+        from src.data.collectors.master_collector import MasterCollector
+
+        logging.getLogger('src.data.collectors').setLevel(logging.WARNING)
+        cluster = LocalWorkerCluster(args.workers, authkey)
+        addresses = cluster.start()
+        print(f"🛰️  {len(addresses)} workers locaux: {addresses}")
+
+        collector = MasterCollector()
+        posts = []
+        while len(posts) < args.posts:
+            posts.extend(collector.collect_all_platforms_parallel())
+        posts = posts[:args.posts]
+
+        analyzer = DistributedSentimentAnalyzer(
+            addresses, authkey,
+            chunk_size=100, timeout=config.distributed.timeout,
+            max_attempts=config.distributed.max_attempts
+        )
+
+        # Panne simulée: un worker tué pendant l'analyse
+        killer = threading.Timer(0.05, cluster.processes[0].terminate)
+        killer.start()
+
+        start = time.time()
+        analyzed = analyzer.analyze_batch(posts)
+        elapsed = time.time() - start
+
+        complete = all(post.sentiment is not None for post in analyzed)
+        print(f"\n✅ {len(analyzed)}/{len(posts)} posts analysés en {elapsed:.2f}s "
+              f"(tous enrichis: {complete}, pid coordinateur: {os.getpid()})")
+        stats = analyzer.get_statistics()
+        print(f"📦 Chunks distants: {stats['remote_chunks']} | réassignés: "
+              f"{stats['reassigned_chunks']} | locaux: {stats['local_chunks']}")
+        for name, worker_stats in stats['workers'].items():
+            print(f"   {name}: {worker_stats}")
+
+        cluster.stop()
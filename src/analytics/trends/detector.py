@@ -4,12 +4,13 @@ TREND DETECTOR - DÉTECTION TENDANCES BUSINESS
 """
 
 import logging
-from typing import List, Dict
-from collections import Counter, defaultdict
+from typing import List, Dict, Optional
+from collections import defaultdict
 from datetime import datetime
 import re
 
 from src.core.models.social_data import SocialPost, Trend, BusinessCategory
+from src.core.models.post_batch import PostBatch
 
 
 class TrendDetector:
@@ -19,7 +20,8 @@ class TrendDetector:
         self.logger = logging.getLogger(__name__)
         self.previous_volumes = defaultdict(int)
     
-    def detect_business_trends(self, posts: List[SocialPost]) -> List[Trend]:
+    def detect_business_trends(self, posts: List[SocialPost],
+                               now: Optional[datetime] = None) -> List[Trend]:
         """
         Détecte les tendances dans les posts
         
@@ -28,6 +30,11 @@ class TrendDetector:
         2. Calculer croissance vs cycle précédent
         3. Analyser sentiment par tendance
         4. Scorer opportunité business
+        
+        Args:
+            posts: Posts du cycle (ou de la fenêtre)
+            now: Temps de référence (temps événement en replay),
+                 datetime.now() par défaut
         """
         if not posts:
             return []
@@ -49,7 +56,7 @@ class TrendDetector:
             
             # Seuil détection: +50% croissance ou volume > 20
             if growth > 0.5 or data['count'] > 20:
-                trend = self._create_trend(keyword, data, growth, posts)
+                trend = self._create_trend(keyword, data, growth, posts, now)
                 trends.append(trend)
         
         # Mettre à jour historique
@@ -63,15 +70,23 @@ class TrendDetector:
         
         return trends[:10]  # Top 10
     
+    def get_state(self) -> Dict[str, int]:
+        """Volumes du cycle précédent (pour snapshot)"""
+        return dict(self.previous_volumes)
+    
+    def load_state(self, previous_volumes: Dict[str, int]):
+        """Restaure les volumes du cycle précédent (croissance correcte dès le 1er cycle)"""
+        self.previous_volumes = defaultdict(int, previous_volumes)
+    
     def _extract_keywords(self, posts: List[SocialPost]) -> Dict:
-        """Extrait mots-clés importants"""
-        keywords = defaultdict(lambda: {
-            'count': 0,
-            'sentiments': [],
-            'categories': [],
-            'platforms': set(),
-            'phrases': []
-        })
+        """
+        Extrait mots-clés importants
+
+        Returns:
+            {mot-clé: {'count', 'posts' (sous-batch des posts qui le
+            mentionnent), 'phrases'}}
+        """
+        keywords = {}
         
         # Mots-clés à chercher
         important_words = {
@@ -82,27 +97,37 @@ class TrendDetector:
             'fashion', 'vintage', 'thrift'
         }
         
-        for post in posts:
-            text = post.content.lower()
+        # Colonne texte mise en minuscules une seule fois
+        batch = PostBatch.from_posts(posts)
+        texts = [text.lower() for text in batch.text('content')]
+        
+        mentions = []
+        for word in important_words:
+            needle = word.lower()
+            hits = [i for i, text in enumerate(texts) if needle in text]
+            if hits:
+                mentions.append((hits[0], word, needle, hits))
+        
+        # Ordre de première mention (puis alphabétique): indépendant du
+        # hash seed, donc ex aequo et top 10 stables d'un run à l'autre
+        for _, word, needle, hits in sorted(mentions):
+            # Extraire phrase contexte (3 premières mentions)
+            pattern = re.compile(rf'.{{0,30}}{re.escape(needle)}.{{0,30}}')
+            phrases = []
+            for i in hits:
+                match = pattern.search(texts[i])
+                if match:
+                    phrases.append(match.group())
+                    if len(phrases) == 3:
+                        break
             
-            # Chercher mots-clés
-            for word in important_words:
-                if word.lower() in text:
-                    keywords[word]['count'] += 1
-                    if hasattr(post, 'sentiment'):
-                        keywords[word]['sentiments'].append(post.sentiment)
-                    keywords[word]['categories'].append(post.category)
-                    keywords[word]['platforms'].add(post.platform.value)
-                    
-                    # Extraire phrase contexte
-                    match = re.search(
-                        rf'.{{0,30}}{re.escape(word.lower())}.{{0,30}}',
-                        text
-                    )
-                    if match:
-                        keywords[word]['phrases'].append(match.group())
-        
-        return dict(keywords)
+            keywords[word] = {
+                'count': len(hits),
+                'posts': batch.take(hits),
+                'phrases': phrases
+            }
+        
+        return keywords
 #calcule de la croissance
     def _calculate_growth(self, current: int, previous: int) -> float:
         """Calcule croissance"""
@@ -110,15 +135,17 @@ class TrendDetector:
             return 1.0 if current > 0 else 0.0
         return (current - previous) / previous
     
-    def _create_trend(self, keyword: str, data: Dict, growth: float, posts: List[SocialPost]) -> Trend:
+    def _create_trend(self, keyword: str, data: Dict, growth: float, posts: List[SocialPost],
+                      now: Optional[datetime] = None) -> Trend:
         """Crée objet Trend"""
         
+        mentions = data['posts']
+        
         # Distribution sentiments
-        sentiment_dist = Counter(data['sentiments'])
+        sentiment_dist = mentions.sentiment_counts()
         
         # Catégorie dominante
-        category_counts = Counter(data['categories'])
-        dominant_category = category_counts.most_common(1)[0][0]
+        dominant_category = mentions.dominant_category()
         
         # Confiance (basé sur volume)
         confidence = min(data['count'] / 50, 1.0)
@@ -139,11 +166,11 @@ class TrendDetector:
             name=keyword.upper(),
             volume=data['count'],
             growth_24h=growth,
-            sentiment_distribution=dict(sentiment_dist),
-            key_phrases=data['phrases'][:3],
-            platforms=list(data['platforms']),
+            sentiment_distribution=sentiment_dist,
+            key_phrases=data['phrases'],
+            platforms=mentions.platforms(),
             category=dominant_category,
             confidence=confidence,
             market_opportunity=min(market_score, 100),
-            detected_at=datetime.now()
+            detected_at=now or datetime.now()
         )
\ No newline at end of file
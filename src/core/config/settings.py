@@ -4,16 +4,153 @@ CONFIGURATION SYSTÈME
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
 class AnalysisConfig:
     """Configuration analyse"""
     update_interval: int = 30  # secondes entre cycles
+    missed_tick_policy: str = 'skip'  # cycles en retard: 'skip' ou 'catch_up'
+    error_backoff: int = 30  # secondes de pause après une erreur de collecte
     max_workers: int = 4  # threads pour analyse
     trend_threshold: float = 0.5  # seuil détection tendance
     sentiment_batch_size: int = 50  # posts par batch
+    pipeline_queue_size: int = 2  # cycles en attente max entre 2 étapes
+
+
+@dataclass
+class CollectionConfig:
+    """Configuration supervision de la collecte"""
+    default_timeout: float = 30.0  # échéance par plateforme (secondes)
+    platform_timeouts: Dict[str, float] = field(default_factory=dict)  # ex: {'TikTok': 45.0}
+    hang_timeout: float = 120.0  # collecte en cours depuis plus longtemps: processus redémarré
+    cursor_path: str = os.getenv('CURSOR_PATH', 'data/cursors/collectors.json')  # checkpoint des curseurs
+    max_processes: Optional[int] = None  # budget de processus de collecte (défaut: 2 × CPU)
+    # Sources (voir src/data/collectors/registry.py: SourceSpec); les paquets
+    # installés peuvent en ajouter via l'entry point "social_intelligence.collectors"
+    sources: List[Dict[str, Any]] = field(default_factory=lambda: [
+        {'name': 'Reddit', 'factory': 'src.data.collectors.reddit_collector:DynamicRedditCollector',
+         'method': 'collect_business_data'},
+        {'name': 'Twitter', 'factory': 'src.data.collectors.twitter_collector:DynamicTwitterCollector',
+         'method': 'collect_business_trends'},
+        {'name': 'Instagram', 'factory': 'src.data.collectors.instagram_collector:DynamicInstagramCollector',
+         'method': 'collect_business_posts'},
+        {'name': 'TikTok', 'factory': 'src.data.collectors.tiktok_collector:DynamicTikTokCollector',
+         'method': 'collect_trending_content'},
+    ])
+
+
+@dataclass
+class PollingConfig:
+    """Configuration fréquence de collecte adaptative par source"""
+    adaptive: bool = True  # False: période fixe (SourceSpec.interval ou chaque cycle)
+    min_interval: float = 5.0  # secondes min entre 2 collectes d'une source (pendant un pic)
+    max_interval: float = 300.0  # secondes max entre 2 collectes d'une source calme
+    fast_alpha: float = 0.5  # lissage du débit récent de nouveaux posts
+    slow_alpha: float = 0.05  # lissage du débit habituel
+    event_factor: float = 0.25  # événement actif: période ≤ event_factor × période de base
+    event_threshold: float = 0.2  # part min des posts signalés pour un événement actif
+    idle_backoff: float = 1.5  # collecte sans nouveau post: période multipliée
+    relaxation: float = 0.2  # retour vers la période de base à chaque collecte
+
+
+@dataclass
+class HTTPCollectionConfig:
+    """Configuration collecteurs API (aiohttp)"""
+    max_concurrency: int = 8  # requêtes simultanées max par plateforme
+    max_connections: int = 16  # connexions keep-alive max par plateforme
+    max_pages: int = 5  # pages max par requête paginée
+    max_retries: int = 3  # nouvelles tentatives (réseau, 5xx, 429)
+    backoff: float = 0.5  # secondes avant la 1re reprise (doublé ensuite)
+    request_timeout: float = 15.0  # secondes max par requête
+    keepalive_timeout: float = 30.0  # secondes avant fermeture d'une connexion inactive
+
+
+@dataclass
+class RateLimitConfig:
+    """Configuration quotas des API plateformes"""
+    # plateforme → (requêtes, fenêtre en secondes)
+    limits: Dict[str, Tuple[int, float]] = field(default_factory=lambda: {
+        'twitter': (450, 900.0),  # recherche récente, auth application
+        'reddit': (100, 60.0),  # OAuth
+        'instagram': (200, 3600.0),  # Graph API
+        'tiktok': (1000, 86400.0)  # Research API
+    })
+    burst: int = 1  # requêtes consécutives max sans espacement
+    state_dir: str = 'data/ratelimits'  # état des quotas conservé entre redémarrages
+    persist_interval: float = 5.0  # secondes min entre 2 sauvegardes d'une plateforme
+
+
+@dataclass
+class DedupConfig:
+    """Configuration déduplication avant analyse"""
+    window_seconds: int = 86400  # un post revu dans cet intervalle est écarté
+    max_entries: int = 1_000_000  # empreintes max en mémoire (2 par post)
+    generations: int = 4  # granularité de l'expiration (window / generations)
+    # Plateformes dédupliquées aussi par contenu (auteur + texte), ex:
+    # ['twitter', 'reddit'] avec les collecteurs API. Vide par défaut: les
+    # collecteurs simulés réutilisent leurs gabarits et auteurs, le contenu
+    # y produirait de faux doublons (identité seule)
+    content_platforms: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BroadcastConfig:
+    """Configuration diffusion WebSocket"""
+    client_queue_size: int = 20  # messages max en attente par client
+    min_emit_interval: float = 0.0  # secondes min entre 2 envois à un client
+    ack_timeout: float = 5.0  # secondes avant de considérer un client lent
+
+
+@dataclass
+class IngestConfig:
+    """Configuration ingestion NDJSON (POST /api/ingest)"""
+    batch_size: int = 500  # posts par batch envoyé à l'analyse
+    max_line_bytes: int = 65536  # taille max d'une ligne NDJSON
+    max_errors_reported: int = 20  # erreurs de parsing renvoyées au client
+
+
+@dataclass
+class ReplayConfig:
+    """Configuration replay/backfill hors-ligne"""
+    window_seconds: int = 1800  # taille fenêtre temps événement
+    batch_size: int = 1000  # posts par batch d'analyse
+
+
+@dataclass
+class SnapshotConfig:
+    """Configuration snapshots d'état (redémarrage à chaud)"""
+    path: str = os.getenv('SNAPSHOT_PATH', 'data/snapshots/pipeline_state.json.gz')
+    interval: int = 60  # secondes min entre 2 snapshots
+    max_posts: int = 5000  # posts récents conservés dans le snapshot
+    max_age: int = 3600  # au-delà, l'historique du détecteur n'est pas restauré
+
+
+@dataclass
+class ServingConfig:
+    """Configuration déploiement: 1 processus pipeline + N workers API"""
+    mode: str = os.getenv('SERVING_MODE', 'single')  # 'single' ou 'multiprocess'
+    api_workers: int = 4  # processus API en lecture seule
+    api_host: str = '0.0.0.0'
+    api_port: int = 5001
+    shared_state_path: str = 'data/shared/state.bin'  # fichier mmap partagé
+    shared_state_capacity: int = 16 * 1024 * 1024  # octets max d'un état publié
+
+
+@dataclass
+class DistributedAnalysisConfig:
+    """Configuration analyse distribuée (workers distants)"""
+    # Adresses des workers "hôte:port,hôte:port" (vide = analyse locale)
+    workers: str = os.getenv('ANALYSIS_WORKERS', '')
+    # Clé HMAC partagée, obligatoire (pas de valeur par défaut): les
+    # workers désérialisent (pickle) les messages authentifiés
+    authkey: str = os.getenv('ANALYSIS_AUTHKEY', '')
+    chunk_size: int = 200  # textes par requête
+    timeout: float = 30.0  # secondes max par chunk avant réassignation
+    max_attempts: int = 3  # tentatives distantes avant analyse locale
+    reconnect_delay: float = 5.0  # secondes avant de recontacter un worker perdu
 
 
 @dataclass
@@ -27,10 +164,58 @@ class Config:
     # Analyse
     analysis = AnalysisConfig()
     
-    # API (pour future expansion)
+    # Collecte
+    collection = CollectionConfig()
+    
+    # Fréquence de collecte adaptative
+    polling = PollingConfig()
+    
+    # Collecteurs API
+    http = HTTPCollectionConfig()
+    
+    # Quotas API
+    rate_limits = RateLimitConfig()
+    
+    # Déduplication
+    dedup = DedupConfig()
+    
+    # WebSocket
+    broadcast = BroadcastConfig()
+    
+    # Ingestion externe
+    ingest = IngestConfig()
+    
+    # Replay hors-ligne
+    replay = ReplayConfig()
+    
+    # Snapshots d'état
+    snapshot = SnapshotConfig()
+    
+    # Analyse distribuée
+    distributed = DistributedAnalysisConfig()
+    
+    # Déploiement multi-processus
+    serving = ServingConfig()
+    
+    # API plateformes (collecteurs async: src/data/collectors/api_collectors.py)
     api = {
         'twitter': {
+            'base_url': os.getenv('TWITTER_API_URL', 'https://api.twitter.com'),
             'bearer_token': os.getenv('TWITTER_BEARER_TOKEN', '')
+        },
+        'reddit': {
+            'base_url': os.getenv('REDDIT_API_URL', 'https://oauth.reddit.com'),
+            'access_token': os.getenv('REDDIT_ACCESS_TOKEN', ''),
+            'user_agent': os.getenv('REDDIT_USER_AGENT', 'social-intelligence/1.0')
+        },
+        'instagram': {
+            'base_url': os.getenv('INSTAGRAM_API_URL', 'https://graph.facebook.com/v19.0'),
+            'access_token': os.getenv('INSTAGRAM_ACCESS_TOKEN', ''),
+            'user_id': os.getenv('INSTAGRAM_USER_ID', '')
+        },
+        'tiktok': {
+            'base_url': os.getenv('TIKTOK_API_URL', 'https://open.tiktokapis.com'),
+            'access_token': os.getenv('TIKTOK_ACCESS_TOKEN', '')
         }
     }
 
@@ -0,0 +1,404 @@
+"""
+POST BATCH - BATCH COLONNAIRE DE POSTS
+=======================================
+
+Unité de travail du pipeline (collecte → analyse → tendances → état):
+les agrégats (comptes par plateforme, catégorie, sentiment, score moyen,
+fenêtre temporelle) sont des opérations NumPy sur des colonnes au lieu
+de boucles Python sur des objets.
+
+Colonnes (1 valeur par post, figées à la construction du batch):
+    platform, category      codes uint8 (PLATFORMS, CATEGORIES)
+    sentiment               code int8 (SENTIMENTS, -1 = non analysé)
+    created_at              int64, microsecondes depuis 1970-01-01
+                            (heure locale naïve, comme les dates du système)
+    author_followers        int64
+    sentiment_score,
+    engagement_rate         float64 (NaN = non analysé)
+    business_potential      int16 (-1 = non analysé)
+    id, content, author,
+    url                     tableaux de chaînes (construits au premier
+                            accès pour un batch créé depuis des posts)
+
+Lignes: le batch est une séquence de SocialPost (itération, index,
+tranches): le code qui lit des posts un par un fonctionne sans
+changement. Un batch créé depuis des colonnes (ex: LoadGenerator)
+ne construit chaque SocialPost qu'au premier accès à sa ligne.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+
+PLATFORMS = tuple(Platform)
+CATEGORIES = tuple(BusinessCategory)
+SENTIMENTS = ('very_negative', 'negative', 'neutral', 'positive', 'very_positive')
+
+_PLATFORM_CODES = {platform: code for code, platform in enumerate(PLATFORMS)}
+_CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+_SENTIMENT_CODES = {sentiment: code for code, sentiment in enumerate(SENTIMENTS)}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+NUMERIC_COLUMNS = {
+    'platform': np.uint8,
+    'category': np.uint8,
+    'sentiment': np.int8,
+    'created_at': np.int64,
+    'author_followers': np.int64,
+    'sentiment_score': np.float64,
+    'engagement_rate': np.float64,
+    'business_potential': np.int16,
+}
+TEXT_COLUMNS = ('id', 'content', 'author', 'url')
+
+
+def to_microseconds(moment: datetime) -> int:
+    """datetime naïf → valeur de la colonne created_at"""
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def from_microseconds(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(value))
+
+
+def _text_array(values: Iterable[Any], size: int) -> np.ndarray:
+    array = np.empty(size, dtype=object)
+    array[:] = list(values)
+    return array
+
+
+class PostBatch(Sequence):
+    """
+    Batch colonnaire, séquence de SocialPost
+
+    Exemple:
+        batch = PostBatch.from_posts(posts)
+        batch.platform_counts()                    # {'reddit': 120, ...}
+        recent = batch.since(now - timedelta(hours=24))
+        for post in recent: ...                    # SocialPost
+    """
+
+    __slots__ = ('columns', 'metrics', '_rows', '_row_factory', '_cache')
+
+    def __init__(self, columns: Dict[str, np.ndarray],
+                 rows: Optional[List[Optional[SocialPost]]] = None,
+                 metrics: Optional[Dict[str, np.ndarray]] = None,
+                 row_factory: Optional[Callable[[int], SocialPost]] = None):
+        """
+        Args:
+            columns: colonnes numériques (NUMERIC_COLUMNS) et, si pas de
+                     lignes, colonnes texte (TEXT_COLUMNS)
+            rows: SocialPost de chaque ligne (None = créées à la demande)
+            metrics: colonnes de métriques (batch sans lignes)
+            row_factory: index → SocialPost (défaut: depuis les colonnes)
+        """
+        self.columns = columns
+        self.metrics = metrics or {}
+        size = len(columns['platform'])
+        self._rows = rows if rows is not None else [None] * size
+        self._row_factory = row_factory
+        self._cache: Dict[str, Any] = {}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_posts(cls, posts: Iterable[SocialPost]) -> 'PostBatch':
+        """Colonnes extraites des posts (un batch est renvoyé tel quel)"""
+        if isinstance(posts, PostBatch):
+            return posts
+        rows = list(posts)
+        n = len(rows)
+        columns = {
+            'platform': np.fromiter((_PLATFORM_CODES[p.platform] for p in rows), np.uint8, n),
+            'category': np.fromiter((_CATEGORY_CODES[p.category] for p in rows), np.uint8, n),
+            'sentiment': np.fromiter((_SENTIMENT_CODES.get(p.sentiment, -1) for p in rows), np.int8, n),
+            'created_at': np.fromiter((to_microseconds(p.created_at) for p in rows), np.int64, n),
+            'author_followers': np.fromiter((p.author_followers for p in rows), np.int64, n),
+            'sentiment_score': np.array([p.sentiment_score for p in rows], dtype=np.float64).reshape(n),
+            'engagement_rate': np.array([p.engagement_rate for p in rows], dtype=np.float64).reshape(n),
+            'business_potential': np.array(
+                [-1 if p.business_potential is None else p.business_potential for p in rows],
+                dtype=np.int16
+            ).reshape(n),
+        }
+        return cls(columns, rows)
+
+    @classmethod
+    def empty(cls) -> 'PostBatch':
+        return cls.from_posts(())
+
+    @classmethod
+    def concat(cls, batches: Iterable[Union['PostBatch', Iterable[SocialPost]]]) -> 'PostBatch':
+        """Batches (ou listes de posts) bout à bout"""
+        batches = [cls.from_posts(batch) for batch in batches]
+        batches = [batch for batch in batches if len(batch)]
+        if not batches:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+
+        columns = {
+            name: np.concatenate([batch.columns[name] for batch in batches])
+            for name in NUMERIC_COLUMNS
+        }
+        if all(batch._rows_complete() for batch in batches):
+            rows = [row for batch in batches for row in batch._rows]
+            return cls(columns, rows)
+
+        # Lignes à la demande: chaque ligne est demandée au batch d'origine
+        for name in TEXT_COLUMNS:
+            columns[name] = np.concatenate([batch.text(name) for batch in batches])
+        offsets = np.cumsum([0] + [len(batch) for batch in batches])
+
+        def row_factory(index: int) -> SocialPost:
+            source = int(np.searchsorted(offsets, index, side='right')) - 1
+            return batches[source][index - int(offsets[source])]
+
+        return cls(columns, row_factory=row_factory)
+
+    def take(self, index: Union[np.ndarray, List[int]]) -> 'PostBatch':
+        """
+        Sous-batch (indices ou masque booléen), ordre conservé
+
+        Les lignes restent les mêmes objets SocialPost. Le sous-batch ne
+        référence pas ce batch: colonnes sélectionnées copiées, lignes
+        à la demande reconstruites depuis ces colonnes, lignes fournies
+        par une row_factory (concat, générateur) matérialisées.
+        """
+        index = np.asarray(index)
+        if index.dtype == bool:
+            if index.all():
+                return self
+            index = np.flatnonzero(index)
+        elif len(index) == 0:
+            index = index.astype(np.int64)
+
+        columns = {name: self.columns[name][index] for name in NUMERIC_COLUMNS}
+        if self._rows_complete():
+            rows = self._rows
+            return PostBatch(columns, [rows[i] for i in index.tolist()])
+
+        positions = index.tolist()
+        if self._row_factory is not None:
+            return PostBatch(columns, [self[i] for i in positions])
+
+        # Lignes déjà construites reprises, les autres construites depuis
+        # les colonnes du sous-batch
+        rows = self._rows
+        for name in TEXT_COLUMNS:
+            columns[name] = self.text(name)[index]
+        return PostBatch(
+            columns,
+            [rows[i] for i in positions],
+            metrics={name: column[index] for name, column in self.metrics.items()}
+        )
+
+    # ------------------------------------------------------------------
+    # Séquence de SocialPost
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        row = self._rows[index]
+        if row is None:
+            if index < 0:
+                index += len(self)
+            row = self._rows[index] = self._build_row(index)
+        return row
+
+    def __iter__(self) -> Iterator[SocialPost]:
+        if self._rows_complete():
+            return iter(self._rows)
+        return (self[i] for i in range(len(self)))
+
+    def __reduce__(self):
+        # Seules les lignes voyagent (colonnes recalculées à l'arrivée)
+        return (PostBatch.from_posts, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"PostBatch({len(self)} posts, {self.platform_counts()})"
+
+    def _rows_complete(self) -> bool:
+        if 'complete' not in self._cache:
+            if None in self._rows:
+                return False
+            self._cache['complete'] = True
+        return True
+
+    def _build_row(self, index: int) -> SocialPost:
+        if self._row_factory is not None:
+            return self._row_factory(index)
+
+        columns = self.columns
+        sentiment = int(columns['sentiment'][index])
+        potential = int(columns['business_potential'][index])
+        score = float(columns['sentiment_score'][index])
+        engagement = float(columns['engagement_rate'][index])
+        return SocialPost(
+            id=str(columns['id'][index]),
+            platform=PLATFORMS[columns['platform'][index]],
+            content=str(columns['content'][index]),
+            author=str(columns['author'][index]),
+            author_followers=int(columns['author_followers'][index]),
+            created_at=from_microseconds(columns['created_at'][index]),
+            url=str(columns['url'][index]),
+            metrics={name: int(column[index]) for name, column in self.metrics.items()},
+            category=CATEGORIES[columns['category'][index]],
+            sentiment=SENTIMENTS[sentiment] if sentiment >= 0 else None,
+            sentiment_score=None if np.isnan(score) else score,
+            engagement_rate=None if np.isnan(engagement) else engagement,
+            business_potential=potential if potential >= 0 else None
+        )
+
+    def to_posts(self) -> List[SocialPost]:
+        return list(self)
+
+    # ------------------------------------------------------------------
+    # Colonnes
+    # ------------------------------------------------------------------
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # batch.platform, batch.created_at, ... (colonnes numériques)
+        if name in NUMERIC_COLUMNS:
+            return self.columns[name]
+        raise AttributeError(name)
+
+    def text(self, name: str) -> np.ndarray:
+        """Colonne texte (id, content, author, url)"""
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = _text_array(
+                (getattr(row, name) for row in self), len(self)
+            )
+        return column
+
+    def release_text(self, name: Optional[str] = None):
+        """
+        Oublie une colonne texte construite depuis les lignes (toutes si
+        name est None), ex: après remplacement des contenus par le pool
+        """
+        if not self._rows_complete():
+            return
+        for column in TEXT_COLUMNS if name is None else (name,):
+            self.columns.pop(column, None)
+
+    # ------------------------------------------------------------------
+    # Agrégats vectoriels
+    # ------------------------------------------------------------------
+
+    def _codes(self, column: str, labels: tuple) -> Dict[Any, int]:
+        counts = np.bincount(self.columns[column], minlength=len(labels))
+        return {labels[code]: int(count) for code, count in enumerate(counts.tolist()) if count}
+
+    def platform_counts(self) -> Dict[str, int]:
+        """{plateforme: posts} (mis en cache: colonnes figées)"""
+        counts = self._cache.get('platform_counts')
+        if counts is None:
+            counts = self._cache['platform_counts'] = {
+                platform.value: count for platform, count in self._codes('platform', PLATFORMS).items()
+            }
+        return counts
+
+    def category_counts(self) -> Dict[str, int]:
+        return {category.value: count for category, count in self._codes('category', CATEGORIES).items()}
+
+    def sentiment_counts(self) -> Dict[Optional[str], int]:
+        """{sentiment: posts}, clé None pour les posts non analysés"""
+        codes = self.columns['sentiment'].astype(np.int16) + 1
+        counts = np.bincount(codes, minlength=len(SENTIMENTS) + 1).tolist()
+        labels = (None,) + SENTIMENTS
+        return {labels[code]: count for code, count in enumerate(counts) if count}
+
+    def average_sentiment_score(self) -> float:
+        scores = self.columns['sentiment_score']
+        analyzed = scores[~np.isnan(scores)]
+        return float(analyzed.mean()) if len(analyzed) else 0.0
+
+    def dominant_category(self) -> Optional[BusinessCategory]:
+        """Catégorie la plus fréquente (égalité: première rencontrée)"""
+        if not len(self):
+            return None
+        codes = self.columns['category']
+        counts = np.bincount(codes, minlength=len(CATEGORIES))
+        candidates = np.flatnonzero(counts == counts.max())
+        if len(candidates) == 1:
+            return CATEGORIES[int(candidates[0])]
+        first_seen = [int(np.argmax(codes == code)) for code in candidates]
+        return CATEGORIES[int(candidates[int(np.argmin(first_seen))])]
+
+    def platforms(self) -> List[str]:
+        return [PLATFORMS[code].value for code in np.unique(self.columns['platform']).tolist()]
+
+    def split_platforms(self) -> Dict[str, 'PostBatch']:
+        """{plateforme: sous-batch de ses posts}"""
+        platform = self.columns['platform']
+        return {
+            PLATFORMS[code].value: self.take(platform == code)
+            for code in np.unique(platform).tolist()
+        }
+
+    def since(self, cutoff: datetime) -> 'PostBatch':
+        """Posts créés à partir de cutoff"""
+        return self.take(self.columns['created_at'] >= to_microseconds(cutoff))
+
+    def before(self, cutoff: datetime) -> 'PostBatch':
+        """Posts créés avant cutoff"""
+        return self.take(self.columns['created_at'] < to_microseconds(cutoff))
+
+    def newest(self) -> Optional[datetime]:
+        created = self.columns['created_at']
+        return from_microseconds(created.max()) if len(created) else None
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    import logging
+    import time
+    from collections import Counter
+
+    from src.data.collectors.reddit_collector import DynamicRedditCollector
+    from src.data.collectors.tiktok_collector import DynamicTikTokCollector
+
+    logging.basicConfig(level=logging.WARNING)
+
+    reddit, tiktok = DynamicRedditCollector(seed=1), DynamicTikTokCollector(seed=2)
+    posts = []
+    while len(posts) < 200_000:
+        posts += reddit.collect_business_data() + tiktok.collect_trending_content()
+
+    start = time.perf_counter()
+    batch = PostBatch.from_posts(posts)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = (Counter(p.platform.value for p in posts), Counter(p.category.value for p in posts))
+    loops = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = (batch.platform_counts(), batch.category_counts())
+    vectorized = time.perf_counter() - start
+
+    cutoff = datetime.now() - timedelta(minutes=10)
+    recent = batch.since(cutoff)
+    assert counts == (dict(expected[0]), dict(expected[1]))
+    assert list(recent) == [p for p in posts if p.created_at >= cutoff]
+
+    print(f"🧱 {len(batch):,} posts → colonnes en {build * 1000:.0f} ms")
+    print(f"🐢 Counter sur objets: {loops * 1000:.1f} ms")
+    print(f"⚡ bincount sur colonnes: {vectorized * 1000:.1f} ms ({loops / vectorized:.0f}×)")
+    print(f"🪟 Fenêtre 10 min: {len(recent):,} posts, {recent.platform_counts()}")
@@ -0,0 +1,96 @@
+"""
+SERIALIZATION - JSON DES POSTS ET TENDANCES
+============================================
+
+Responsabilités:
+1. Assembler les listes de posts (réponses API, événements WebSocket,
+   snapshots, exports NDJSON) en joignant le JSON déjà encodé de chaque
+   post (SocialPost.to_json): un post n'est encodé qu'une fois, quel
+   que soit le nombre de réponses qui le contiennent
+2. Encoder une liste de tendances en un seul appel de l'encodeur
+3. Composer un objet JSON à partir de valeurs et de fragments déjà
+   encodés (encode_object)
+
+Format: JSON compact UTF-8 (bytes), caractères non ASCII conservés.
+"""
+
+from typing import Any, Dict, Iterable
+
+from src.core.models.social_data import JSON_ENCODER, SocialPost, Trend
+
+
+class Encoded(bytes):
+    """Fragment JSON déjà encodé, inséré tel quel par encode_object"""
+    __slots__ = ()
+
+
+def encode_value(value: Any) -> bytes:
+    return JSON_ENCODER.encode(value).encode('utf-8')
+
+
+def encode_posts(posts: Iterable[SocialPost]) -> Encoded:
+    """Tableau JSON des posts (fragments mis en cache par post)"""
+    return Encoded(b'[' + b','.join([post.to_json() for post in posts]) + b']')
+
+
+def encode_posts_ndjson(posts: Iterable[SocialPost]) -> bytes:
+    """Une ligne JSON par post (exports, replay)"""
+    return b''.join([post.to_json() + b'\n' for post in posts])
+
+
+def encode_trends(trends: Iterable[Trend]) -> Encoded:
+    """Tableau JSON des tendances, encodé en une fois"""
+    return Encoded(encode_value([trend.to_dict() for trend in trends]))
+
+
+def encode_object(fields: Dict[str, Any]) -> bytes:
+    """
+    Objet JSON dont les valeurs Encoded sont insérées sans réencodage
+
+    Exemple:
+        encode_object({'posts': encode_posts(posts), 'count': len(posts)})
+    """
+    parts = [
+        encode_value(key) + b':' + (value if isinstance(value, Encoded) else encode_value(value))
+        for key, value in fields.items()
+    ]
+    return b'{' + b','.join(parts) + b'}'
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    import json
+    import logging
+    import time
+
+    from src.analytics.sentiment.analyzer import SentimentAnalyzer
+    from src.data.collectors.twitter_collector import DynamicTwitterCollector
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('src.analytics.sentiment.analyzer').setLevel(logging.WARNING)
+
+    collector = DynamicTwitterCollector(seed=1)
+    posts = SentimentAnalyzer().analyze_batch(collector.collect_business_trends() * 3)[:100]
+    assert json.loads(encode_posts(posts)) == [post.to_dict() for post in posts]
+
+    # 100 posts récents servis 1000 fois (API + WebSocket + exports)
+    requests = 1000
+    start = time.perf_counter()
+    for _ in range(requests):
+        json.dumps([post.to_dict() for post in posts])
+    per_request = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        encode_posts(posts)
+    cached = time.perf_counter() - start
+
+    payload = encode_object({'posts': encode_posts(posts[-10:]), 'count': len(posts)})
+    assert json.loads(payload)['count'] == len(posts)
+
+    print(f"🐢 to_dict + json.dumps à chaque requête: {per_request / requests * 1e3:.2f} ms/requête")
+    print(f"⚡ fragments en cache joints: {cached / requests * 1e3:.3f} ms/requête "
+          f"({per_request / cached:.0f}×)")
@@ -5,12 +5,66 @@ CORE DATA MODELS
 Définit les structures de données du système
 """
 
+import json
+import sys
+from array import array
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Sequence, Tuple
 from enum import Enum
 
 
+def _parse_datetime(value: Any) -> datetime:
+    """
+    Date ISO 8601 ou timestamp epoch → datetime naïf (heure locale)
+    
+    Les dates du système sont naïves (datetime.now()): les dates avec
+    fuseau sont converties en heure locale pour rester comparables.
+    
+    Raises:
+        ValueError: date illisible ou hors de la plage des datetime
+    """
+    if value is None or value == '':
+        return datetime.now()
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, (int, float)):
+        try:
+            return datetime.fromtimestamp(value)
+        except (OverflowError, OSError, ValueError):
+            raise ValueError(f"Timestamp hors limites: {value!r}") from None
+    else:
+        text = str(value)
+        if text.endswith('Z'):
+            text = text[:-1] + '+00:00'
+        try:
+            parsed = datetime.fromisoformat(text)
+        except ValueError:
+            raise ValueError(f"Date invalide: {value!r}") from None
+    
+    if parsed.tzinfo is not None:
+        try:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        except (OverflowError, OSError):
+            raise ValueError(f"Date hors limites: {value!r}") from None
+    return parsed
+
+
+def _parse_int(value: Any, name: str) -> int:
+    """
+    Entier d'un champ externe
+    
+    Raises:
+        ValueError: valeur non numérique, NaN ou infinie (Infinity est
+                    accepté par json.loads)
+    """
+    try:
+        return int(value)
+    except (OverflowError, TypeError, ValueError):
+        raise ValueError(f"{name}: entier attendu, reçu {value!r}") from None
+
+
 class Platform(Enum):
     """Plateformes sociales supportées"""
     REDDIT = "reddit"
@@ -28,11 +82,86 @@ class BusinessCategory(Enum):
     ENTERTAINMENT = "entertainment"
 
 
-@dataclass
+# Tuples de clés partagés (1 par forme de métriques / metadata)
+_SHARED_KEYS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+_SHARED_KEYS_MAX = 1024  # au-delà (clés externes arbitraires): tuple non partagé
+_NO_METRICS = array('I')
+
+# JSON compact UTF-8 (réponses API, événements WebSocket, exports)
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _shared_keys(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    shared = _SHARED_KEYS.get(keys)
+    if shared is None:
+        shared = tuple(sys.intern(key) if type(key) is str else key for key in keys)
+        if len(_SHARED_KEYS) < _SHARED_KEYS_MAX:
+            _SHARED_KEYS[shared] = shared
+    return shared
+
+
+def _metric_array(values: Tuple[Any, ...]) -> Sequence[Any]:
+    """
+    Stockage compact des valeurs de métriques, sans perte
+
+    Compteurs: array('I') (4 octets suffisent presque toujours), puis
+    array('q'); valeurs non entières (0.75) ou hors de 64 bits: tuple
+    conservé tel quel (ni troncature ni OverflowError).
+    """
+    for typecode in ('I', 'q'):
+        try:
+            return array(typecode, values)
+        except (OverflowError, TypeError):
+            continue
+    return values
+
+
+class PostMetrics(Mapping):
+    """
+    Vue en lecture seule des métriques d'un post (post.metrics)
+    
+    Se lit comme un dict (metrics['likes'], metrics.get('views', 0), ...);
+    pour modifier, réaffecter post.metrics = {...}.
+    """
+    
+    __slots__ = ('_keys', '_values')
+    
+    def __init__(self, keys: Tuple[str, ...], values: Sequence[Any]):
+        self._keys = keys
+        self._values = values
+    
+    def __getitem__(self, key: str) -> int:
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class SocialPost:
     """
     Représentation d'un post social media
     
+    Représentation compacte (historique de 7 jours en mémoire):
+    - __slots__: pas de __dict__ par instance
+    - métriques: entiers dans un array + tuple de clés partagé entre
+      les posts de même forme (post.metrics: vue PostMetrics)
+    - metadata: tuple de valeurs + tuple de clés partagé; le dict n'est
+      créé qu'au premier accès à post.metadata (get_metadata() lit
+      sans le créer)
+    - auteur interné (une chaîne par auteur), plateforme et catégorie
+      toujours des membres d'Enum
+    - JSON encodé une seule fois (to_json): les mêmes posts récents sont
+      servis par l'API, les événements WebSocket et les exports
+    
     Attributes:
         id: Identifiant unique
         platform: Plateforme source
@@ -52,23 +181,111 @@ class SocialPost:
         business_potential: Score potentiel [0-10]
     """
     
-    # Données de base
-    id: str
-    platform: Platform
-    content: str
-    author: str
-    author_followers: int
-    created_at: datetime
-    url: str
-    metrics: Dict[str, int]
-    category: BusinessCategory
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Champs dans l'ordre du constructeur
+    FIELDS = (
+        'id', 'platform', 'content', 'author', 'author_followers', 'created_at', 'url',
+        'metrics', 'category', 'metadata',
+        'sentiment', 'sentiment_score', 'engagement_rate', 'business_potential'
+    )
+    
+    __slots__ = (
+        'id', 'platform', 'content', '_author', 'author_followers', 'created_at', 'url',
+        '_metric_keys', '_metric_values', 'category', '_metadata_keys', '_metadata',
+        'sentiment', 'sentiment_score', 'engagement_rate', 'business_potential',
+        '_json'
+    )
+    
+    # Dataclass à l'origine: pas de hachage (égalité par valeur)
+    __hash__ = None
     
-    # Données enrichies (après analyse)
-    sentiment: Optional[str] = None
-    sentiment_score: Optional[float] = None
-    engagement_rate: Optional[float] = None
-    business_potential: Optional[int] = None
+    def __init__(self, id: str, platform: Platform, content: str, author: str,
+                 author_followers: int, created_at: datetime, url: str,
+                 metrics: Mapping[str, int], category: BusinessCategory,
+                 metadata: Optional[Dict[str, Any]] = None,
+                 sentiment: Optional[str] = None,
+                 sentiment_score: Optional[float] = None,
+                 engagement_rate: Optional[float] = None,
+                 business_potential: Optional[int] = None):
+        # Données de base
+        self.id = id
+        self.platform = platform if isinstance(platform, Platform) else Platform(platform)
+        self.content = content
+        self.author = author
+        self.author_followers = author_followers
+        self.created_at = created_at
+        self.url = url
+        self.metrics = metrics
+        self.category = category if isinstance(category, BusinessCategory) else BusinessCategory(category)
+        self.metadata = metadata
+        
+        # Données enrichies (après analyse)
+        self.sentiment = sentiment
+        self.sentiment_score = sentiment_score
+        self.engagement_rate = engagement_rate
+        self.business_potential = business_potential
+        
+        # (champs simples, JSON) - voir to_json
+        self._json = None
+    
+    @property
+    def author(self) -> str:
+        return self._author
+    
+    @author.setter
+    def author(self, value: str):
+        self._author = sys.intern(value) if type(value) is str else value
+        self._json = None
+    
+    @property
+    def metrics(self) -> PostMetrics:
+        return PostMetrics(self._metric_keys, self._metric_values)
+    
+    @metrics.setter
+    def metrics(self, value: Mapping[str, int]):
+        if value:
+            self._metric_keys = _shared_keys(tuple(value))
+            self._metric_values = _metric_array(tuple(value.values()))
+        else:
+            self._metric_keys = ()
+            self._metric_values = _NO_METRICS
+        self._json = None
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Dict modifiable (créé au premier accès)"""
+        metadata = self._metadata
+        if type(metadata) is not dict:
+            metadata = self._metadata = dict(zip(self._metadata_keys, metadata)) if metadata else {}
+            self._metadata_keys = None
+        return metadata
+    
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]):
+        if value:
+            self._metadata_keys = _shared_keys(tuple(value))
+            self._metadata = tuple(value.values())
+        else:
+            self._metadata_keys = None
+            self._metadata = None
+        self._json = None
+    
+    def get_metadata(self, key: str, default: Any = None) -> Any:
+        """metadata.get(key, default) sans créer le dict"""
+        metadata = self._metadata
+        if metadata is None:
+            return default
+        if type(metadata) is dict:
+            return metadata.get(key, default)
+        try:
+            return metadata[self._metadata_keys.index(key)]
+        except ValueError:
+            return default
+    
+    def _metadata_dict(self) -> Dict[str, Any]:
+        metadata = self._metadata
+        if type(metadata) is dict:
+            return metadata
+        return dict(zip(self._metadata_keys, metadata)) if metadata else {}
     
     def to_dict(self) -> Dict[str, Any]:
         """Conversion en dictionnaire pour JSON"""
@@ -76,30 +293,125 @@ class SocialPost:
             'id': self.id,
             'platform': self.platform.value,
             'content': self.content,
-            'author': self.author,
+            'author': self._author,
             'author_followers': self.author_followers,
             'created_at': self.created_at.isoformat() if isinstance(self.created_at, datetime) else str(self.created_at),
             'url': self.url,
-            'metrics': self.metrics,
+            'metrics': dict(zip(self._metric_keys, self._metric_values)),
             'category': self.category.value,
-            'metadata': self.metadata,
+            'metadata': self._metadata_dict(),
             'sentiment': self.sentiment,
             'sentiment_score': self.sentiment_score,
             'engagement_rate': self.engagement_rate,
             'business_potential': self.business_potential
         }
     
+    def to_json(self) -> bytes:
+        """
+        to_dict() encodé en JSON (UTF-8), calculé une fois puis mis en cache
+        
+        Le cache est recalculé si un champ simple change (id, contenu,
+        date, url..., champs enrichis par l'analyse: comparés au moment
+        de l'encodage) ou si auteur, métriques ou metadata sont
+        réaffectés (setters). Un dict metadata modifié en place doit être
+        réaffecté (post.metadata = ...) pour être pris en compte.
+        """
+        stamp = (
+            self.id, self.platform, self.content, self.author_followers, self.created_at,
+            self.url, self.category,
+            self.sentiment, self.sentiment_score, self.engagement_rate, self.business_potential
+        )
+        cached = self._json
+        if cached is None or cached[0] != stamp:
+            cached = self._json = (stamp, JSON_ENCODER.encode(self.to_dict()).encode('utf-8'))
+        return cached[1]
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SocialPost':
+        """
+        Construction depuis un dictionnaire (inverse de to_dict)
+        
+        Champs obligatoires: id, platform, content, category.
+        
+        Raises:
+            ValueError: champ manquant ou valeur invalide
+        """
+        missing = [key for key in ('id', 'platform', 'content', 'category') if data.get(key) in (None, '')]
+        if missing:
+            raise ValueError(f"Champs obligatoires manquants: {', '.join(missing)}")
+        
+        try:
+            platform = Platform(data['platform'])
+            category = BusinessCategory(data['category'])
+        except ValueError as e:
+            raise ValueError(f"Valeur invalide: {e}") from None
+        
+        metrics = data.get('metrics') or {}
+        if not isinstance(metrics, dict):
+            raise ValueError("metrics doit être un objet")
+        
+        return cls(
+            id=str(data['id']),
+            platform=platform,
+            content=str(data['content']),
+            author=str(data.get('author') or ''),
+            author_followers=_parse_int(data.get('author_followers') or 0, 'author_followers'),
+            created_at=_parse_datetime(data.get('created_at')),
+            url=str(data.get('url') or ''),
+            metrics={str(k): _parse_int(v, f"metrics.{k}") for k, v in metrics.items()},
+            category=category,
+            metadata=_intern_metadata(data.get('metadata')),
+            sentiment=data.get('sentiment'),
+            sentiment_score=data.get('sentiment_score'),
+            engagement_rate=data.get('engagement_rate'),
+            business_potential=data.get('business_potential')
+        )
+    
+    def _values(self) -> Tuple[Any, ...]:
+        return (
+            self.id, self.platform, self.content, self._author, self.author_followers,
+            self.created_at, self.url, dict(zip(self._metric_keys, self._metric_values)),
+            self.category, self._metadata_dict(),
+            self.sentiment, self.sentiment_score, self.engagement_rate, self.business_potential
+        )
+    
+    def replace(self, **changes) -> 'SocialPost':
+        """Copie avec des champs modifiés (équivalent de dataclasses.replace)"""
+        values = dict(zip(self.FIELDS, self._values()))
+        values.update(changes)
+        return SocialPost(**values)
+    
+    def __reduce__(self):
+        # Reconstruit via __init__: clés et auteurs internés dans le
+        # processus qui reçoit le post (pipes de collecte)
+        return (SocialPost, self._values())
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+    
     def __repr__(self) -> str:
         return (
             f"SocialPost(id='{self.id}', platform={self.platform.value}, "
-            f"author='{self.author}', sentiment='{self.sentiment}')"
+            f"author='{self._author}', sentiment='{self.sentiment}')"
         )
 
 
-@dataclass
+def _intern_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Metadata désérialisée: valeurs courtes internées (partagées entre posts)"""
+    if not metadata:
+        return None
+    return {
+        str(key): sys.intern(value) if type(value) is str and len(value) <= 64 else value
+        for key, value in metadata.items()
+    }
+
+
+@dataclass(slots=True)
 class Trend:
     """
-    Représentation d'une tendance détectée
+    Représentation d'une tendance détectée (__slots__)
     
     Attributes:
         name: Nom de la tendance
@@ -138,4 +450,57 @@ class Trend:
             'confidence': self.confidence,
             'market_opportunity': self.market_opportunity,
             'detected_at': self.detected_at.isoformat()
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Trend':
+        """Construction depuis un dictionnaire (inverse de to_dict)"""
+        return cls(
+            name=data['name'],
+            volume=int(data['volume']),
+            growth_24h=float(data['growth_24h']),
+            sentiment_distribution=dict(data.get('sentiment_distribution') or {}),
+            key_phrases=list(data.get('key_phrases') or []),
+            platforms=list(data.get('platforms') or []),
+            category=BusinessCategory(data['category']),
+            confidence=float(data['confidence']),
+            market_opportunity=int(data['market_opportunity']),
+            detected_at=_parse_datetime(data.get('detected_at'))
+        )
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    import gc
+    import tracemalloc
+    from datetime import timedelta
+    
+    # Posts de même forme que ceux des collecteurs (contenus partagés)
+    count = 100_000
+    start = datetime.now()
+    rows = [
+        (f"reddit_1_{i}", f"https://reddit.com/r/technology/{i}", f"u/redditor_{i % 5000}")
+        for i in range(count)
+    ]
+    
+    gc.collect()
+    tracemalloc.start()
+    posts = [
+        SocialPost(
+            id=post_id, platform=Platform.REDDIT, content="New AI chip announced",
+            author=author, author_followers=12000, created_at=start - timedelta(seconds=i),
+            url=url, metrics={'upvotes': 1200 + i, 'comments': 45, 'awards': 2},
+            category=BusinessCategory.TECHNOLOGY,
+            metadata={'subreddit': 'r/technology', 'iteration': 1, 'event': 'normal'}
+        )
+        for i, (post_id, url, author) in enumerate(rows)
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"🧱 {count:,} SocialPost: {size / count:.0f} octets/post (hors id et url)")
+    print(f"✅ to_dict/from_dict: {SocialPost.from_dict(posts[0].to_dict()) == posts[0]}")
+    print(f"📦 {posts[0]!r} metrics={posts[0].metrics} event={posts[0].get_metadata('event')}")
@@ -0,0 +1,182 @@
+"""
+STARTUP PROFILER - COÛT DU DÉMARRAGE À FROID
+=============================================
+
+Responsabilités:
+1. Mesurer le temps d'import de chaque module (hook sys.meta_path)
+2. Distinguer temps cumulé (avec sous-imports) et temps propre
+3. Jalonner les phases du démarrage (app importée, serveur prêt, ...)
+4. Produire un rapport (top modules + phases) pour /api/startup
+
+Usage:
+    from src.core.monitoring.startup_profiler import startup_profiler
+    startup_profiler.install()        # avant les imports lourds
+    ...
+    startup_profiler.mark('app_imported')
+    startup_profiler.uninstall()      # fin du démarrage
+"""
+
+import importlib.abc
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Enveloppe un loader pour chronométrer exec_module"""
+
+    def __init__(self, loader, profiler: 'StartupProfiler', name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+    def __getattr__(self, attribute):
+        # get_resource_reader, get_source, is_package, ...
+        return getattr(self._loader, attribute)
+
+
+class StartupProfiler(importlib.abc.MetaPathFinder):
+    """
+    Profileur d'imports et de phases de démarrage
+
+    Placé en tête de sys.meta_path: délègue la recherche aux autres
+    finders et chronomètre l'exécution des modules trouvés.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.installed = False
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self.phases: List[Dict[str, Any]] = []
+
+        self._local = threading.local()
+
+    # ============================================
+    # HOOK D'IMPORT
+    # ============================================
+
+    def install(self):
+        """Active le chronométrage des imports suivants"""
+        if not self.installed:
+            sys.meta_path.insert(0, self)
+            self.installed = True
+
+    def uninstall(self):
+        """Désactive le hook (les mesures restent disponibles)"""
+        if self.installed:
+            sys.meta_path.remove(self)
+            self.installed = False
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self, fullname)
+            return spec
+        return None
+
+    def _stack(self) -> List[list]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _enter(self, name: str):
+        # [nom, début, temps des sous-imports]
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name: str):
+        stack = self._stack()
+        _, start, children = stack.pop()
+        cumulative = time.perf_counter() - start
+
+        if stack:
+            stack[-1][2] += cumulative
+
+        self.imports[name] = {
+            'cumulative': cumulative,
+            'self': cumulative - children
+        }
+
+    # ============================================
+    # PHASES
+    # ============================================
+
+    def mark(self, phase: str) -> float:
+        """Jalonne une phase (secondes depuis la création du profileur)"""
+        elapsed = time.perf_counter() - self.origin
+        self.phases.append({'phase': phase, 'at': round(elapsed, 3)})
+        return elapsed
+
+    # ============================================
+    # RAPPORT
+    # ============================================
+
+    def report(self, top: Optional[int] = 20) -> Dict[str, Any]:
+        """Phases + modules les plus coûteux (temps cumulé, en ms)"""
+        ranked = sorted(self.imports.items(), key=lambda item: item[1]['cumulative'], reverse=True)
+        if top is not None:
+            ranked = ranked[:top]
+
+        # Temps total = somme des temps propres (sans double comptage)
+        total = sum(timing['self'] for timing in self.imports.values())
+
+        return {
+            'installed': self.installed,
+            'phases': self.phases,
+            'modules_imported': len(self.imports),
+            'total_import_ms': round(total * 1000, 1),
+            'slowest_imports': [
+                {
+                    'module': name,
+                    'cumulative_ms': round(timing['cumulative'] * 1000, 1),
+                    'self_ms': round(timing['self'] * 1000, 1)
+                }
+                for name, timing in ranked
+            ]
+        }
+
+    def format_report(self, top: int = 20) -> str:
+        """Rapport texte (console)"""
+        report = self.report(top)
+        lines = [f"⏱️  Démarrage: {report['modules_imported']} modules, "
+                 f"{report['total_import_ms']:.0f} ms d'imports"]
+        for phase in report['phases']:
+            lines.append(f"   {phase['at']:>7.3f}s  {phase['phase']}")
+        lines.append(f"   {'cumul ms':>9} {'propre ms':>9}  module")
+        for entry in report['slowest_imports']:
+            lines.append(f"   {entry['cumulative_ms']:>9.1f} {entry['self_ms']:>9.1f}  {entry['module']}")
+        return '\n'.join(lines)
+
+
+# Instance partagée (main.py l'installe avant les imports lourds)
+startup_profiler = StartupProfiler()
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    startup_profiler.install()
+
+    import decimal
+    import email.mime.multipart
+    startup_profiler.mark('imports_done')
+
+    startup_profiler.uninstall()
+    print(startup_profiler.format_report(top=10))
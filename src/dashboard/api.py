@@ -0,0 +1,210 @@
+"""
+API WORKERS - SERVICE MULTI-PROCESSUS EN LECTURE SEULE
+=======================================================
+
+Déploiement: 1 processus pipeline (collecte, analyse, WebSocket,
+contrôle) + N processus API qui servent les routes de lecture.
+
+Responsabilités:
+1. Exporter le snapshot publié vers l'état partagé (processus pipeline)
+2. Créer l'application Flask de lecture (create_api_app) alimentée par
+   un SharedStateReader, sans dépendance au pipeline
+3. Lancer N processus sur une socket d'écoute unique, liée par le
+   parent et partagée (le noyau répartit les connexions)
+
+Le débit de lecture évolue avec le nombre de coeurs, indépendamment
+de l'analyse (chaque worker a son propre GIL).
+"""
+
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from flask import Flask, Response, jsonify, request
+
+from src.core.models.serialization import encode_object
+from src.pipeline.shared_state import SharedStateReader, wait_for_shared_state
+
+
+# ============================================
+# EXPORT (PROCESSUS PIPELINE)
+# ============================================
+
+def export_state(pipeline) -> bytes:
+    """
+    État publié vers les workers API (JSON encodé)
+
+    Reprend les vues des routes de lecture du dashboard, calculées
+    depuis un seul snapshot (cohérentes entre elles). Posts et
+    tendances sont insérés depuis leur JSON déjà encodé.
+    """
+    snapshot = pipeline.current
+    return encode_object({
+        'version': snapshot.version,
+        'published_at': datetime.now().isoformat(),
+        'is_running': pipeline.state.is_running,
+        'readiness': pipeline.readiness,
+        'stats': {
+            'version': snapshot.version,
+            'system': snapshot.performance_metrics,
+            'sentiment': snapshot.sentiment_stats,
+            'trends_count': len(snapshot.trends),
+            'is_running': pipeline.state.is_running
+        },
+        'trends': snapshot.trends_encoded,
+        'recent_posts': snapshot.recent_posts_encoded(100)
+    })
+
+
+# ============================================
+# APPLICATION DE LECTURE (PROCESSUS WORKER)
+# ============================================
+
+def create_api_app(reader: SharedStateReader) -> Flask:
+    """
+    Application Flask des routes de lecture
+
+    Les réponses JSON sont encodées une fois par version publiée puis
+    servies telles quelles.
+    """
+    app = Flask(__name__)
+    # (séquence, réponses encodées): remplacé en bloc à chaque version
+    cache = [(-1, {})]
+
+    def cached(key, build) -> Response:
+        sequence, state = reader.read()
+        current = cache[0]
+        if current[0] != sequence:
+            current = (sequence, {})
+            cache[0] = current
+
+        responses = current[1]
+        if key not in responses:
+            responses[key] = app.json.dumps(build(state)).encode('utf-8')
+        return Response(responses[key], mimetype='application/json')
+
+    @app.route('/api/health')
+    def health():
+        """Health check du worker"""
+        _, state = reader.read()
+        return jsonify({
+            'status': 'healthy',
+            'readiness': state.get('readiness', 'starting'),
+            'ready': state.get('readiness') == 'ready',
+            'timestamp': datetime.now().isoformat(),
+            'is_running': state.get('is_running', False),
+            'worker_pid': os.getpid(),
+            'state_version': state.get('version', 0),
+            'state_published_at': state.get('published_at'),
+            'shared_state': reader.get_statistics()
+        })
+
+    @app.route('/api/stats')
+    def stats():
+        """Statistiques système"""
+        return cached('stats', lambda state: state.get('stats', {}))
+
+    @app.route('/api/trends')
+    def get_trends():
+        """Tendances actuelles"""
+        return cached('trends', lambda state: state.get('trends', []))
+
+    @app.route('/api/posts/recent')
+    def recent_posts():
+        """Posts récents"""
+        limit = min(int(request.args.get('limit', 20)), 100)
+        return cached(
+            ('recent_posts', limit),
+            lambda state: state.get('recent_posts', [])[-limit:] if limit > 0 else []
+        )
+
+    return app
+
+
+def _run_api_worker(listener: socket.socket, host: str, port: int, state_path: str):
+    """Point d'entrée d'un processus worker API"""
+    from werkzeug.serving import make_server
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger = logging.getLogger(__name__)
+
+    reader = wait_for_shared_state(state_path)
+    if reader is None:
+        logger.error(f"❌ Worker API {os.getpid()}: état partagé introuvable ({state_path})")
+        return
+
+    # Socket d'écoute héritée du parent: pas de bind dans le worker
+    server = make_server(host, port, create_api_app(reader), threaded=True, fd=listener.fileno())
+    logger.info(f"🧩 Worker API {os.getpid()} prêt")
+    server.serve_forever()
+
+
+# ============================================
+# POOL DE WORKERS (PROCESSUS PIPELINE)
+# ============================================
+
+class APIWorkerPool:
+    """
+    N processus API partageant une socket d'écoute
+
+    La socket est liée une seule fois par le parent puis transmise à
+    chaque worker (multiprocessing la duplique: compatible spawn).
+    """
+
+    def __init__(self, state_path: str, host: str = '0.0.0.0', port: int = 5001,
+                 workers: int = 4):
+        self.logger = logging.getLogger(__name__)
+        self.state_path = state_path
+        self.host = host
+        self.port = port
+        self.workers = max(1, workers)
+
+        self.listener: Optional[socket.socket] = None
+        self.processes: List[multiprocessing.Process] = []
+        # spawn: le processus parent a déjà des threads (fork déconseillé)
+        self.context = multiprocessing.get_context('spawn')
+        self.started_at = None
+
+    def start(self):
+        self.listener = socket.create_server((self.host, self.port), backlog=512)
+        self.started_at = time.time()
+
+        for index in range(self.workers):
+            process = self.context.Process(
+                target=_run_api_worker,
+                args=(self.listener, self.host, self.port, self.state_path),
+                name=f"api-worker-{index}",
+                daemon=True
+            )
+            process.start()
+            self.processes.append(process)
+
+        self.logger.info(
+            f"🧩 {self.workers} workers API sur http://{self.host}:{self.port} "
+            f"(état partagé: {self.state_path})"
+        )
+
+    def stop(self, timeout: float = 5.0):
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join(timeout=timeout)
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+        self.processes = []
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'address': f"{self.host}:{self.port}",
+            'workers': self.workers,
+            'alive': sum(1 for process in self.processes if process.is_alive()),
+            'uptime': round(time.time() - self.started_at, 1) if self.started_at else 0
+        }
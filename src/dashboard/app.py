@@ -5,22 +5,27 @@ DASHBOARD FLASK + WEBSOCKET
 Application web temps réel avec:
 - Flask (serveur web)
 - SocketIO (WebSocket)
-- Threading (boucle analyse)
+- Pipeline (src/pipeline): le dashboard s'abonne aux cycles publiés
+  et lit uniquement le snapshot immuable du dernier cycle (pipeline.current)
+- Démarrage rapide: composants (NLP, collecteurs) chargés en fond,
+  /api/health expose l'état de préparation
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 from flask_socketio import SocketIO
 import logging
 import threading
-import time
-from datetime import datetime, timedelta
-from collections import Counter
-
-# Imports locaux
-from src.data.collectors.master_collector import MasterCollector
-from src.analytics.sentiment.analyzer import SentimentAnalyzer
-from src.analytics.trends.detector import TrendDetector
+from datetime import datetime
+
+# Imports locaux (légers: les moteurs NLP sont importés par warm_up)
+from src.data.collectors.ndjson_reader import iter_post_batches
 from src.core.config.settings import config
+from src.core.models.serialization import encode_object, encode_posts
+from src.core.monitoring.startup_profiler import startup_profiler
+from src.dashboard.broadcaster import SocketBroadcaster
+from src.pipeline.pipeline import Pipeline
+from src.pipeline.snapshot import SnapshotStore
+from src.dashboard.api import export_state
 
 
 # Configuration Flask
@@ -29,10 +34,14 @@ app.config['SECRET_KEY'] = config.secret_key
 
 socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
 
-# Initialisation composants
-master_collector = MasterCollector()
-sentiment_analyzer = SentimentAnalyzer(max_workers=4)
-trend_detector = TrendDetector()
+# Diffusion WebSocket découplée du thread de traitement
+broadcaster = SocketBroadcaster(
+    socketio,
+    max_queue_size=config.broadcast.client_queue_size,
+    min_emit_interval=config.broadcast.min_emit_interval,
+    ack_timeout=config.broadcast.ack_timeout
+)
+broadcaster.start()
 
 # Configuration logging
 logging.basicConfig(
@@ -41,33 +50,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Initialisation pipeline (le dashboard est un simple abonné)
+# L'état du dernier snapshot est restauré pendant le warm-up
+pipeline = Pipeline(
+    update_interval=config.analysis.update_interval,
+    snapshot_store=SnapshotStore(config.snapshot.path, max_posts=config.snapshot.max_posts)
+)
 
-# ============================================
-# ÉTAT SYSTÈME
-# ============================================
 
-class SystemState:
-    """État global du système"""
-    
-    def __init__(self):
-        self.is_running = False
-        self.processed_posts = []
-        self.all_posts_history = []
-        self.current_trends = []
-        self.sentiment_stats = {}
-        self.start_time = None
-        self.last_update = None
-        
-        self.performance_metrics = {
-            'posts_processed': 0,
-            'processing_speed': 0,
-            'last_processing_time': 0,
-            'total_iterations': 0,
-            'system_uptime': 0,
-            'platform_stats': {}
-        }
+# État partagé avec les workers API (mode multiprocess, voir main.py)
+shared_state_writer = None
+
 
-system_state = SystemState()
+def publish_shared_state():
+    """Publie le snapshot courant vers les workers API"""
+    if shared_state_writer is not None:
+        shared_state_writer.publish(export_state(pipeline))
+
+
+def enable_shared_state(writer):
+    """Active la publication: à chaque cycle + changements d'état"""
+    global shared_state_writer
+    shared_state_writer = writer
+    pipeline.subscribe(lambda cycle: publish_shared_state())
+    publish_shared_state()
+
+
+def warm_up_pipeline():
+    """Crée les composants en fond: le serveur répond pendant ce temps"""
+    pipeline.warm_up()
+    publish_shared_state()
+    startup_profiler.mark(f"pipeline_{pipeline.readiness}")
+    startup_profiler.uninstall()
+    logger.info(startup_profiler.format_report(top=10))
+
+
+def start_warm_up() -> threading.Thread:
+    """À appeler juste avant socketio.run()"""
+    startup_profiler.mark('server_starting')
+    thread = threading.Thread(target=warm_up_pipeline, name="warm-up", daemon=True)
+    thread.start()
+    return thread
 
 
 # ============================================
@@ -81,201 +104,175 @@ def dashboard():
 
 @app.route('/api/health')
 def health():
-    """Health check"""
+    """Health check + état de préparation (starting/warming/ready/failed)"""
     return jsonify({
-        'status': 'healthy',
+        'status': 'healthy' if pipeline.readiness != 'failed' else 'unhealthy',
+        'readiness': pipeline.readiness,
+        'ready': pipeline.readiness == 'ready',
+        'warm_up_time': pipeline.warm_up_time,
+        'error': pipeline.warm_up_error,
         'timestamp': datetime.now().isoformat(),
-        'is_running': system_state.is_running
+        'is_running': pipeline.state.is_running
     })
 
+@app.route('/api/startup')
+def startup_profile():
+    """Profil de démarrage: phases + imports les plus coûteux"""
+    top = min(int(request.args.get('top', 20)), 200)
+    return jsonify(startup_profiler.report(top))
+
 @app.route('/api/stats')
 def stats():
     """Statistiques système"""
+    snapshot = pipeline.current
     return jsonify({
-        'system': system_state.performance_metrics,
-        'sentiment': system_state.sentiment_stats,
-        'trends_count': len(system_state.current_trends),
-        'is_running': system_state.is_running
+        'version': snapshot.version,
+        'system': snapshot.performance_metrics,
+        'sentiment': snapshot.sentiment_stats,
+        'trends_count': len(snapshot.trends),
+        'is_running': pipeline.state.is_running,
+        'broadcast': broadcaster.get_statistics(),
+        'shared_state': shared_state_writer.get_statistics() if shared_state_writer is not None else None
     })
 
 @app.route('/api/trends')
 def get_trends():
-    """Tendances actuelles"""
-    return jsonify([t.to_dict() for t in system_state.current_trends])
+    """Tendances actuelles (JSON calculé une fois par snapshot)"""
+    return Response(pipeline.current.trends_encoded, mimetype='application/json')
 
 @app.route('/api/posts/recent')
 def recent_posts():
-    """Posts récents"""
+    """Posts récents (JSON de chaque post encodé une fois)"""
     limit = min(int(request.args.get('limit', 20)), 100)
-    recent = system_state.processed_posts[-limit:]
-    return jsonify([p.to_dict() for p in recent])
+    return Response(pipeline.current.recent_posts_encoded(limit), mimetype='application/json')
 
 @app.route('/api/control/start', methods=['POST'])
 def start_system():
-    """Démarre le système"""
-    if not system_state.is_running:
-        system_state.is_running = True
-        system_state.start_time = datetime.now()
-        
-        # Lancer thread traitement
-        thread = threading.Thread(target=processing_loop, daemon=True)
-        thread.start()
-        
-        logger.info("🚀 SYSTÈME DÉMARRÉ")
-        return jsonify({'status': 'started', 'message': 'Système démarré'})
+    """Démarre le système (une seule boucle active garantie)"""
+    status = pipeline.start()
+    
+    if status == 'already_running':
+        return jsonify({'status': 'already_running'})
+    if status == 'stopping':
+        return jsonify({
+            'status': 'stopping',
+            'message': 'Arrêt précédent en cours, réessayer'
+        }), 409
     
-    return jsonify({'status': 'already_running'})
+    publish_shared_state()
+    logger.info("🚀 SYSTÈME DÉMARRÉ")
+    return jsonify({'status': 'started', 'message': 'Système démarré'})
 
 @app.route('/api/control/stop', methods=['POST'])
 def stop_system():
-    """Arrête le système"""
-    system_state.is_running = False
+    """Arrête le système (immédiat: réveille les attentes en cours)"""
+    pipeline.stop()
+    publish_shared_state()
     logger.info("⏹️ SYSTÈME ARRÊTÉ")
     return jsonify({'status': 'stopped', 'message': 'Système arrêté'})
 
 
-# ============================================
-# BOUCLE DE TRAITEMENT (THREAD)
-# ============================================
-
-def processing_loop():
+@app.route('/api/ingest', methods=['POST'])
+def ingest_posts():
     """
-    Boucle principale - Thread séparé
+    Ingestion NDJSON (1 post JSON par ligne) depuis des crawlers externes
     
-    1. Collecte (Multiprocessing)
-    2. Analyse (Multithreading)
-    3. Détection tendances
-    4. Mise à jour état
-    5. Émission WebSocket
+    Le corps est lu en flux et découpé en batches injectés dans l'étape
+    d'analyse. Si sa file est pleine: 429 + Retry-After, avec la ligne
+    à partir de laquelle renvoyer le reste du fichier.
     """
-    iteration = 0
+    if not pipeline.state.is_running:
+        return jsonify({'status': 'unavailable', 'message': 'Système arrêté'}), 503
+    
+    errors = []
+    accepted = 0
     
-    while system_state.is_running:
-        try:
-            iteration += 1
-            start_time = time.time()
-            
-            logger.info(f"\n{'='*70}")
-            logger.info(f"🔄 ITÉRATION #{iteration}")
-            logger.info(f"{'='*70}")
-            
-            # 1. COLLECTE (Multiprocessing - 4 processus)
-            logger.info("📡 Phase 1: Collecte multi-plateformes...")
-            collected_posts = master_collector.collect_all_platforms_parallel()
-            
-            # 2. ANALYSE SENTIMENT (Multithreading - 4 threads)
-            logger.info("🧠 Phase 2: Analyse sentiments...")
-            analyzed_posts = sentiment_analyzer.analyze_batch(collected_posts)
-            
-            # 3. DÉTECTION TENDANCES
-            logger.info("🔍 Phase 3: Détection tendances...")
-            trends = trend_detector.detect_business_trends(analyzed_posts)
-            
-            # 4. MISE À JOUR ÉTAT
-            system_state.all_posts_history.extend(analyzed_posts)
-            
-            # Fenêtre glissante 24h
-            cutoff = datetime.now() - timedelta(hours=24)
-            system_state.processed_posts = [
-                p for p in system_state.all_posts_history
-                if p.created_at >= cutoff
-            ]
-            
-            system_state.current_trends = trends
-            system_state.sentiment_stats = sentiment_analyzer.get_sentiment_summary(
-                system_state.processed_posts
-            )
-            system_state.last_update = datetime.now()
-            
-            # Statistiques plateformes
-            platform_stats = Counter(p.platform.value for p in system_state.all_posts_history)
-            
-            # 5. MÉTRIQUES PERFORMANCE
-            elapsed = time.time() - start_time
-            system_state.performance_metrics.update({
-                'posts_processed': len(system_state.all_posts_history),
-                'posts_active_window': len(system_state.processed_posts),
-                'processing_speed': len(collected_posts) / elapsed if elapsed > 0 else 0,
-                'last_processing_time': round(elapsed, 2),
-                'total_iterations': iteration,
-                'system_uptime': (datetime.now() - system_state.start_time).total_seconds(),
-                'platform_stats': dict(platform_stats)
+    batches = iter_post_batches(
+        request.stream,
+        batch_size=config.ingest.batch_size,
+        max_line_bytes=config.ingest.max_line_bytes,
+        errors=errors
+    )
+    for first_line, posts in batches:
+        if not pipeline.submit(posts, source='ingest'):
+            # Backpressure: file d'analyse pleine
+            response = jsonify({
+                'status': 'busy',
+                'accepted': accepted,
+                'resume_from_line': first_line,
+                'errors': [str(e) for e in errors[:config.ingest.max_errors_reported]]
             })
-            
-            # 6. ÉMISSION WEBSOCKET
-            emit_updates(collected_posts, trends)
-            
-            logger.info(f"✅ Itération #{iteration} terminée en {elapsed:.2f}s")
-            logger.info(f"📊 {len(collected_posts)} nouveaux posts, "
-                       f"{len(system_state.all_posts_history)} total, "
-                       f"{len(trends)} tendances")
-            
-            # Nettoyage (garder 7 jours max)
-            if iteration % 10 == 0:
-                week_ago = datetime.now() - timedelta(days=7)
-                before = len(system_state.all_posts_history)
-                system_state.all_posts_history = [
-                    p for p in system_state.all_posts_history
-                    if p.created_at >= week_ago
-                ]
-                removed = before - len(system_state.all_posts_history)
-                if removed > 0:
-                    logger.info(f"🧹 Nettoyage: {removed} posts > 7 jours supprimés")
-            
-            # Pause
-            time.sleep(config.analysis.update_interval)
-            
-        except Exception as e:
-            logger.error(f"❌ ERREUR: {e}", exc_info=True)
-            time.sleep(30)
+            return response, 429, {'Retry-After': str(pipeline.retry_after())}
+        
+        accepted += len(posts)
+    
+    logger.info(f"📥 Ingestion: {accepted} posts acceptés, {len(errors)} lignes rejetées")
+    return jsonify({
+        'status': 'accepted',
+        'accepted': accepted,
+        'rejected': len(errors),
+        'errors': [str(e) for e in errors[:config.ingest.max_errors_reported]]
+    }), 202
 
 
 # ============================================
 # WEBSOCKET
 # ============================================
 
-def emit_updates(new_posts, trends):
-    """Émet mises à jour via WebSocket"""
+def emit_updates(new_posts, snapshot):
+    """
+    Met en file les mises à jour WebSocket
+    
+    Non-bloquant: l'envoi réel est fait par le broadcaster,
+    un client lent ne retarde donc pas le cycle suivant.
+    Toutes les données viennent du snapshot du cycle (cohérentes entre elles).
+    """
     try:
         # Métriques système
-        socketio.emit('system_stats', {
+        broadcaster.publish('system_stats', {
             'timestamp': datetime.now().isoformat(),
-            **system_state.performance_metrics
+            'version': snapshot.version,
+            **snapshot.performance_metrics
         })
         # Sentiments
-        socketio.emit('sentiment_update', {
-            **system_state.sentiment_stats,
+        broadcaster.publish('sentiment_update', {
+            **snapshot.sentiment_stats,
             'has_changed': True
         })
-        # Tendances
-        socketio.emit('trends_update', {
-            'trends': [t.to_dict() for t in trends] if trends else [],
-            'count': len(trends),
+        # Tendances et nouveaux posts: chaîne JSON assemblée depuis les
+        # fragments déjà encodés (décodée par le client)
+        broadcaster.publish('trends_update', encode_object({
+            'trends': snapshot.trends_encoded,
+            'count': len(snapshot.trends),
             'timestamp': datetime.now().isoformat()
-        })
+        }).decode('utf-8'))
         # Nouveaux posts
         if new_posts:
-            socketio.emit('new_posts', {
-                'posts': [p.to_dict() for p in new_posts[-10:]],
+            broadcaster.publish('new_posts', encode_object({
+                'posts': encode_posts(new_posts[-10:]),
                 'count': len(new_posts)
-            })
+            }).decode('utf-8'))
         # Stats collecte
-        socketio.emit('collection_stats', {
-            'total': system_state.performance_metrics.get('platform_stats', {}),
+        broadcaster.publish('collection_stats', {
+            'total': snapshot.performance_metrics.get('platform_stats', {}),
             'timestamp': datetime.now().isoformat()
         })
         
     except Exception as e:
         logger.error(f"❌ Erreur WebSocket: {e}")
 
+pipeline.subscribe(lambda cycle: emit_updates(cycle.posts, cycle.snapshot))
+
 @socketio.on('connect')
 def handle_connect():
     """Client connecté"""
+    broadcaster.register(request.sid)
     logger.info(f"👤 Client connecté: {request.sid}")
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Client déconnecté"""
+    broadcaster.unregister(request.sid)
     logger.info(f"👤 Client déconnecté: {request.sid}")
 
 
@@ -291,6 +288,7 @@ if __name__ == '__main__':
     logger.info("📊 API: http://localhost:5000/api/health")
     logger.info("="*70 + "\n")
     
+    start_warm_up()
     socketio.run(
         app,
         host='0.0.0.0',
@@ -0,0 +1,240 @@
+"""
+SOCKET BROADCASTER - DIFFUSION WEBSOCKET DÉCOUPLÉE
+===================================================
+
+Responsabilités:
+1. Sortir l'émission WebSocket du thread de traitement
+2. Une file bornée par client (protection clients lents)
+3. Coalescence des événements d'état (seul le dernier compte)
+4. Suppression des plus anciens messages quand la file déborde
+5. Contrôle de flux par accusé de réception (ack) par client
+
+Technique clé: Thread dédié + Condition + files bornées par client
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class ClientQueue:
+    """
+    File d'émission d'un client WebSocket
+
+    - Événements coalescés: une seule entrée par événement, remplacée
+    - Autres événements: FIFO bornée, le plus ancien est supprimé
+    - Un seul message en vol: le suivant attend l'ack du client
+    """
+
+    def __init__(self, sid: str, max_size: int):
+        self.sid = sid
+        self.max_size = max_size
+        self.queue = deque()
+        self.in_flight = False
+        self.sent_at = 0.0
+        self.sequence = 0
+
+        self.stats = {
+            'queued': 0,
+            'sent': 0,
+            'coalesced': 0,
+            'dropped': 0,
+            'ack_timeouts': 0,
+            'max_depth': 0
+        }
+
+    def push(self, event: str, payload: Any, coalesce: bool):
+        """Ajoute un message (coalescence ou drop-oldest)"""
+        self.stats['queued'] += 1
+
+        if coalesce:
+            for idx, (queued_event, _) in enumerate(self.queue):
+                if queued_event == event:
+                    self.queue[idx] = (event, payload)
+                    self.stats['coalesced'] += 1
+                    return
+
+        if len(self.queue) >= self.max_size:
+            # Supprimer le plus ancien message non-coalescé (l'état le plus
+            # récent de chaque événement coalescé est conservé)
+            for idx, (queued_event, _) in enumerate(self.queue):
+                if queued_event not in SocketBroadcaster.COALESCED_EVENTS:
+                    del self.queue[idx]
+                    break
+            else:
+                self.queue.popleft()
+            self.stats['dropped'] += 1
+
+        self.queue.append((event, payload))
+        self.stats['max_depth'] = max(self.stats['max_depth'], len(self.queue))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'queue_depth': len(self.queue),
+            'in_flight': self.in_flight
+        }
+
+
+class SocketBroadcaster:
+    """
+    Diffuseur WebSocket avec protection contre les clients lents
+
+    Le thread de traitement appelle publish() (non-bloquant), le thread
+    du diffuseur envoie ensuite à chaque client à son propre rythme.
+    """
+
+    # Événements d'état: seul le plus récent est utile au client
+    COALESCED_EVENTS = {'system_stats', 'sentiment_update', 'trends_update', 'collection_stats'}
+
+    def __init__(self, socketio, max_queue_size: int = 20,
+                 min_emit_interval: float = 0.0, ack_timeout: float = 5.0):
+        self.logger = logging.getLogger(__name__)
+        self.socketio = socketio
+        self.max_queue_size = max_queue_size
+        self.min_emit_interval = min_emit_interval
+        self.ack_timeout = ack_timeout
+
+        self.clients: Dict[str, ClientQueue] = {}
+        self.condition = threading.Condition()
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+
+        self.stats = {
+            'published': 0,
+            'disconnected_clients': 0
+        }
+
+    # ============================================
+    # CYCLE DE VIE
+    # ============================================
+
+    def start(self):
+        """Démarre le thread de diffusion"""
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+
+        self.thread = threading.Thread(target=self._run, name='socket-broadcaster', daemon=True)
+        self.thread.start()
+        self.logger.info(f"📣 Broadcaster démarré (file max: {self.max_queue_size}/client)")
+
+    def stop(self):
+        """Arrête le thread de diffusion"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+        if self.thread:
+            self.thread.join(timeout=5)
+
+    def register(self, sid: str):
+        """Enregistre un nouveau client"""
+        with self.condition:
+            self.clients[sid] = ClientQueue(sid, self.max_queue_size)
+
+    def unregister(self, sid: str):
+        """Retire un client déconnecté"""
+        with self.condition:
+            if self.clients.pop(sid, None) is not None:
+                self.stats['disconnected_clients'] += 1
+
+    # ============================================
+    # PUBLICATION (appelé par le thread de traitement)
+    # ============================================
+
+    def publish(self, event: str, payload: Any):
+        """Met un message en file pour tous les clients (non-bloquant)"""
+        coalesce = event in self.COALESCED_EVENTS
+
+        with self.condition:
+            self.stats['published'] += 1
+            for client in self.clients.values():
+                client.push(event, payload, coalesce)
+            self.condition.notify()
+
+    # ============================================
+    # THREAD DE DIFFUSION
+    # ============================================
+
+    def _run(self):
+        """Boucle de diffusion: envoie aux clients prêts"""
+        while True:
+            with self.condition:
+                if not self.running:
+                    return
+
+                now = time.monotonic()
+                ready = []
+                next_wakeup = None
+
+                for client in self.clients.values():
+                    if client.in_flight and now - client.sent_at >= self.ack_timeout:
+                        # Client lent: ack non reçu, on libère le créneau
+                        client.in_flight = False
+                        client.stats['ack_timeouts'] += 1
+
+                    if not client.queue:
+                        continue
+
+                    if client.in_flight:
+                        wakeup = client.sent_at + self.ack_timeout
+                    elif now - client.sent_at < self.min_emit_interval:
+                        wakeup = client.sent_at + self.min_emit_interval
+                    else:
+                        event, payload = client.queue.popleft()
+                        client.in_flight = True
+                        client.sent_at = now
+                        client.sequence += 1
+                        ready.append((client, client.sequence, event, payload))
+                        continue
+
+                    next_wakeup = wakeup if next_wakeup is None else min(next_wakeup, wakeup)
+
+                if not ready:
+                    timeout = None if next_wakeup is None else max(next_wakeup - now, 0.01)
+                    self.condition.wait(timeout=timeout)
+                    continue
+
+            # Émission hors verrou: un envoi lent ne bloque pas publish()
+            for client, sequence, event, payload in ready:
+                self._emit(client, sequence, event, payload)
+
+    def _emit(self, client: ClientQueue, sequence: int, event: str, payload: Any):
+        """Envoie un message à un client avec accusé de réception"""
+        def on_ack(*args):
+            with self.condition:
+                # Ignorer un ack tardif (message déjà expiré)
+                if client.sequence == sequence:
+                    client.in_flight = False
+                    self.condition.notify()
+
+        try:
+            self.socketio.emit(event, payload, to=client.sid, callback=on_ack)
+        except Exception as e:
+            self.logger.error(f"❌ Erreur WebSocket ({client.sid}): {e}")
+            with self.condition:
+                client.in_flight = False
+        else:
+            with self.condition:
+                client.stats['sent'] += 1
+
+    # ============================================
+    # MÉTRIQUES
+    # ============================================
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Profondeur des files et messages perdus par client"""
+        with self.condition:
+            clients = {sid: c.get_statistics() for sid, c in self.clients.items()}
+
+        return {
+            **self.stats,
+            'connected_clients': len(clients),
+            'total_dropped': sum(c['dropped'] for c in clients.values()),
+            'total_queue_depth': sum(c['queue_depth'] for c in clients.values()),
+            'clients': clients
+        }
@@ -0,0 +1,419 @@
+"""
+API COLLECTORS - COLLECTEURS DES API RÉELLES (ASYNC)
+=====================================================
+
+Pendants API des collecteurs simulés (Dynamic*Collector), sur la base
+AsyncHTTPCollector:
+
+    AsyncRedditCollector     GET  /r/{subreddit}/new            (after)
+    AsyncTwitterCollector    GET  /2/tweets/search/recent       (next_token)
+    AsyncInstagramCollector  GET  /{hashtag-id}/recent_media    (paging.cursors.after)
+    AsyncTikTokCollector     POST /v2/research/video/query/     (cursor + search_id)
+
+Mêmes catégories business que les collecteurs simulés (1 requête
+paginée par catégorie), posts construits via SocialPost.from_dict.
+Adresses et jetons: config.api; quotas: config.rate_limits.
+"""
+
+import asyncio
+import logging
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from src.core.config.settings import config
+from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+from src.data.collectors.async_http import AsyncHTTPCollector, PageQuery
+from src.data.collectors.rate_limiter import RateLimitScheduler, get_rate_limiter
+
+
+def _http_options(rate_limiter: Optional[RateLimitScheduler], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Options de session par défaut (config.http) + surcharges"""
+    options = {
+        'max_concurrency': config.http.max_concurrency,
+        'max_connections': config.http.max_connections,
+        'max_pages': config.http.max_pages,
+        'max_retries': config.http.max_retries,
+        'backoff': config.http.backoff,
+        'request_timeout': config.http.request_timeout,
+        'keepalive_timeout': config.http.keepalive_timeout,
+        'rate_limiter': rate_limiter if rate_limiter is not None else get_rate_limiter()
+    }
+    options.update(overrides)
+    return options
+
+
+def _bearer(token: str) -> Dict[str, str]:
+    return {'Authorization': f"Bearer {token}"} if token else {}
+
+
+class AsyncRedditCollector(AsyncHTTPCollector):
+    """Reddit: derniers posts de 1 subreddit par catégorie"""
+
+    platform = Platform.REDDIT
+
+    def __init__(self, base_url: Optional[str] = None, rate_limiter: Optional[RateLimitScheduler] = None,
+                 **options):
+        settings = config.api['reddit']
+        super().__init__(
+            base_url or settings['base_url'],
+            headers={'User-Agent': settings['user_agent'], **_bearer(settings['access_token'])},
+            **_http_options(rate_limiter, options)
+        )
+
+    async def build_queries(self) -> List[PageQuery]:
+        return [
+            PageQuery(f"/r/{category.value}/new", category, params={'limit': 100, 'raw_json': 1})
+            for category in BusinessCategory
+        ]
+
+    def parse_page(self, query: PageQuery, payload: Any) -> List[SocialPost]:
+        def to_dict(child: Dict[str, Any]) -> Dict[str, Any]:
+            item = child.get('data', {})
+            return {
+                'id': f"reddit_{item['id']}",
+                'platform': self.platform.value,
+                'content': ' '.join(filter(None, [item.get('title'), item.get('selftext')])),
+                'author': f"u/{item.get('author', '')}",
+                'created_at': item.get('created_utc'),
+                'url': f"https://reddit.com{item.get('permalink', '')}",
+                'metrics': {
+                    'upvotes': item.get('ups', 0),
+                    'comments': item.get('num_comments', 0),
+                    'awards': item.get('total_awards_received', 0)
+                },
+                'category': query.category.value,
+                'metadata': {'subreddit': f"r/{item.get('subreddit', query.category.value)}"}
+            }
+
+        return self.build_posts(payload.get('data', {}).get('children', []), to_dict)
+
+    def next_page(self, query: PageQuery, payload: Any) -> Optional[PageQuery]:
+        after = payload.get('data', {}).get('after')
+        return query.following({'after': after}) if after else None
+
+
+class AsyncTwitterCollector(AsyncHTTPCollector):
+    """Twitter/X API v2: recherche récente, 1 hashtag par catégorie"""
+
+    platform = Platform.TWITTER
+
+    def __init__(self, base_url: Optional[str] = None, rate_limiter: Optional[RateLimitScheduler] = None,
+                 **options):
+        settings = config.api['twitter']
+        super().__init__(
+            base_url or settings['base_url'],
+            headers=_bearer(settings['bearer_token']),
+            **_http_options(rate_limiter, options)
+        )
+
+    async def build_queries(self) -> List[PageQuery]:
+        return [
+            PageQuery('/2/tweets/search/recent', category, params={
+                'query': f"#{category.value} -is:retweet lang:en",
+                'max_results': 100,
+                'tweet.fields': 'created_at,public_metrics,author_id',
+                'expansions': 'author_id',
+                'user.fields': 'username,public_metrics'
+            })
+            for category in BusinessCategory
+        ]
+
+    def parse_page(self, query: PageQuery, payload: Any) -> List[SocialPost]:
+        users = {user['id']: user for user in payload.get('includes', {}).get('users', [])}
+
+        def to_dict(tweet: Dict[str, Any]) -> Dict[str, Any]:
+            user = users.get(tweet.get('author_id'), {})
+            metrics = tweet.get('public_metrics', {})
+            return {
+                'id': f"twitter_{tweet['id']}",
+                'platform': self.platform.value,
+                'content': tweet.get('text', ''),
+                'author': f"@{user.get('username', tweet.get('author_id', ''))}",
+                'author_followers': user.get('public_metrics', {}).get('followers_count', 0),
+                'created_at': tweet.get('created_at'),
+                'url': f"https://twitter.com/i/status/{tweet['id']}",
+                'metrics': {
+                    'likes': metrics.get('like_count', 0),
+                    'retweets': metrics.get('retweet_count', 0),
+                    'replies': metrics.get('reply_count', 0),
+                    'quotes': metrics.get('quote_count', 0)
+                },
+                'category': query.category.value,
+                'metadata': {'query': query.params['query']}
+            }
+
+        return self.build_posts(payload.get('data', []), to_dict)
+
+    def next_page(self, query: PageQuery, payload: Any) -> Optional[PageQuery]:
+        token = payload.get('meta', {}).get('next_token')
+        return query.following({'next_token': token}) if token else None
+
+    def apply_cursor(self, query: PageQuery, entry: Dict[str, Any]) -> PageQuery:
+        return replace(query, params={**query.params, 'since_id': entry['since_id']})
+
+
+class AsyncInstagramCollector(AsyncHTTPCollector):
+    """
+    Instagram Graph API: médias récents de 1 hashtag par catégorie
+
+    Les ids de hashtag sont résolus une fois (ig_hashtag_search) puis
+    gardés en cache.
+    """
+
+    platform = Platform.INSTAGRAM
+
+    def __init__(self, base_url: Optional[str] = None, rate_limiter: Optional[RateLimitScheduler] = None,
+                 **options):
+        settings = config.api['instagram']
+        super().__init__(base_url or settings['base_url'], **_http_options(rate_limiter, options))
+        self.user_id = settings['user_id']
+        self.access_token = settings['access_token']
+        self.hashtag_ids: Dict[BusinessCategory, str] = {}
+
+    async def _hashtag_id(self, category: BusinessCategory) -> str:
+        if category not in self.hashtag_ids:
+            payload = await self.request(PageQuery('/ig_hashtag_search', category, params={
+                'user_id': self.user_id, 'q': category.value, 'access_token': self.access_token
+            }))
+            self.hashtag_ids[category] = payload['data'][0]['id']
+        return self.hashtag_ids[category]
+
+    async def build_queries(self) -> List[PageQuery]:
+        categories = list(BusinessCategory)
+        hashtag_ids = await asyncio.gather(
+            *(self._hashtag_id(category) for category in categories),
+            return_exceptions=True
+        )
+
+        queries = []
+        for category, hashtag_id in zip(categories, hashtag_ids):
+            if isinstance(hashtag_id, Exception):
+                self.logger.error(f"❌ instagram #{category.value}: hashtag introuvable - {hashtag_id}")
+                continue
+            queries.append(PageQuery(f"/{hashtag_id}/recent_media", category, params={
+                'user_id': self.user_id,
+                'fields': 'id,caption,like_count,comments_count,timestamp,permalink',
+                'limit': 50,
+                'access_token': self.access_token
+            }))
+        return queries
+
+    def parse_page(self, query: PageQuery, payload: Any) -> List[SocialPost]:
+        # Média sans légende: contenu vide, ignoré par build_posts
+        return self.build_posts(payload.get('data', []), lambda media: {
+            'id': f"instagram_{media['id']}",
+            'platform': self.platform.value,
+            'content': media.get('caption', ''),
+            'author': '',
+            'created_at': media.get('timestamp'),
+            'url': media.get('permalink', ''),
+            'metrics': {
+                'likes': media.get('like_count', 0),
+                'comments': media.get('comments_count', 0)
+            },
+            'category': query.category.value,
+            'metadata': {'hashtag': f"#{query.category.value}"}
+        })
+
+    def next_page(self, query: PageQuery, payload: Any) -> Optional[PageQuery]:
+        paging = payload.get('paging', {})
+        after = paging.get('cursors', {}).get('after')
+        return query.following({'after': after}) if after and paging.get('next') else None
+
+
+class AsyncTikTokCollector(AsyncHTTPCollector):
+    """TikTok Research API: vidéos du jour, 1 hashtag par catégorie"""
+
+    platform = Platform.TIKTOK
+
+    FIELDS = 'id,video_description,create_time,username,like_count,comment_count,share_count,view_count'
+
+    def __init__(self, base_url: Optional[str] = None, rate_limiter: Optional[RateLimitScheduler] = None,
+                 **options):
+        settings = config.api['tiktok']
+        super().__init__(
+            base_url or settings['base_url'],
+            headers=_bearer(settings['access_token']),
+            **_http_options(rate_limiter, options)
+        )
+
+    async def build_queries(self) -> List[PageQuery]:
+        today = datetime.now()
+        return [
+            PageQuery('/v2/research/video/query/', category, method='POST',
+                      params={'fields': self.FIELDS},
+                      body={
+                          'query': {'and': [{
+                              'operation': 'IN',
+                              'field_name': 'hashtag_name',
+                              'field_values': [category.value]
+                          }]},
+                          'start_date': (today - timedelta(days=1)).strftime('%Y%m%d'),
+                          'end_date': today.strftime('%Y%m%d'),
+                          'max_count': 100
+                      })
+            for category in BusinessCategory
+        ]
+
+    def parse_page(self, query: PageQuery, payload: Any) -> List[SocialPost]:
+        return self.build_posts(payload.get('data', {}).get('videos', []), lambda video: {
+            'id': f"tiktok_{video['id']}",
+            'platform': self.platform.value,
+            'content': video.get('video_description', ''),
+            'author': f"@{video.get('username', '')}",
+            'created_at': video.get('create_time'),
+            'url': f"https://www.tiktok.com/@{video.get('username', '')}/video/{video['id']}",
+            'metrics': {
+                'views': video.get('view_count', 0),
+                'likes': video.get('like_count', 0),
+                'comments': video.get('comment_count', 0),
+                'shares': video.get('share_count', 0)
+            },
+            'category': query.category.value,
+            'metadata': {'hashtag': f"#{query.category.value}"}
+        })
+
+    def next_page(self, query: PageQuery, payload: Any) -> Optional[PageQuery]:
+        data = payload.get('data', {})
+        if not data.get('has_more'):
+            return None
+        return query.following(body={'cursor': data.get('cursor'), 'search_id': data.get('search_id')})
+
+    def apply_cursor(self, query: PageQuery, entry: Dict[str, Any]) -> PageQuery:
+        # Granularité jour côté API, le watermark filtre le reste
+        start_date = datetime.fromisoformat(entry['watermark']).strftime('%Y%m%d')
+        return replace(query, body={**query.body, 'start_date': start_date})
+
+
+# ============================================
+# TEST UNITAIRE (API LOCALE SIMULÉE)
+# ============================================
+
+def _stub_api_app(pages: int = 3, per_page: int = 20, latency: float = 0.05, failure_rate: float = 0.1):
+    """
+    Application aiohttp imitant les 4 API (formats et pagination)
+
+    Chaque requête attend `latency` secondes; une fraction
+    `failure_rate` répond 503 (exercice des reprises).
+    """
+    import random
+    import time
+
+    from aiohttp import web
+
+    connections = set()
+    counters = {'requests': 0, 'failures': 0}
+
+    def page_number(cursor) -> int:
+        return int(cursor or 0)
+
+    def items(page: int) -> List[int]:
+        return [page * per_page + i for i in range(per_page)]
+
+    async def common(request):
+        counters['requests'] += 1
+        connections.add(request.transport.get_extra_info('peername'))
+        await asyncio.sleep(latency)
+        if random.random() < failure_rate:
+            counters['failures'] += 1
+            raise web.HTTPServiceUnavailable()
+
+    async def reddit(request):
+        await common(request)
+        page = page_number(request.query.get('after'))
+        children = [{'data': {
+            'id': f"{request.match_info['sub']}{i}", 'title': f"Post {i}", 'selftext': 'Great product',
+            'author': f"user{i}", 'created_utc': time.time() - i, 'permalink': f"/r/x/comments/{i}",
+            'ups': i, 'num_comments': 1, 'total_awards_received': 0, 'subreddit': request.match_info['sub']
+        }} for i in items(page)]
+        after = str(page + 1) if page + 1 < pages else None
+        return web.json_response({'data': {'children': children, 'after': after}})
+
+    async def twitter(request):
+        await common(request)
+        page = page_number(request.query.get('next_token'))
+        tag = request.query['query'].split()[0]
+        data = [{'id': f"{tag[1:]}{i}", 'text': f"{tag} tweet {i}", 'author_id': '1',
+                 'created_at': '2024-01-01T12:00:00.000Z',
+                 'public_metrics': {'like_count': i, 'retweet_count': 0, 'reply_count': 0, 'quote_count': 0}}
+                for i in items(page)]
+        meta = {'next_token': str(page + 1)} if page + 1 < pages else {}
+        return web.json_response({'data': data, 'meta': meta,
+                                  'includes': {'users': [{'id': '1', 'username': 'stub',
+                                                          'public_metrics': {'followers_count': 10}}]}})
+
+    async def hashtag_search(request):
+        await common(request)
+        return web.json_response({'data': [{'id': f"tag-{request.query['q']}"}]})
+
+    async def instagram(request):
+        await common(request)
+        page = page_number(request.query.get('after'))
+        data = [{'id': f"{request.match_info['tag']}-{i}", 'caption': f"Caption {i}", 'like_count': i,
+                 'comments_count': 0, 'timestamp': '2024-01-01T12:00:00+0000', 'permalink': ''}
+                for i in items(page)]
+        paging = {'cursors': {'after': str(page + 1)}, 'next': 'more'} if page + 1 < pages else {}
+        return web.json_response({'data': data, 'paging': paging})
+
+    async def tiktok(request):
+        await common(request)
+        body = await request.json()
+        tag = body['query']['and'][0]['field_values'][0]
+        page = page_number(body.get('cursor'))
+        videos = [{'id': f"{tag}{i}", 'video_description': f"#{tag} video {i}", 'username': 'stub',
+                   'create_time': int(time.time()), 'like_count': i, 'comment_count': 0,
+                   'share_count': 0, 'view_count': 10 * i}
+                  for i in items(page)]
+        return web.json_response({'data': {'videos': videos, 'cursor': page + 1,
+                                           'has_more': page + 1 < pages, 'search_id': 's1'}})
+
+    app = web.Application()
+    app.router.add_get('/r/{sub}/new', reddit)
+    app.router.add_get('/2/tweets/search/recent', twitter)
+    app.router.add_get('/ig_hashtag_search', hashtag_search)
+    app.router.add_get('/{tag}/recent_media', instagram)
+    app.router.add_post('/v2/research/video/query/', tiktok)
+    return app, connections, counters
+
+
+if __name__ == "__main__":
+    import time
+
+    from aiohttp import web
+
+    from src.data.collectors.async_http import collect_platforms_async
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    async def main():
+        app, connections, counters = _stub_api_app()
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+        # Pas de quota ici: l'API locale ne limite pas
+        limiter = RateLimitScheduler({})
+        collectors = [
+            cls(base_url=url, rate_limiter=limiter, backoff=0.05, max_concurrency=8, max_connections=4)
+            for cls in (AsyncRedditCollector, AsyncTwitterCollector,
+                        AsyncInstagramCollector, AsyncTikTokCollector)
+        ]
+
+        start = time.time()
+        collected = await collect_platforms_async(collectors)
+        elapsed = time.time() - start
+        await runner.cleanup()
+
+        print(f"\n✅ {sum(len(posts) for posts in collected.values())} posts en {elapsed:.2f}s")
+        for name, posts in collected.items():
+            print(f"   • {name:10} → {len(posts)} posts")
+        print(f"🌐 {counters['requests']} requêtes ({counters['failures']} échecs 503 repris), "
+              f"{len(connections)} connexions TCP ouvertes (keep-alive)")
+        print(f"⏱️  Séquentiel estimé: {counters['requests'] * 0.05:.2f}s")
+        for collector in collectors:
+            print(f"📊 {collector.get_statistics()}")
+
+    asyncio.run(main())
@@ -0,0 +1,439 @@
+"""
+ASYNC HTTP COLLECTOR - BASE DES COLLECTEURS API RÉELS
+======================================================
+
+Responsabilités:
+1. Une session aiohttp par collecteur: connexions keep-alive réutilisées
+   d'une requête (et d'une page) à l'autre
+2. Concurrence bornée (sémaphore) et pool de connexions borné
+3. Pagination (curseur renvoyé par l'API → requête de la page suivante)
+4. Reprises avec backoff exponentiel (erreurs réseau, 5xx, 429)
+5. Quotas respectés via le RateLimitScheduler partagé
+6. Collecte incrémentale: curseur par catégorie (since-id + watermark),
+   seuls les posts postérieurs au watermark sont gardés et la
+   pagination s'arrête à la première page qui l'atteint. Si max_pages
+   est atteint avant, le curseur garde la page suivante ('resume') et
+   le watermark ne bouge pas: le cycle suivant reprend la pagination
+   là où elle s'est arrêtée
+
+La collecte API est limitée par les E/S: une boucle asyncio peut
+interroger toutes les plateformes à la fois (collect_platforms) au
+lieu d'un processus par plateforme et d'une requête à la fois.
+
+Une sous-classe décrit seulement l'API:
+    platform         plateforme des posts produits
+    build_queries()  requêtes de première page (1 par catégorie...)
+    parse_page()     payload JSON → SocialPost (via build_posts: un
+                     élément invalide est ignoré, pas la page)
+    next_page()      requête de la page suivante (None = fin)
+    apply_cursor()   (optionnel) filtre côté API depuis le curseur
+"""
+
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+from src.data.collectors.rate_limiter import RateLimitScheduler
+from src.data.collectors.registry import ShardMixin
+
+# Statuts qui justifient une nouvelle tentative
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HTTPCollectionError(RuntimeError):
+    """Requête abandonnée (statut non récupérable ou tentatives épuisées)"""
+
+    def __init__(self, url: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.status = status
+
+
+@dataclass
+class PageQuery:
+    """Une requête paginée (path relatif à base_url)"""
+    path: str
+    category: BusinessCategory
+    params: Dict[str, Any] = field(default_factory=dict)
+    method: str = 'GET'
+    body: Optional[Dict[str, Any]] = None
+    page: int = 1
+
+    def following(self, params: Optional[Dict[str, Any]] = None,
+                  body: Optional[Dict[str, Any]] = None) -> 'PageQuery':
+        """Requête de la page suivante (mêmes path/catégorie)"""
+        return replace(
+            self,
+            params={**self.params, **(params or {})},
+            body={**self.body, **(body or {})} if self.body is not None else body,
+            page=self.page + 1
+        )
+
+
+class AsyncHTTPCollector(ShardMixin, ABC):
+    """
+    Collecteur HTTP asynchrone (classe de base abstraite)
+
+    Exemple:
+        async with AsyncRedditCollector() as collector:
+            posts = await collector.collect_async()
+
+        posts = AsyncRedditCollector().collect()   # depuis du code synchrone
+    """
+
+    platform: Platform = None
+    # Ids de l'API: identiques quel que soit le processus qui les collecte
+    local_ids = False
+
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None,
+                 max_concurrency: int = 8, max_connections: int = 16,
+                 max_pages: int = 5, max_retries: int = 3, backoff: float = 0.5,
+                 request_timeout: float = 15.0, keepalive_timeout: float = 30.0,
+                 rate_limiter: Optional[RateLimitScheduler] = None):
+        self.logger = logging.getLogger(self.__class__.__module__)
+        self.base_url = base_url.rstrip('/')
+        self.headers = headers or {}
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.max_pages = max_pages
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.request_timeout = request_timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = rate_limiter
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # Catégorie → {'since_id', 'watermark'} (1 requête paginée par catégorie)
+        self.cursor: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            'collections': 0,
+            'requests': 0,
+            'pages': 0,
+            'posts': 0,
+            'retries': 0,
+            'skipped_posts': 0,
+            'invalid_items': 0,
+            'failed_queries': 0,
+            'truncated_queries': 0,
+            'last_collection_time': 0.0
+        }
+
+    @property
+    def name(self) -> str:
+        return self.platform.value if self.platform else self.__class__.__name__
+
+    # ------------------------------------------------------------------
+    # Session
+    # ------------------------------------------------------------------
+
+    async def open(self):
+        """Crée la session (pool de connexions keep-alive)"""
+        if self.session is not None and not self.session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            raise_for_status=False
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> 'AsyncHTTPCollector':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    async def request(self, query: PageQuery) -> Any:
+        """
+        Exécute une requête (quota, concurrence bornée, reprises)
+
+        Returns:
+            Payload JSON décodé
+
+        Raises:
+            HTTPCollectionError: statut non récupérable ou tentatives épuisées
+        """
+        url = f"{self.base_url}{query.path}"
+        last_error = ''
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve(self.name)
+                if delay:
+                    await asyncio.sleep(delay)
+
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    self.stats['requests'] += 1
+                    async with self.session.request(query.method, url, params=query.params,
+                                                    json=query.body) as response:
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.observe(self.name, response.status, response.headers)
+
+                        if response.status < 400:
+                            return await response.json(content_type=None)
+
+                        last_error = f"HTTP {response.status}"
+                        if response.status not in RETRY_STATUSES:
+                            raise HTTPCollectionError(url, last_error, response.status)
+                        if response.status == 429 and self.rate_limiter is None:
+                            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = f"{type(e).__name__} {e}".strip()
+
+            if attempt < self.max_retries:
+                # Backoff exponentiel + gigue (évite les reprises synchronisées)
+                wait = retry_after if retry_after is not None else self.backoff * (2 ** attempt)
+                await asyncio.sleep(wait * random.uniform(0.8, 1.2))
+
+        raise HTTPCollectionError(url, f"{self.max_retries + 1} tentatives ({last_error})")
+
+    async def fetch_pages(self, query: PageQuery,
+                          watermark: Optional[datetime] = None) -> Tuple[List[SocialPost], Optional[PageQuery]]:
+        """
+        Pages d'une requête (jusqu'à max_pages), posts postérieurs au
+        watermark uniquement
+
+        Les API listent du plus récent au plus ancien: une page qui
+        atteint le watermark est la dernière utile.
+
+        Returns:
+            (posts, page suivante non lue si max_pages est atteint avant
+            le watermark - None si la pagination est complète ou s'il
+            n'y a pas de watermark)
+        """
+        posts: List[SocialPost] = []
+        current: Optional[PageQuery] = query
+        pages = 0
+        while current is not None:
+            if pages >= self.max_pages:
+                return posts, current if watermark is not None else None
+            payload = await self.request(current)
+            pages += 1
+            self.stats['pages'] += 1
+            page_posts = self.parse_page(current, payload)
+            if watermark is not None:
+                fresh = [post for post in page_posts if post.created_at > watermark]
+                self.stats['skipped_posts'] += len(page_posts) - len(fresh)
+                posts.extend(fresh)
+                if len(fresh) < len(page_posts):
+                    break
+            else:
+                posts.extend(page_posts)
+            current = self.next_page(current, payload)
+        return posts, None
+
+    async def collect_async(self) -> List[SocialPost]:
+        """
+        Collecte complète: toutes les requêtes en parallèle
+
+        Une requête en échec est loggée et ignorée (collecte partielle).
+        """
+        start = time.time()
+        opened_here = self.session is None
+        if opened_here:
+            await self.open()
+
+        try:
+            queries = []
+            for query in self.shard_items(await self.build_queries()):
+                entry = self.cursor.get(query.category.value)
+                queries.append(self._cursor_query(query, entry) if entry else query)
+            results = await asyncio.gather(
+                *(self.fetch_pages(query, self._watermark(query)) for query in queries),
+                return_exceptions=True
+            )
+        finally:
+            if opened_here:
+                await self.close()
+
+        posts: List[SocialPost] = []
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                self.stats['failed_queries'] += 1
+                self.logger.error(f"❌ {self.name} {query.path}: {result}")
+            else:
+                fetched, resume = result
+                posts.extend(fetched)
+                self._advance_cursor(query, fetched, resume)
+
+        self.stats['collections'] += 1
+        self.stats['posts'] += len(posts)
+        self.stats['last_collection_time'] = round(time.time() - start, 3)
+        self.logger.info(
+            f"🌐 {self.name}: {len(posts)} posts, {len(queries)} requêtes "
+            f"en {self.stats['last_collection_time']:.2f}s"
+        )
+        return posts
+
+    def collect(self) -> List[SocialPost]:
+        """Version synchrone (processus plateforme du superviseur)"""
+        return asyncio.run(self.collect_async())
+
+    # ------------------------------------------------------------------
+    # Curseur (collecte incrémentale)
+    # ------------------------------------------------------------------
+
+    def get_cursor(self) -> Dict[str, Any]:
+        return {category: dict(entry) for category, entry in self.cursor.items()}
+
+    def set_cursor(self, cursor: Dict[str, Any]):
+        self.cursor = {category: dict(entry) for category, entry in cursor.items()}
+
+    @staticmethod
+    def merge_cursors(cursors: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Curseurs de plusieurs processus (plan modifié): par catégorie, le watermark le plus récent"""
+        def newest(entry: Dict[str, Any]) -> datetime:
+            return datetime.fromisoformat(entry['watermark']) if entry.get('watermark') else datetime.min
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        for cursor in cursors:
+            for category, entry in cursor.items():
+                if category not in merged or newest(entry) > newest(merged[category]):
+                    merged[category] = dict(entry)
+        return merged
+
+    def _watermark(self, query: PageQuery) -> Optional[datetime]:
+        entry = self.cursor.get(query.category.value)
+        return datetime.fromisoformat(entry['watermark']) if entry and entry.get('watermark') else None
+
+    def _cursor_query(self, query: PageQuery, entry: Dict[str, Any]) -> PageQuery:
+        """Première requête du cycle: reprise de pagination, sinon filtre du curseur"""
+        resume = entry.get('resume')
+        if resume:
+            return replace(query, params=dict(resume['params']),
+                           body=dict(resume['body']) if resume['body'] is not None else None, page=1)
+        return self.apply_cursor(query, entry)
+
+    def _advance_cursor(self, query: PageQuery, posts: List[SocialPost],
+                        resume: Optional[PageQuery] = None):
+        """
+        Met à jour le curseur de la catégorie
+
+        Pagination complète (watermark atteint ou dernière page): le
+        watermark passe au post le plus récent vu depuis le début de la
+        pagination. Interrompue par max_pages: watermark inchangé, page
+        suivante gardée dans 'resume', post le plus récent dans 'pending'.
+        """
+        key = query.category.value
+        entry = dict(self.cursor.get(key) or {})
+        pending = entry.pop('pending', None)
+        if posts:
+            newest = max(posts, key=lambda post: post.created_at)
+            if pending is None or newest.created_at > datetime.fromisoformat(pending['watermark']):
+                pending = {
+                    # id natif de la plateforme (sans le préfixe "twitter_"...)
+                    'since_id': newest.id.split('_', 1)[-1],
+                    'watermark': newest.created_at.isoformat()
+                }
+
+        if resume is not None:
+            self.stats['truncated_queries'] += 1
+            entry['resume'] = {'params': resume.params, 'body': resume.body}
+            if pending is not None:
+                entry['pending'] = pending
+            self.logger.info(f"⏭️  {self.name} {key}: {self.max_pages} pages atteintes, reprise au cycle suivant")
+        else:
+            entry.pop('resume', None)
+            if pending is not None:
+                entry.update(pending)
+
+        if entry:
+            self.cursor[key] = entry
+
+    # ------------------------------------------------------------------
+    # À définir par plateforme
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    async def build_queries(self) -> List[PageQuery]:
+        """Requêtes de première page"""
+
+    @abstractmethod
+    def parse_page(self, query: PageQuery, payload: Any) -> List[SocialPost]:
+        """Payload d'une page → posts"""
+
+    def build_posts(self, items: Iterable[Any], to_dict: Callable[[Any], Dict[str, Any]]) -> List[SocialPost]:
+        """
+        Éléments d'une page → posts (SocialPost.from_dict(to_dict(item)))
+
+        Un élément invalide (champ manquant, texte vide, valeur hors
+        limites) est compté et ignoré: le reste de la page est gardé.
+        """
+        posts = []
+        for item in items:
+            try:
+                posts.append(SocialPost.from_dict(to_dict(item)))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                self.stats['invalid_items'] += 1
+                self.logger.debug(f"{self.name}: élément ignoré - {type(e).__name__} {e}")
+        return posts
+
+    def next_page(self, query: PageQuery, payload: Any) -> Optional[PageQuery]:
+        """Requête de la page suivante (None = dernière page)"""
+        return None
+
+    def apply_cursor(self, query: PageQuery, entry: Dict[str, Any]) -> PageQuery:
+        """Première page restreinte côté API (ex: since_id); par défaut inchangée"""
+        return query
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {'platform': self.name, **self.stats}
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+async def collect_platforms_async(collectors: Sequence[AsyncHTTPCollector]) -> Dict[str, List[SocialPost]]:
+    """Toutes les plateformes dans une seule boucle (1 session par plateforme)"""
+    results = await asyncio.gather(
+        *(collector.collect_async() for collector in collectors),
+        return_exceptions=True
+    )
+    collected = {}
+    for collector, result in zip(collectors, results):
+        if isinstance(result, Exception):
+            collector.logger.error(f"❌ {collector.name}: ERREUR - {result}")
+            result = []
+        collected[collector.name] = result
+    return collected
+
+
+def collect_platforms(collectors: Sequence[AsyncHTTPCollector]) -> Dict[str, List[SocialPost]]:
+    """Version synchrone de collect_platforms_async"""
+    return asyncio.run(collect_platforms_async(collectors))
@@ -0,0 +1,149 @@
+"""
+CURSORS - COLLECTE INCRÉMENTALE REPRENABLE
+===========================================
+
+Responsabilités:
+1. Curseur par collecteur (get_cursor / set_cursor): où reprendre
+   la collecte suivante
+   - collecteurs simulés: itération, compteur d'ids, watermark
+     (date du post le plus récent déjà collecté)
+   - collecteurs API: since-id + watermark par catégorie
+     (voir AsyncHTTPCollector)
+2. Checkpoint durable des curseurs de toutes les plateformes
+   (CursorStore, JSON écrit atomiquement) après chaque cycle réussi
+
+Un cycle ne produit ainsi que des posts postérieurs au watermark, avec
+des ids qui continuent (reddit_12_540 et non reddit_1_0) même après un
+redémarrage du processus plateforme ou de l'application.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from src.core.models.social_data import SocialPost
+
+
+class SimulatedCursorMixin:
+    """
+    Curseur des collecteurs simulés (Dynamic*Collector)
+
+    La classe hôte définit self.iteration, self.post_id et self.rng;
+    la collecte date ses posts avec _new_post_time() puis appelle
+    _advance_watermark(posts).
+    """
+
+    # Fenêtre des posts simulés (minutes avant maintenant)
+    lookback_minutes = 30
+
+    watermark: Optional[datetime] = None
+
+    def get_cursor(self) -> Dict[str, Any]:
+        return {
+            'iteration': self.iteration,
+            'post_id': self.post_id,
+            'watermark': self.watermark.isoformat() if self.watermark else None
+        }
+
+    def set_cursor(self, cursor: Dict[str, Any]):
+        self.iteration = int(cursor.get('iteration', 0))
+        self.post_id = int(cursor.get('post_id', 0))
+        watermark = cursor.get('watermark')
+        self.watermark = datetime.fromisoformat(watermark) if watermark else None
+
+    @staticmethod
+    def merge_cursors(cursors: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Curseur unique depuis ceux de plusieurs processus (plan modifié)
+
+        Compteurs et watermark les plus avancés: les ids suivants
+        (itération supérieure) ne recroisent aucun id déjà produit.
+        """
+        watermarks = [cursor['watermark'] for cursor in cursors if cursor.get('watermark')]
+        return {
+            'iteration': max((int(cursor.get('iteration', 0)) for cursor in cursors), default=0),
+            'post_id': max((int(cursor.get('post_id', 0)) for cursor in cursors), default=0),
+            'watermark': max(watermarks, key=datetime.fromisoformat, default=None)
+        }
+
+    def _new_post_time(self) -> datetime:
+        """Date d'un nouveau post: après le watermark, au plus lookback_minutes"""
+        now = datetime.now()
+        oldest = now - timedelta(minutes=self.lookback_minutes)
+        if self.watermark is not None and self.watermark > oldest:
+            oldest = self.watermark
+        # ]oldest, now]: jamais égal au watermark
+        return oldest + (now - oldest) * (1 - self.rng.random())
+
+    def _advance_watermark(self, posts: List[SocialPost]):
+        if posts:
+            newest = max(post.created_at for post in posts)
+            if self.watermark is None or newest > self.watermark:
+                self.watermark = newest
+
+
+class CursorStore:
+    """
+    Checkpoint des curseurs {plateforme: curseur}
+
+    Remplacé atomiquement (fichier temporaire + os.replace): un crash
+    pendant l'écriture laisse le checkpoint précédent intact.
+    """
+
+    def __init__(self, path: str):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+
+        self.stats = {
+            'saved': 0,
+            'errors': 0,
+            'last_saved_at': None
+        }
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Curseurs du dernier checkpoint ({} si absent ou illisible)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                cursors = json.load(f).get('cursors', {})
+            self.logger.info(f"📍 Curseurs restaurés: {', '.join(sorted(cursors)) or 'aucun'}")
+            return cursors
+        except (OSError, ValueError, AttributeError) as e:
+            self.stats['errors'] += 1
+            self.logger.warning(f"⚠️  Checkpoint des curseurs illisible, collecte complète - {e}")
+            return {}
+
+    def save(self, cursors: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Écrit le checkpoint (atomique)
+
+        Returns:
+            False en cas d'erreur (loggée, l'ancien checkpoint est conservé)
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.cursors-', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'saved_at': datetime.now().isoformat(), 'cursors': cursors}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"❌ Checkpoint des curseurs impossible - {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+        self.stats['saved'] += 1
+        self.stats['last_saved_at'] = datetime.now().isoformat()
+        return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {'path': self.path, **self.stats}
@@ -0,0 +1,190 @@
+"""
+FILE COLLECTOR - LECTURE NDJSON MEMORY-MAPPED
+==============================================
+
+Responsabilités:
+1. Mapper en mémoire (mmap) un fichier NDJSON de plusieurs Go
+2. Le découper en plages d'octets alignées sur les fins de ligne
+3. Parser les plages en parallèle (ProcessPoolExecutor)
+4. Produire des batches de SocialPost à la demande (générateur),
+   sans jamais matérialiser le fichier complet
+
+Technique clé: mmap + plages alignées + nombre borné de plages en vol
+"""
+
+import logging
+import mmap
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from src.core.models.social_data import SocialPost
+from src.data.collectors.ndjson_reader import NDJSONParseError, parse_post_line
+
+
+class NDJSONFileCollector:
+    """
+    Collecteur de posts depuis un fichier NDJSON (non compressé)
+
+    La mémoire utilisée est bornée par chunk_bytes × plages en vol,
+    quelle que soit la taille du fichier.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000,
+                 chunk_bytes: int = 8 * 1024 * 1024,
+                 processes: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.batch_size = batch_size
+        self.chunk_bytes = chunk_bytes
+        self.processes = processes if processes is not None else (os.cpu_count() or 1)
+        self.executor = executor
+
+        self.errors: List[str] = []
+        self.stats = {
+            'ranges': 0,
+            'bytes': 0,
+            'posts': 0,
+            'errors': 0
+        }
+
+    def split_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Découpe le fichier en plages [début, fin) alignées sur '\\n'
+
+        Chaque plage fait environ chunk_bytes et se termine juste après
+        une fin de ligne (ou en fin de fichier).
+        """
+        size = os.path.getsize(self.path)
+        if size == 0:
+            return []
+
+        ranges = []
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = min(start + self.chunk_bytes, size)
+                if end < size:
+                    newline = mm.find(b'\n', end - 1)
+                    end = size if newline == -1 else newline + 1
+                ranges.append((start, end))
+                start = end
+
+        self.stats['bytes'] = size
+        return ranges
+
+    def iter_batches(self) -> Iterator[List[SocialPost]]:
+        """
+        Générateur de batches de SocialPost (ordre du fichier)
+
+        Les plages sont parsées en parallèle; au plus 2 × processes
+        plages sont en vol à un instant donné.
+        """
+        ranges = self.split_ranges()
+        self.stats['ranges'] = len(ranges)
+
+        if not ranges:
+            return
+
+        if self.executor is None and self.processes <= 1:
+            for start, end in ranges:
+                yield from self._batches(_parse_range(self.path, start, end))
+            return
+
+        executor = self.executor or ProcessPoolExecutor(max_workers=self.processes)
+        max_in_flight = 2 * self.processes
+        try:
+            pending = deque()
+            remaining = iter(ranges)
+
+            for start, end in remaining:
+                pending.append(executor.submit(_parse_range, self.path, start, end))
+                if len(pending) >= max_in_flight:
+                    break
+
+            while pending:
+                result = pending.popleft().result()
+
+                # Remplacer la plage consommée par la suivante
+                next_range = next(remaining, None)
+                if next_range is not None:
+                    pending.append(executor.submit(_parse_range, self.path, *next_range))
+
+                yield from self._batches(result)
+        finally:
+            if self.executor is None:
+                executor.shutdown(cancel_futures=True)
+
+    def _batches(self, result: Tuple[List[SocialPost], List[str]]) -> Iterator[List[SocialPost]]:
+        """Découpe le résultat d'une plage en batches"""
+        posts, errors = result
+        self.stats['posts'] += len(posts)
+        self.stats['errors'] += len(errors)
+        self.errors.extend(errors)
+
+        for i in range(0, len(posts), self.batch_size):
+            yield posts[i:i + self.batch_size]
+
+
+# ============================================
+# FONCTION WORKER (PROCESSUS SÉPARÉ)
+# ============================================
+
+def _parse_range(path: str, start: int, end: int) -> Tuple[List[SocialPost], List[str]]:
+    """
+    Parse les lignes d'une plage d'octets du fichier
+
+    Returns:
+        (posts, erreurs) - erreurs repérées par offset d'octet
+    """
+    posts = []
+    errors = []
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        position = start
+        while position < end:
+            newline = mm.find(b'\n', position, end)
+            line_end = end if newline == -1 else newline + 1
+
+            try:
+                post = parse_post_line(mm[position:line_end])
+                if post is not None:
+                    posts.append(post)
+            except NDJSONParseError as e:
+                errors.append(f"octet {position}: {e.message}")
+
+            position = line_end
+
+    return posts, errors
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m src.data.collectors.file_collector fichier.ndjson")
+        sys.exit(1)
+
+    collector = NDJSONFileCollector(sys.argv[1])
+
+    start = time.time()
+    total = 0
+    for batch in collector.iter_batches():
+        total += len(batch)
+    elapsed = time.time() - start
+
+    print(f"\n✅ {total} posts lus en {elapsed:.2f}s ({total / elapsed:.0f} posts/sec)")
+    print(f"📦 Plages: {collector.stats['ranges']} | Octets: {collector.stats['bytes']:,}")
+    print(f"⚠️  Erreurs: {collector.stats['errors']}")
@@ -11,15 +11,18 @@ Structure identique à Twitter Collector avec:
 
 import logging
 import random
-from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+from src.data.collectors.cursors import SimulatedCursorMixin
+from src.data.collectors.registry import ShardMixin
 
 
-class DynamicInstagramCollector:
+class DynamicInstagramCollector(SimulatedCursorMixin, ShardMixin):
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
+        # Générateur propre au collecteur: seed fixée = collecte reproductible
+        self.rng = random.Random(seed)
         self.iteration = 0
         self.post_id = 0
         self.trending_topics = []
@@ -122,89 +125,90 @@ class DynamicInstagramCollector:
             self.logger.info(f"🔥 Instagram Event: {event['name']}")
         
         #  posts par catégorie business
-        for category, templates in self.instagram_captions.items():
+        for category, templates in self.shard_items(self.instagram_captions.items()):
             base_ratio = 0.5
             positive_ratio = max(0.0, min(1.0, base_ratio + event['sentiment_shift']))
-            posts_per_category = random.randint(11, 17)
+            posts_per_category = self.rng.randint(11, 17)
             for i in range(posts_per_category):
-                is_positive = random.random() < positive_ratio
-                content = random.choice(templates['positive' if is_positive else 'negative'])
+                is_positive = self.rng.random() < positive_ratio
+                content = self.rng.choice(templates['positive' if is_positive else 'negative'])
                 
                 # Métriques réalistes Instagram (plus de likes, moins de comments que Twitter)
-                base_likes = random.randint(1000, 50000)  # Instagram a généralement plus de likes
+                base_likes = self.rng.randint(1000, 50000)  # Instagram a généralement plus de likes
                 if event['viral']:
-                    base_likes *= random.randint(3, 15)  # Reels viraux peuvent exploser
+                    base_likes *= self.rng.randint(3, 15)  # Reels viraux peuvent exploser
                 
                 # Type de post Instagram (Feed, Reels, Stories)
-                post_type = random.choice(['feed', 'reels', 'carousel'])
+                post_type = self.rng.choice(['feed', 'reels', 'carousel'])
                 
                 post = SocialPost(
                     id=f"instagram_{self.iteration}_{self.post_id}",
                     platform=Platform.INSTAGRAM,
                     content=content,
-                    author=f"@{random.choice(['fashion', 'tech', 'lifestyle', 'travel'])}{random.randint(100, 9999)}",
-                    author_followers=random.randint(10000, 1000000),  # Instagram a généralement plus de followers
-                    created_at=datetime.now() - timedelta(minutes=random.randint(1, 30)),
+                    author=f"@{self.rng.choice(['fashion', 'tech', 'lifestyle', 'travel'])}{self.rng.randint(100, 9999)}",
+                    author_followers=self.rng.randint(10000, 1000000),  # Instagram a généralement plus de followers
+                    created_at=self._new_post_time(),
                     url=f"https://instagram.com/p/IG_{self.post_id}",
                     metrics={
                         'likes': base_likes,
-                        'comments': base_likes // random.randint(50, 200),  # Ratio comments/likes plus bas sur IG
-                        'saves': base_likes // random.randint(10, 30),      # Unique à Instagram
-                        'shares': base_likes // random.randint(100, 500),   # Shares (DM)
-                        'views': base_likes * random.randint(3, 10) if post_type == 'reels' else 0
+                        'comments': base_likes // self.rng.randint(50, 200),  # Ratio comments/likes plus bas sur IG
+                        'saves': base_likes // self.rng.randint(10, 30),      # Unique à Instagram
+                        'shares': base_likes // self.rng.randint(100, 500),   # Shares (DM)
+                        'views': base_likes * self.rng.randint(3, 10) if post_type == 'reels' else 0
                     },
                     category=category,
                     metadata={
                         'iteration': self.iteration,
                         'event': event['name'],
                         'post_type': post_type,
-                        'has_story': random.choice([True, False]),
+                        'has_story': self.rng.choice([True, False]),
                         'has_reels': post_type == 'reels',
-                        'filter_used': random.choice(['none', 'clarendon', 'gingham', 'lark', 'moon'])
+                        'filter_used': self.rng.choice(['none', 'clarendon', 'gingham', 'lark', 'moon'])
                     }
                 )
                 
                 posts.append(post)
                 self.post_id += 1
         
+        self._advance_watermark(posts)
         return posts
     
     def _get_instagram_event_type(self) -> dict:
-        rand = random.random()
+        rand = self.rng.random()
     
         # 10% événements très positifs
         if rand < 0.10:
             return {
-                'name': random.choice(['Viral Success', 'Product Launch', 'Award']),
-                'sentiment_shift': random.uniform(0.5, 0.8), 
-                'viral_multiplier': random.uniform(5.0, 10.0),
+                'name': self.rng.choice(['Viral Success', 'Product Launch', 'Award']),
+                'sentiment_shift': self.rng.uniform(0.5, 0.8), 
+                'viral_multiplier': self.rng.uniform(5.0, 10.0),
                 'viral': True
             }
         
         # 15% événements positifs
         elif rand < 0.25:
             return {
-                'name': random.choice(['Partnership', 'Review', 'Update']),
-                'sentiment_shift': random.uniform(0.2, 0.4),  
-                'viral_multiplier': random.uniform(2.0, 4.0),
+                'name': self.rng.choice(['Partnership', 'Review', 'Update']),
+                'sentiment_shift': self.rng.uniform(0.2, 0.4),  
+                'viral_multiplier': self.rng.uniform(2.0, 4.0),
                 'viral': True
             }
         
         # 10% événements très négatifs
         elif rand < 0.35:
             return {
-                'name': random.choice(['Data Breach', 'Scandal', 'Layoffs']),
-                'sentiment_shift': random.uniform(-0.8, -0.5), 
-                'viral_multiplier': random.uniform(6.0, 12.0),
+                'name': self.rng.choice(['Data Breach', 'Scandal', 'Layoffs']),
+                'sentiment_shift': self.rng.uniform(-0.8, -0.5), 
+                'viral_multiplier': self.rng.uniform(6.0, 12.0),
                 'viral': True
             }
         
         # 15% événements négatifs
         elif rand < 0.50:
             return {
-                'name': random.choice(['Outage', 'Price Hike', 'Complaints']),
-                'sentiment_shift': random.uniform(-0.5, -0.3),  
-                'viral_multiplier': random.uniform(3.0, 6.0),
+                'name': self.rng.choice(['Outage', 'Price Hike', 'Complaints']),
+                'sentiment_shift': self.rng.uniform(-0.5, -0.3),  
+                'viral_multiplier': self.rng.uniform(3.0, 6.0),
                 'viral': True
             }
         
@@ -212,7 +216,7 @@ class DynamicInstagramCollector:
         else:
             return {
                 'name': 'normal',
-                'sentiment_shift': random.uniform(-0.15, 0.15), 
+                'sentiment_shift': self.rng.uniform(-0.15, 0.15), 
                 'viral_multiplier': 1.0,
                 'viral': False
             }
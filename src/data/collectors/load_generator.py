@@ -0,0 +1,490 @@
+"""
+LOAD GENERATOR - CHARGE SYNTHÉTIQUE DÉTERMINISTE
+=================================================
+
+Responsabilités:
+1. Produire des posts au format des collecteurs simulés, en volume
+   (millions de posts par minute) pour les tests de charge
+2. Réutiliser leurs banques de templates et leurs modèles d'événements
+   (_get_event_modifier / _get_event_type / _get_instagram_event_type)
+3. Tirer toutes les métriques en vectoriel (NumPy) au lieu d'appels
+   random.randint / random.choice par post
+4. Être reproductible: même seed → mêmes posts (start_time fixé)
+5. Respecter un débit cible et un mix de plateformes configurables
+
+Un événement est tiré tous les `event_every` posts d'une plateforme
+(≈ 1 collecte simulée), avec le générateur seedé du collecteur.
+
+Usage:
+    generator = LoadGenerator(seed=42, rate=50_000, mix={'reddit': 0.4, 'twitter': 0.6})
+    for batch in generator.stream(duration=60):
+        posts = batch.to_posts()
+"""
+
+import argparse
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+from src.core.models.post_batch import PostBatch, CATEGORIES, PLATFORMS, to_microseconds
+from src.data.collectors.reddit_collector import DynamicRedditCollector
+from src.data.collectors.twitter_collector import DynamicTwitterCollector
+from src.data.collectors.instagram_collector import DynamicInstagramCollector
+from src.data.collectors.tiktok_collector import DynamicTikTokCollector
+
+
+@dataclass
+class PlatformModel:
+    """Collecteur simulé d'une plateforme: templates + modèle d'événements"""
+    collector: type
+    templates: str  # attribut: {catégorie: {'positive': [...], 'negative': [...]}}
+    event: str  # méthode: tirage d'un événement
+    base_positive_ratio: float
+
+
+PLATFORM_MODELS = {
+    Platform.REDDIT: PlatformModel(DynamicRedditCollector, 'post_templates', '_get_event_modifier', 0.6),
+    Platform.TWITTER: PlatformModel(DynamicTwitterCollector, 'tweet_templates', '_get_event_type', 0.3),
+    Platform.INSTAGRAM: PlatformModel(DynamicInstagramCollector, 'instagram_captions',
+                                      '_get_instagram_event_type', 0.5),
+    Platform.TIKTOK: PlatformModel(DynamicTikTokCollector, 'tiktok_templates', '_get_event_modifier', 0.5),
+}
+
+DEFAULT_MIX = {'reddit': 0.25, 'twitter': 0.25, 'instagram': 0.25, 'tiktok': 0.25}
+
+
+# ============================================
+# MÉTRIQUES VECTORISÉES (mêmes lois que les collecteurs)
+# ============================================
+
+def _reddit_metrics(rng: np.random.Generator, n: int, multiplier: np.ndarray, viral: np.ndarray) -> Dict[str, np.ndarray]:
+    upvotes = rng.integers(100, 5001, n)
+    upvotes = np.where(multiplier > 1, (upvotes * multiplier).astype(np.int64), upvotes)
+    return {
+        'upvotes': upvotes,
+        'comments': rng.integers(10, 301, n),
+        'awards': rng.integers(0, 11, n)
+    }
+
+
+def _twitter_metrics(rng: np.random.Generator, n: int, multiplier: np.ndarray, viral: np.ndarray) -> Dict[str, np.ndarray]:
+    likes = rng.integers(50, 5001, n)
+    likes = np.where(viral, likes * rng.integers(2, 11, n), likes)
+    return {
+        'likes': likes,
+        'retweets': likes // rng.integers(5, 11, n),
+        'replies': likes // rng.integers(10, 21, n),
+        'quotes': likes // rng.integers(20, 51, n)
+    }
+
+
+def _instagram_metrics(rng: np.random.Generator, n: int, multiplier: np.ndarray, viral: np.ndarray) -> Dict[str, np.ndarray]:
+    likes = rng.integers(1000, 50001, n)
+    likes = np.where(viral, likes * rng.integers(3, 16, n), likes)
+    reels = rng.integers(0, 3, n) == 1  # feed / reels / carousel
+    return {
+        'likes': likes,
+        'comments': likes // rng.integers(50, 201, n),
+        'saves': likes // rng.integers(10, 31, n),
+        'shares': likes // rng.integers(100, 501, n),
+        'views': np.where(reels, likes * rng.integers(3, 11, n), 0)
+    }
+
+
+def _tiktok_metrics(rng: np.random.Generator, n: int, multiplier: np.ndarray, viral: np.ndarray) -> Dict[str, np.ndarray]:
+    views = rng.integers(10000, 1000001, n)
+    views = np.where(viral, (views * multiplier).astype(np.int64), views)
+    return {
+        'likes': (views * rng.uniform(0.05, 0.15, n)).astype(np.int64),
+        'comments': (views * rng.uniform(0.005, 0.015, n)).astype(np.int64),
+        'shares': (views * rng.uniform(0.002, 0.008, n)).astype(np.int64),
+        'views': views
+    }
+
+
+# plateforme → (métriques, préfixe auteur, followers min, followers max)
+PLATFORM_METRICS: Dict[Platform, Any] = {
+    Platform.REDDIT: (_reddit_metrics, 'u/redditor_', 5000, 50000),
+    Platform.TWITTER: (_twitter_metrics, '@user', 1000, 100000),
+    Platform.INSTAGRAM: (_instagram_metrics, '@creator', 10000, 1000000),
+    Platform.TIKTOK: (_tiktok_metrics, '@tiktok', 10000, 1000000),
+}
+
+
+# ============================================
+# BATCH COLONNAIRE
+# ============================================
+
+@dataclass
+class GeneratedBatch:
+    """
+    Posts d'une plateforme sous forme de colonnes NumPy
+
+    Les objets SocialPost ne sont construits qu'à la demande
+    (to_posts / iter_posts / lignes de to_post_batch): la génération
+    seule reste vectorielle.
+    """
+    platform: Platform
+    first_id: int
+    contents: List[str]  # table des templates de la plateforme
+    categories: List[BusinessCategory]  # table des catégories
+    content_index: np.ndarray
+    category_index: np.ndarray
+    author: np.ndarray
+    followers: np.ndarray
+    created_at: np.ndarray  # secondes depuis start_time
+    metrics: Dict[str, np.ndarray]
+    events: List[str]  # table des événements
+    event_index: np.ndarray
+    start_time: datetime
+
+    def __len__(self) -> int:
+        return len(self.content_index)
+
+    def _post(self, offset: int, content: int, category: int, author: int, followers: int,
+              created: float, event: int, metrics: Dict[str, int]) -> SocialPost:
+        platform = self.platform
+        post_id = self.first_id + offset
+        return SocialPost(
+            id=f"load_{platform.value}_{post_id}",
+            platform=platform,
+            content=self.contents[content],
+            author=f"{PLATFORM_METRICS[platform][1]}{author}",
+            author_followers=followers,
+            created_at=self.start_time + timedelta(seconds=created),
+            url=f"https://{platform.value}.example/load/{post_id}",
+            metrics=metrics,
+            category=self.categories[category],
+            metadata={'event': self.events[event], 'load_test': True}
+        )
+
+    def iter_posts(self) -> Iterator[SocialPost]:
+        metric_names = list(self.metrics)
+        metric_rows = zip(*(column.tolist() for column in self.metrics.values()))
+
+        for offset, (content, category, author, followers, created, event, values) in enumerate(zip(
+                self.content_index.tolist(), self.category_index.tolist(), self.author.tolist(),
+                self.followers.tolist(), self.created_at.tolist(), self.event_index.tolist(), metric_rows)):
+            yield self._post(offset, content, category, author, followers, created, event,
+                             dict(zip(metric_names, values)))
+
+    def _post_at(self, offset: int) -> SocialPost:
+        return self._post(
+            offset, int(self.content_index[offset]), int(self.category_index[offset]),
+            int(self.author[offset]), int(self.followers[offset]), float(self.created_at[offset]),
+            int(self.event_index[offset]),
+            {name: int(column[offset]) for name, column in self.metrics.items()}
+        )
+
+    def to_posts(self) -> List[SocialPost]:
+        return list(self.iter_posts())
+
+    def to_post_batch(self) -> PostBatch:
+        """
+        Batch du pipeline: colonnes reprises du générateur, SocialPost
+        construit au premier accès à sa ligne
+        """
+        n = len(self)
+        platform = self.platform
+        prefix = PLATFORM_METRICS[platform][1]
+        category_codes = np.array([CATEGORIES.index(c) for c in self.categories], dtype=np.uint8)
+        ids = range(self.first_id, self.first_id + n)
+
+        def text(values) -> np.ndarray:
+            column = np.empty(n, dtype=object)
+            column[:] = list(values)
+            return column
+
+        columns = {
+            'platform': np.full(n, PLATFORMS.index(platform), dtype=np.uint8),
+            'category': category_codes[self.category_index],
+            'sentiment': np.full(n, -1, dtype=np.int8),
+            'created_at': to_microseconds(self.start_time) + np.round(self.created_at * 1e6).astype(np.int64),
+            'author_followers': self.followers.astype(np.int64),
+            'sentiment_score': np.full(n, np.nan),
+            'engagement_rate': np.full(n, np.nan),
+            'business_potential': np.full(n, -1, dtype=np.int16),
+            'id': text(f"load_{platform.value}_{i}" for i in ids),
+            'content': np.array(self.contents, dtype=object)[self.content_index],
+            'author': text(f"{prefix}{a}" for a in self.author.tolist()),
+            'url': text(f"https://{platform.value}.example/load/{i}" for i in ids),
+        }
+        return PostBatch(columns, metrics=self.metrics, row_factory=self._post_at)
+
+
+# ============================================
+# GÉNÉRATEUR
+# ============================================
+
+class _PlatformStream:
+    """Flux d'une plateforme: templates aplatis + collecteur seedé pour les événements"""
+
+    def __init__(self, platform: Platform, seed: int):
+        model = PLATFORM_MODELS[platform]
+        self.platform = platform
+        self.model = model
+        self.collector = model.collector(seed=seed)
+        self.draw_event: Callable[[], dict] = getattr(self.collector, model.event)
+
+        banks = getattr(self.collector, model.templates)
+        self.categories = list(banks)
+        self.contents: List[str] = []
+        # [catégorie, sentiment(0=négatif, 1=positif)] → (début, taille) dans self.contents
+        self.offsets = np.zeros((len(self.categories), 2), dtype=np.int64)
+        self.sizes = np.zeros((len(self.categories), 2), dtype=np.int64)
+        for c, category in enumerate(self.categories):
+            for s, sentiment in enumerate(('negative', 'positive')):
+                self.offsets[c, s] = len(self.contents)
+                self.sizes[c, s] = len(banks[category][sentiment])
+                self.contents.extend(banks[category][sentiment])
+
+        self.events: List[str] = []
+        self.event_ids: Dict[str, int] = {}
+        self.next_id = 0
+
+
+class LoadGenerator:
+    """
+    Générateur de charge seedé
+
+    Args:
+        seed: graine (NumPy + collecteurs)
+        rate: posts/seconde visés par stream() (None = au plus vite)
+        mix: part de chaque plateforme ({'reddit': 0.5, ...}, normalisé)
+        batch_size: posts par batch (toutes plateformes)
+        event_every: posts d'une plateforme par événement tiré
+        authors: taille de l'espace des auteurs (grand: peu de doublons de contenu)
+        start_time: date du premier post (fixée = reproductible)
+    """
+
+    def __init__(self, seed: int = 42, rate: Optional[float] = None,
+                 mix: Optional[Dict[str, float]] = None, batch_size: int = 10000,
+                 event_every: int = 50, authors: int = 1_000_000,
+                 start_time: Optional[datetime] = None):
+        self.logger = logging.getLogger(__name__)
+        self.seed = seed
+        self.rate = rate
+        self.batch_size = batch_size
+        self.event_every = event_every
+        self.authors = authors
+        self.start_time = start_time or datetime.now()
+
+        mix = mix or DEFAULT_MIX
+        total = sum(mix.values())
+        if total <= 0:
+            raise ValueError("Mix de plateformes vide")
+        self.platforms = [Platform(name) for name, weight in mix.items() if weight > 0]
+        self.weights = np.array([mix[p.value] / total for p in self.platforms])
+
+        self.rng = np.random.default_rng(seed)
+        self.streams = {
+            platform: _PlatformStream(platform, seed * 1000 + index)
+            for index, platform in enumerate(self.platforms)
+        }
+        self.generated = 0
+
+        self.stats = {
+            'batches': 0,
+            'posts': 0,
+            'generation_time': 0.0,
+            'throttle_time': 0.0
+        }
+
+    def _platform_batch(self, stream: _PlatformStream, n: int, first_offset: int) -> GeneratedBatch:
+        rng = self.rng
+        model = stream.model
+
+        # 1 événement par segment de event_every posts
+        segments = -(-n // self.event_every)
+        shifts = np.empty(segments)
+        multipliers = np.empty(segments)
+        virals = np.empty(segments, dtype=bool)
+        event_index = np.empty(segments, dtype=np.int64)
+        for i in range(segments):
+            event = stream.draw_event()
+            shifts[i] = event['sentiment_shift']
+            multipliers[i] = event['viral_multiplier']
+            virals[i] = event.get('viral', event.get('is_viral', event['viral_multiplier'] > 1))
+            if event['name'] not in stream.event_ids:
+                stream.event_ids[event['name']] = len(stream.events)
+                stream.events.append(event['name'])
+            event_index[i] = stream.event_ids[event['name']]
+
+        def per_post(values: np.ndarray) -> np.ndarray:
+            return np.repeat(values, self.event_every)[:n]
+
+        positive_ratio = np.clip(model.base_positive_ratio + per_post(shifts), 0.0, 1.0)
+        category = rng.integers(0, len(stream.categories), n)
+        sentiment = (rng.random(n) < positive_ratio).astype(np.int64)
+        content = stream.offsets[category, sentiment] + (
+            rng.random(n) * stream.sizes[category, sentiment]
+        ).astype(np.int64)
+
+        metrics_fn, _, followers_min, followers_max = PLATFORM_METRICS[stream.platform]
+        metrics = metrics_fn(rng, n, per_post(multipliers), per_post(virals))
+
+        # Dates: espacées selon le débit visé (1 ms par post si illimité)
+        spacing = 1.0 / self.rate if self.rate else 0.001
+        created_at = (first_offset + np.arange(n)) * spacing + rng.uniform(0, 1, n)
+
+        batch = GeneratedBatch(
+            platform=stream.platform,
+            first_id=stream.next_id,
+            contents=stream.contents,
+            categories=stream.categories,
+            content_index=content,
+            category_index=category,
+            author=rng.integers(0, self.authors, n),
+            followers=rng.integers(followers_min, followers_max + 1, n),
+            created_at=created_at,
+            metrics=metrics,
+            events=stream.events,
+            event_index=per_post(event_index),
+            start_time=self.start_time
+        )
+        stream.next_id += n
+        return batch
+
+    def generate(self, n: Optional[int] = None) -> List[GeneratedBatch]:
+        """n posts (batch_size par défaut) répartis selon le mix (1 batch par plateforme)"""
+        n = self.batch_size if n is None else n
+        start = time.perf_counter()
+
+        counts = self.rng.multinomial(n, self.weights)
+        batches = []
+        offset = self.generated
+        for platform, count in zip(self.platforms, counts.tolist()):
+            if count:
+                batches.append(self._platform_batch(self.streams[platform], count, offset))
+        self.generated += n
+
+        self.stats['batches'] += len(batches)
+        self.stats['posts'] += n
+        self.stats['generation_time'] += time.perf_counter() - start
+        return batches
+
+    def stream(self, duration: Optional[float] = None,
+               total: Optional[int] = None) -> Iterator[GeneratedBatch]:
+        """
+        Batches au débit visé jusqu'à `duration` secondes ou `total` posts
+
+        En avance sur le débit: pause; en retard: pas de rattrapage
+        au-delà du batch courant (débit max = vitesse de génération).
+        """
+        start = time.monotonic()
+        produced = 0
+        while (duration is None or time.monotonic() - start < duration) and \
+                (total is None or produced < total):
+            n = self.batch_size if total is None else min(self.batch_size, total - produced)
+            for batch in self.generate(n):
+                yield batch
+            produced += n
+
+            if self.rate:
+                ahead = produced / self.rate - (time.monotonic() - start)
+                if ahead > 0:
+                    self.stats['throttle_time'] += ahead
+                    time.sleep(ahead)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        generation_time = self.stats['generation_time']
+        return {
+            **self.stats,
+            'seed': self.seed,
+            'rate': self.rate,
+            'mix': dict(zip((p.value for p in self.platforms), self.weights.round(3).tolist())),
+            'posts_per_minute': int(self.stats['posts'] / generation_time * 60) if generation_time else 0
+        }
+
+
+class LoadGeneratorCollector:
+    """
+    Remplace le MasterCollector pour tester le pipeline en charge
+
+    Exemple:
+        pipeline = Pipeline(collector=LoadGeneratorCollector(LoadGenerator(seed=1), posts_per_cycle=100_000))
+    """
+
+    def __init__(self, generator: LoadGenerator, posts_per_cycle: int = 10000):
+        self.generator = generator
+        self.posts_per_cycle = posts_per_cycle
+        self.last_cycle: Dict[str, Any] = {}
+
+    def collect_all_platforms_parallel(self) -> PostBatch:
+        start = time.time()
+        batches = self.generator.generate(self.posts_per_cycle)
+        posts = PostBatch.concat(batch.to_post_batch() for batch in batches)
+        self.last_cycle = {
+            'platforms': {batch.platform.value: {'status': 'ok', 'posts': len(batch)} for batch in batches},
+            'stale_platforms': [],
+            'complete': True,
+            'duration': round(time.time() - start, 2)
+        }
+        return posts
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {'load_generator': self.generator.get_statistics(), 'last_cycle': self.last_cycle}
+
+    def close(self):
+        pass
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'reddit=0.4,twitter=0.6' → {'reddit': 0.4, 'twitter': 0.6}"""
+    mix = {}
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        name, _, weight = item.partition('=')
+        mix[name.strip().lower()] = float(weight or 1)
+    return mix
+
+
+# ============================================
+# CLI
+# ============================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Générateur de charge synthétique")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--rate', type=float, default=0, help="posts/s (0 = au plus vite)")
+    parser.add_argument('--posts', type=int, default=2_000_000)
+    parser.add_argument('--mix', default='reddit=0.25,twitter=0.25,instagram=0.25,tiktok=0.25')
+    parser.add_argument('--batch-size', type=int, default=100_000)
+    parser.add_argument('--materialize', type=int, default=100_000,
+                        help="posts convertis en SocialPost (mesure séparée)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    start_time = datetime(2024, 1, 1)
+
+    generator = LoadGenerator(seed=args.seed, rate=args.rate or None, mix=parse_mix(args.mix),
+                              batch_size=args.batch_size, start_time=start_time)
+    start = time.time()
+    batches = list(generator.stream(total=args.posts))
+    elapsed = time.time() - start
+    print(f"\n⚡ {args.posts:,} posts générés en {elapsed:.2f}s "
+          f"→ {int(args.posts / elapsed * 60):,} posts/min (colonnes)")
+
+    materialized = 0
+    start = time.time()
+    for batch in batches:
+        for _ in batch.iter_posts():
+            materialized += 1
+            if materialized >= args.materialize:
+                break
+        if materialized >= args.materialize:
+            break
+    elapsed = time.time() - start
+    print(f"🧱 {materialized:,} SocialPost construits en {elapsed:.2f}s "
+          f"→ {int(materialized / elapsed * 60):,} posts/min")
+
+    # Reproductibilité: même seed → mêmes posts
+    first = LoadGenerator(seed=args.seed, mix=parse_mix(args.mix), start_time=start_time).generate(1000)
+    again = LoadGenerator(seed=args.seed, mix=parse_mix(args.mix), start_time=start_time).generate(1000)
+    same = [p.to_dict() for b in first for p in b.iter_posts()] == [p.to_dict() for b in again for p in b.iter_posts()]
+    print(f"🔁 Reproductible (seed {args.seed}): {'✅' if same else '❌'}")
+    print(f"📊 {generator.get_statistics()}")
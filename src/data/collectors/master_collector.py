@@ -3,28 +3,35 @@ MASTER COLLECTOR - ORCHESTRATEUR MULTIPROCESSING
 =================================================
 
 Responsabilités:
-1. Créer 4 processus parallèles (1 par plateforme)
-2. Synchroniser la collecte simultanée
-3. Agréger les résultats
-4. Gérer les erreurs et timeouts
-5. Calculer les métriques de performance
+1. Lire les sources déclarées (CollectorRegistry: config + entry points)
+2. Planifier les processus: 1 minimum par source, plus pour les sources
+   qui déclarent du parallélisme, dans un budget de processus
+3. Garder ces processus persistants; collect_all_platforms_parallel
+   lance toutes les sources, collect_due seulement celles dont la
+   période est écoulée (période adaptée à l'activité de chaque source:
+   AdaptivePollingPolicy)
+4. Agréger les résultats (partiels si une source est en retard)
+5. Gérer les erreurs et timeouts par source (CollectorSupervisor)
+6. Calculer les métriques de performance
+7. Checkpointer les curseurs des sources après chaque cycle réussi
+   (collecte incrémentale, reprise après redémarrage)
 
-Technique clé: ProcessPoolExecutor
+Technique clé: multiprocessing supervisé (1 processus + 1 échéance par
+part de source)
 """
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
-from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError
+from typing import List, Dict, Any, Optional
 import time
 import multiprocessing
-from collections import Counter
 
-from src.core.models.social_data import SocialPost, Platform, BusinessCategory
-from src.data.collectors.reddit_collector import DynamicRedditCollector
-from src.data.collectors.twitter_collector import DynamicTwitterCollector
-from src.data.collectors.instagram_collector import DynamicInstagramCollector
-from src.data.collectors.tiktok_collector import DynamicTikTokCollector
+from src.core.config.settings import config
+from src.core.models.post_batch import PostBatch
+from src.data.collectors.cursors import CursorStore
+from src.data.collectors.polling import AdaptivePollingPolicy, rate_limit_floor
+from src.data.collectors.registry import CollectorRegistry
+from src.data.collectors.supervisor import CollectorSupervisor
 
 
 class MasterCollector:
@@ -32,16 +39,29 @@ class MasterCollector:
     Orchestrateur principal utilisant le VÉRITABLE MULTIPROCESSING
     
     Architecture:
-    - 4 processus OS indépendants (contourne GIL Python)
+    - 1 processus OS indépendant ou plus par source (contourne GIL Python)
     - Chaque processus a sa propre mémoire
-    - Communication via Queue + Pipes
-    - Synchronisation via Future objects
+    - Communication via Pipes (processus persistants)
+    - Échéance par source, redémarrage des processus en panne
     """
     
-    def __init__(self):
+    def __init__(self, registry: Optional[CollectorRegistry] = None,
+                 max_processes: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
         self.cpu_count = multiprocessing.cpu_count()
         
+        # Sources et allocation des processus
+        self.registry = registry or CollectorRegistry.from_config()
+        self.plan = self.registry.plan_workers(
+            max_processes if max_processes is not None else config.collection.max_processes
+        )
+        self.workers = self.registry.worker_functions(self.plan)
+        # Processus → source
+        self.worker_sources = {name: spec.name for name, (spec, _) in self.workers.items()}
+        # Source → prochaine collecte (time.monotonic)
+        self.next_due: Dict[str, float] = {}
+        self.polling = self._create_polling_policy() if config.polling.adaptive else None
+        
         # Statistiques de performance
         self.stats = {
             'total_collections': 0,
@@ -51,78 +71,160 @@ class MasterCollector:
             'error_count': 0
         }
         
+        # Superviseur des processus de collecte (créé au premier cycle)
+        self.supervisor: Optional[CollectorSupervisor] = None
+        self.last_cycle: Dict[str, Any] = {}
+        
+        # Curseurs des sources (reprise là où le dernier cycle s'est arrêté)
+        self.cursor_store = CursorStore(config.collection.cursor_path)
+        
         self.logger.info(f"🎯 Master Collector initialisé")
         self.logger.info(f"⚙️  CPUs disponibles: {self.cpu_count}")
-        self.logger.info(f"🔧 Max workers: min(4, {self.cpu_count}) = {min(4, self.cpu_count)}")
+        self.logger.info(
+            f"🔧 Processus: {len(self.workers)} pour {len(self.plan)} sources "
+            f"({', '.join(f'{name}×{count}' for name, count in self.plan.items())})"
+        )
+    
+    def _create_polling_policy(self) -> AdaptivePollingPolicy:
+        """Période de base: SourceSpec.interval ou période du pipeline"""
+        polling = config.polling
+        policy = AdaptivePollingPolicy(
+            min_interval=polling.min_interval,
+            max_interval=polling.max_interval,
+            fast_alpha=polling.fast_alpha,
+            slow_alpha=polling.slow_alpha,
+            event_factor=polling.event_factor,
+            event_threshold=polling.event_threshold,
+            idle_backoff=polling.idle_backoff,
+            relaxation=polling.relaxation
+        )
+        for name in self.plan:
+            spec = self.registry.specs[name]
+            policy.register(
+                name,
+                base_interval=spec.interval or config.analysis.update_interval,
+                floor=rate_limit_floor(config.rate_limits.limits, name, spec.requests_per_poll)
+            )
+        return policy
+    
+    def _due_sources(self) -> List[str]:
+        """Sources dont la période de collecte est écoulée"""
+        now = time.monotonic()
+        return [name for name in self.plan if self.next_due.get(name, 0.0) <= now]
     
-    def collect_all_platforms_parallel(self) -> List[SocialPost]:
+    def seconds_until_due(self) -> float:
+        """Délai avant la prochaine source à collecter (0 = au moins une à échéance)"""
+        if not self.plan:
+            return float('inf')
+        now = time.monotonic()
+        return max(0.0, min(self.next_due.get(name, 0.0) for name in self.plan) - now)
+    
+    def _schedule(self, sources: List[str]):
+        """Prochaine échéance des sources collectées à ce cycle"""
+        now = time.monotonic()
+        platforms = self.last_cycle.get('platforms', {})
+        for name in sources:
+            spec = self.registry.specs[name]
+            if self.polling is None:
+                self.next_due[name] = now + spec.interval if spec.interval else 0.0
+                continue
+            
+            # Source en échec ou en retard: période inchangée
+            entries = [platforms.get(worker, {}) for worker, source in self.worker_sources.items()
+                       if source == name]
+            done = [entry for entry in entries if entry.get('status') == 'ok']
+            if done:
+                interval = self.polling.observe(
+                    name,
+                    new_items=sum(entry['posts'] for entry in done),
+                    events=sum(entry.get('events', 0) for entry in done),
+                    now=now
+                )
+            else:
+                interval = self.polling.interval(name)
+            self.next_due[name] = now + interval
+            if self.polling.sources[name].event_active:
+                self.logger.info(f"🔥 {name}: événement actif, prochaine collecte dans {interval:.0f}s")
+    
+    def collect_all_platforms_parallel(self) -> PostBatch:
         """
-        COLLECTE PARALLÈLE DES 4 PLATEFORMES
+        COLLECTE PARALLÈLE DE TOUTES LES SOURCES
         
         Flux:
-        1. Créer 4 processus via ProcessPoolExecutor
-        2. Soumettre les tâches de collecte
-        3. Attendre résultats avec timeout 
+        1. Lancer la collecte de chaque source dans ses processus
+        2. Attendre chaque processus jusqu'à l'échéance de sa source
+        3. Garder les résultats arrivés (cycle partiel si retard)
         4. Agréger et retourner
         
+        Les processus sans résultat frais sont listés dans
+        self.last_cycle['stale_platforms'].
+        
         Returns:
-            Liste de SocialPost collectés de toutes plateformes
+            Batch colonnaire des posts collectés de toutes les sources
         """
-        all_posts = []
+        return self._collect_sources(list(self.plan))
+    
+    def collect_due(self) -> PostBatch:
+        """
+        Collecte des seules sources dont la période est écoulée
+        (boucle continue du pipeline, voir seconds_until_due)
+        """
+        return self._collect_sources(self._due_sources())
+    
+    def _collect_sources(self, sources: List[str]) -> PostBatch:
+        """Collecte parallèle des sources données (voir collect_all_platforms_parallel)"""
         start_time = time.time()
         
         self.logger.info("=" * 70)
         self.logger.info("🚀 DÉMARRAGE COLLECTE MULTI-PLATEFORMES (MULTIPROCESSING)")
         self.logger.info("=" * 70)
         
-        # Configuration ProcessPoolExecutor
-        max_workers = min(4, self.cpu_count)
-        try:
-            # CRÉATION DU POOL DE PROCESSUS
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                # SOUMISSION DES TÂCHES (non-bloquant)
-                future_to_platform = {
-                    executor.submit(collect_reddit_wrapper): 'Reddit',
-                    executor.submit(collect_twitter_wrapper): 'Twitter',
-                    executor.submit(collect_instagram_wrapper): 'Instagram',
-                    executor.submit(collect_tiktok_wrapper): 'TikTok',
-                }
-                self.logger.info(f"📡 4 processus lancés en parallèle...")
-                
-                # COLLECTE DES RÉSULTATS (avec timeout)
-                completed = 0
-                for future in as_completed(future_to_platform, timeout=120):
-                    platform_name = future_to_platform[future]
-                    
-                    try:
-                        # Récupérer résultat du processus
-                        platform_posts = future.result(timeout=30)
-                        all_posts.extend(platform_posts)
-                        completed += 1
-                        
-                        # Log succès
-                        self.logger.info(
-                            f"✅ [{completed}/4] {platform_name:12} → "
-                            f"{len(platform_posts):3} posts collectés"
-                        )
-                        
-                        # Mettre à jour statistiques
-                        self._update_platform_stats(platform_name, len(platform_posts))
-                        
-                    except TimeoutError:
-                        self.logger.error(f"⏱️  {platform_name}: TIMEOUT (> 30s)")
-                        self.stats['error_count'] += 1
-                        
-                      
-                        
-                    except Exception as e:
-                        self.logger.error(f"❌ {platform_name}: ERREUR - {e}")
-                        self.stats['error_count'] += 1
-                     
+        # Processus créés au premier cycle puis réutilisés
+        if self.supervisor is None:
+            timeouts = dict(config.collection.platform_timeouts)
+            for name, (spec, _) in self.workers.items():
+                if spec.timeout is not None:
+                    timeouts[name] = spec.timeout
+                elif spec.name in config.collection.platform_timeouts:
+                    timeouts[name] = config.collection.platform_timeouts[spec.name]
+            
+            self.supervisor = CollectorSupervisor(
+                {name: collect for name, (_, collect) in self.workers.items()},
+                timeouts=timeouts,
+                default_timeout=config.collection.default_timeout,
+                hang_timeout=config.collection.hang_timeout,
+                cursors=self.registry.restore_cursors(self.plan, self.cursor_store.load())
+            )
         
-        except Exception as e:
-            self.logger.critical(f"💥 ERREUR CRITIQUE ProcessPoolExecutor: {e}")
-            return []
+        posts, self.last_cycle = self.supervisor.collect_cycle(
+            [name for name, source in self.worker_sources.items() if source in sources]
+        )
+        all_posts = PostBatch.from_posts(posts)
+        self.last_cycle['sources'] = sources
+        self._schedule(sources)
+        
+        # Checkpoint dès qu'une source a livré des posts (les curseurs
+        # des autres sont inchangés)
+        if all_posts:
+            self.cursor_store.save(self.supervisor.cursors())
+        
+        launched = [name for name, entry in self.last_cycle['platforms'].items() if 'status' in entry]
+        completed = 0
+        for platform_name, entry in self.last_cycle['platforms'].items():
+            if entry.get('status') == 'ok':
+                completed += 1
+                self.logger.info(
+                    f"✅ [{completed}/{len(launched)}] {platform_name:12} → "
+                    f"{entry['posts']:3} posts collectés"
+                )
+                self._update_platform_stats(self.worker_sources[platform_name], entry['posts'])
+            elif platform_name in launched:
+                self.stats['error_count'] += 1
+        
+        if self.last_cycle['stale_platforms']:
+            self.logger.warning(
+                f"⚠️  Cycle partiel: {', '.join(self.last_cycle['stale_platforms'])} sans résultat frais"
+            )
         
         # CALCUL DES MÉTRIQUES DE PERFORMANCE
         collection_time = time.time() - start_time
@@ -139,7 +241,7 @@ class MasterCollector:
         return all_posts
     
     def _update_platform_stats(self, platform: str, count: int):
-        """Met à jour les statistiques par plateforme"""
+        """Met à jour les statistiques par source"""
         if platform not in self.stats['platform_stats']:
             self.stats['platform_stats'][platform] = {
                 'total_posts': 0,
@@ -149,7 +251,7 @@ class MasterCollector:
         self.stats['platform_stats'][platform]['total_posts'] += count
         self.stats['platform_stats'][platform]['collections'] += 1
     
-    def _log_performance_metrics(self, posts: List[SocialPost], time_elapsed: float):
+    def _log_performance_metrics(self, posts: PostBatch, time_elapsed: float):
         """Affiche les métriques de performance détaillées"""
         
         self.logger.info("=" * 70)
@@ -161,20 +263,22 @@ class MasterCollector:
         self.logger.info(f"⏱️  Temps total: {time_elapsed:.2f}s")
         self.logger.info(f"⚡ Throughput: {len(posts)/time_elapsed:.1f} posts/sec")
         
-        # Speedup théorique
-        sequential_time = time_elapsed * 4  # Si séquentiel
-        speedup = sequential_time / time_elapsed
-        self.logger.info(f"🚀 Speedup: {speedup:.2f}× (vs séquentiel)")
+        # Speedup: somme des durées des processus (si séquentiel) / temps réel
+        sequential_time = sum(
+            entry.get('duration', 0.0) for entry in self.last_cycle.get('platforms', {}).values()
+        )
+        if sequential_time and time_elapsed:
+            self.logger.info(f"🚀 Speedup: {sequential_time / time_elapsed:.2f}× (vs séquentiel)")
         
         # Distribution par plateforme
-        platform_counts = Counter(post.platform.value for post in posts)
+        platform_counts = posts.platform_counts()
         self.logger.info("📍 Distribution par plateforme:")
         for platform, count in platform_counts.items():
             percentage = (count / len(posts) * 100) if posts else 0
             self.logger.info(f"   • {platform:12} → {count:3} posts ({percentage:.1f}%)")
         
         # Distribution par catégorie
-        category_counts = Counter(post.category.value for post in posts)
+        category_counts = posts.category_counts()
         self.logger.info("🏷️  Distribution par catégorie:")
         for category, count in category_counts.items():
             percentage = (count / len(posts) * 100) if posts else 0
@@ -187,50 +291,19 @@ class MasterCollector:
         return {
             **self.stats,
             'cpu_count': self.cpu_count,
-            'max_workers': min(4, self.cpu_count)
+            'max_workers': len(self.workers),
+            'plan': self.plan,
+            'polling': self.polling.get_statistics() if self.polling is not None else {},
+            'last_cycle': self.last_cycle,
+            'workers': self.supervisor.get_statistics() if self.supervisor is not None else {},
+            'cursors': self.cursor_store.get_statistics()
         }
-
-
-# ============================================
-# FONCTIONS WRAPPER POUR MULTIPROCESSING
-# ============================================
-# Ces fonctions s'exécutent dans des processus séparés
-
-def collect_reddit_wrapper() -> List[SocialPost]:
-    """Process 1: Collecte Reddit"""
-    try:
-        collector = DynamicRedditCollector()
-        return collector.collect_business_data()
-    except Exception as e:
-        logging.error(f"Erreur processus Reddit: {e}")
-        return []
-
-def collect_twitter_wrapper() -> List[SocialPost]:
-    """Process 2: Collecte Twitter"""
-    try:
-        collector = DynamicTwitterCollector()
-        return collector.collect_business_trends()
-    except Exception as e:
-        logging.error(f"Erreur processus Twitter: {e}")
-        return []
-
-def collect_instagram_wrapper() -> List[SocialPost]:
-    """Process 3: Collecte Instagram"""
-    try:
-        collector = DynamicInstagramCollector()
-        return collector.collect_business_posts()
-    except Exception as e:
-        logging.error(f"Erreur processus Instagram: {e}")
-        return []
-
-def collect_tiktok_wrapper() -> List[SocialPost]:
-    """Process 4: Collecte TikTok"""
-    try:
-        collector = DynamicTikTokCollector()
-        return collector.collect_trending_content()
-    except Exception as e:
-        logging.error(f"Erreur processus TikTok: {e}")
-        return []
+    
+    def close(self):
+        """Arrête les processus plateformes"""
+        if self.supervisor is not None:
+            self.supervisor.stop()
+            self.supervisor = None
 
 
 # ============================================
@@ -0,0 +1,168 @@
+"""
+NDJSON READER - PARSING INCRÉMENTAL DE POSTS
+=============================================
+
+Responsabilités:
+1. Lire un flux NDJSON ligne par ligne (jamais en entier en mémoire)
+2. Convertir chaque ligne en SocialPost
+3. Regrouper les posts en batches de taille fixe
+4. Collecter les erreurs de parsing sans interrompre le flux
+
+Format: un objet JSON par ligne (voir SocialPost.to_dict)
+Archives supportées: .gz, .bz2, .xz, .zip (membres .ndjson/.jsonl)
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import os
+import zipfile
+from contextlib import closing
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from src.core.models.social_data import SocialPost
+
+
+class NDJSONParseError(ValueError):
+    """Ligne NDJSON invalide"""
+
+    def __init__(self, line_number: int, message: str):
+        super().__init__(f"ligne {line_number}: {message}")
+        self.line_number = line_number
+        self.message = message
+
+
+def parse_post_line(line: bytes, line_number: int = 0) -> Optional[SocialPost]:
+    """
+    Parse une ligne NDJSON
+
+    Returns:
+        SocialPost, ou None pour une ligne vide
+
+    Raises:
+        NDJSONParseError: JSON invalide ou post incomplet
+    """
+    line = line.strip()
+    if not line:
+        return None
+
+    try:
+        data = json.loads(line)
+    except ValueError as e:
+        raise NDJSONParseError(line_number, f"JSON invalide ({e})") from None
+
+    if not isinstance(data, dict):
+        raise NDJSONParseError(line_number, "objet JSON attendu")
+
+    try:
+        return SocialPost.from_dict(data)
+    except (ValueError, TypeError, OverflowError) as e:
+        raise NDJSONParseError(line_number, str(e)) from None
+
+
+def iter_post_batches(stream: BinaryIO, batch_size: int = 500,
+                      max_line_bytes: int = 65536,
+                      errors: Optional[List[NDJSONParseError]] = None
+                      ) -> Iterator[Tuple[int, List[SocialPost]]]:
+    """
+    Lecture incrémentale d'un flux NDJSON en batches de SocialPost
+
+    Seul le batch courant est en mémoire. Les lignes invalides (ou plus
+    longues que max_line_bytes) sont ajoutées à `errors` et ignorées.
+
+    Yields:
+        (numéro de la première ligne du batch, posts du batch)
+    """
+    batch: List[SocialPost] = []
+    batch_start = 1
+    line_number = 0
+
+    while True:
+        line = stream.readline(max_line_bytes + 1)
+        if not line:
+            break
+        line_number += 1
+
+        if len(line) > max_line_bytes and not line.endswith(b'\n'):
+            # Ligne trop longue: consommer le reste sans le garder
+            while line and not line.endswith(b'\n'):
+                line = stream.readline(max_line_bytes)
+            if errors is not None:
+                errors.append(NDJSONParseError(line_number, f"ligne > {max_line_bytes} octets"))
+            continue
+
+        try:
+            post = parse_post_line(line, line_number)
+        except NDJSONParseError as e:
+            if errors is not None:
+                errors.append(e)
+            continue
+
+        if post is None:
+            continue
+
+        if not batch:
+            batch_start = line_number
+        batch.append(post)
+
+        if len(batch) >= batch_size:
+            yield batch_start, batch
+            batch = []
+
+    if batch:
+        yield batch_start, batch
+
+
+# ============================================
+# OUVERTURE FICHIERS / ARCHIVES
+# ============================================
+
+_COMPRESSED_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+_NDJSON_EXTENSIONS = ('.ndjson', '.jsonl', '.json')
+
+
+def _is_ndjson_file(name: str) -> bool:
+    """Fichier NDJSON, éventuellement compressé, ou archive zip"""
+    base, extension = os.path.splitext(name.lower())
+    if extension == '.zip':
+        return True
+    if extension in _COMPRESSED_OPENERS:
+        extension = os.path.splitext(base)[1]
+    return extension in _NDJSON_EXTENSIONS
+
+
+def iter_ndjson_streams(path: str) -> Iterator[Tuple[str, BinaryIO]]:
+    """
+    Ouvre un fichier NDJSON, une archive ou un dossier
+
+    Décompression en flux: l'archive n'est jamais décompressée en entier.
+
+    Yields:
+        (nom, flux binaire) pour chaque fichier NDJSON trouvé
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            child = os.path.join(path, name)
+            if os.path.isfile(child) and _is_ndjson_file(name):
+                yield from iter_ndjson_streams(child)
+        return
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            for member in sorted(archive.namelist()):
+                if member.lower().endswith(_NDJSON_EXTENSIONS):
+                    with archive.open(member) as stream:
+                        yield f"{path}:{member}", stream
+        return
+
+    opener = _COMPRESSED_OPENERS.get(extension, open)
+    with closing(opener(path, 'rb')) as stream:
+        yield path, stream
@@ -0,0 +1,204 @@
+"""
+ADAPTIVE POLLING - FRÉQUENCE DE COLLECTE PAR SOURCE
+====================================================
+
+Responsabilités:
+1. Mesurer l'activité de chaque source après chaque collecte:
+   nouveaux posts par collecte (moyenne mobile rapide) comparés au
+   nombre habituel (moyenne mobile lente)
+2. Lire le signal d'événement des collecteurs (metadata['event'])
+3. En déduire la période de la collecte suivante:
+   - activité au-dessus de l'habitude → période raccourcie d'autant
+     (2× plus de posts par collecte → période divisée par 2)
+   - retour progressif vers la période de base (relaxation)
+   - événement actif → période ramenée à event_factor × période de base
+   - aucun nouveau post → période allongée (idle_backoff)
+4. Borner la période: [min_interval, max_interval] et jamais sous le
+   plancher imposé par les quotas de l'API (config.rate_limits)
+
+Une source calme est ainsi interrogée jusqu'à max_interval, une source
+en plein événement viral jusqu'à min_interval: moins de collectes
+inutiles au calme, détection plus rapide pendant les pics.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from src.core.models.social_data import SocialPost
+
+
+def active_event_count(posts: Iterable[SocialPost]) -> int:
+    """Posts signalés par leur collecteur comme liés à un événement"""
+    return sum(1 for post in posts if post.get_metadata('event', 'normal') != 'normal')
+
+
+@dataclass
+class SourceActivity:
+    """Activité observée d'une source"""
+    base_interval: float
+    floor: float
+    interval: float
+    fast_items: Optional[float] = None  # posts par collecte, moyenne mobile rapide
+    slow_items: Optional[float] = None  # posts par collecte habituels
+    rate: float = 0.0                   # posts/s à la dernière collecte
+    last_poll: Optional[float] = None   # time.monotonic()
+    event_active: bool = False
+    polls: int = 0
+
+
+class AdaptivePollingPolicy:
+    """
+    Période de collecte adaptative par source
+
+    Exemple:
+        policy = AdaptivePollingPolicy(min_interval=5, max_interval=300)
+        policy.register('Reddit', base_interval=30, floor=0.6)
+        interval = policy.observe('Reddit', new_items=42, events=10)
+    """
+
+    def __init__(self, min_interval: float = 5.0, max_interval: float = 300.0,
+                 fast_alpha: float = 0.5, slow_alpha: float = 0.05,
+                 event_factor: float = 0.25, event_threshold: float = 0.2,
+                 idle_backoff: float = 1.5, relaxation: float = 0.2):
+        self.logger = logging.getLogger(__name__)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.fast_alpha = fast_alpha
+        self.slow_alpha = slow_alpha
+        self.event_factor = event_factor
+        self.event_threshold = event_threshold
+        self.idle_backoff = idle_backoff
+        self.relaxation = relaxation
+
+        self.sources: Dict[str, SourceActivity] = {}
+
+        self.stats = {
+            'observations': 0,
+            'accelerations': 0,
+            'slowdowns': 0,
+            'event_polls': 0
+        }
+
+    def register(self, name: str, base_interval: float, floor: float = 0.0):
+        """
+        Args:
+            base_interval: période d'une activité habituelle sans événement
+            floor: période minimale imposée par les quotas de l'API
+        """
+        floor = max(floor, self.min_interval)
+        interval = min(max(base_interval, floor), self.max_interval)
+        self.sources[name] = SourceActivity(base_interval=base_interval, floor=floor, interval=interval)
+
+    def interval(self, name: str) -> float:
+        return self.sources[name].interval
+
+    def observe(self, name: str, new_items: int, events: int = 0,
+                now: Optional[float] = None) -> float:
+        """
+        Enregistre le résultat d'une collecte
+
+        Args:
+            new_items: nouveaux posts de la collecte
+            events: posts signalés comme liés à un événement actif
+
+        Returns:
+            Période avant la collecte suivante (secondes)
+        """
+        source = self.sources[name]
+        now = time.monotonic() if now is None else now
+        elapsed = now - source.last_poll if source.last_poll is not None else source.interval
+        source.last_poll = now
+        source.polls += 1
+        self.stats['observations'] += 1
+
+        source.rate = new_items / max(elapsed, 1e-3)
+        if source.fast_items is None:
+            source.fast_items = source.slow_items = float(new_items)
+        else:
+            source.fast_items += self.fast_alpha * (new_items - source.fast_items)
+            source.slow_items += self.slow_alpha * (new_items - source.slow_items)
+
+        source.event_active = bool(new_items) and events / new_items >= self.event_threshold
+
+        previous = source.interval
+        if not new_items:
+            interval = previous * self.idle_backoff
+        else:
+            # Plus de posts par collecte que d'habitude → période raccourcie
+            # (le nombre de posts par collecte revient à l'habitude)
+            interval = previous * source.slow_items / max(source.fast_items, 1e-9)
+            interval += self.relaxation * (source.base_interval - interval)
+        if source.event_active:
+            interval = min(interval, source.base_interval * self.event_factor)
+            self.stats['event_polls'] += 1
+
+        source.interval = min(max(interval, source.floor), self.max_interval)
+        if source.interval < previous:
+            self.stats['accelerations'] += 1
+        elif source.interval > previous:
+            self.stats['slowdowns'] += 1
+        return source.interval
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'sources': {
+                name: {
+                    'interval': round(source.interval, 2),
+                    'rate': round(source.rate, 3),
+                    'items_per_poll': round(source.fast_items or 0.0, 1),
+                    'usual_items_per_poll': round(source.slow_items or 0.0, 1),
+                    'event_active': source.event_active,
+                    'polls': source.polls
+                }
+                for name, source in self.sources.items()
+            }
+        }
+
+
+def rate_limit_floor(limits: Dict[str, Any], name: str, requests_per_poll: int = 1) -> float:
+    """
+    Période minimale permise par les quotas d'une source
+
+    Args:
+        limits: config.rate_limits.limits (plateforme → (requêtes, fenêtre))
+        name: nom de la source (comparé en minuscules)
+    """
+    limit = limits.get(name.lower())
+    if not limit:
+        return 0.0
+    requests, window = limit
+    return requests_per_poll * window / requests if requests else 0.0
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    policy = AdaptivePollingPolicy(min_interval=5, max_interval=300)
+    policy.register('Reddit', base_interval=30, floor=rate_limit_floor({'reddit': (100, 60.0)}, 'Reddit'))
+
+    # Débit réel de la source (posts/s) par période: calme, pic viral,
+    # retour au calme, silence
+    phases = [(300, 1.0, False), (120, 6.0, True), (300, 1.0, False), (900, 0.0, False)]
+    clock = 0.0
+    polls = 0
+    interval = policy.interval('Reddit')
+    for duration, rate, event in phases:
+        end = clock + duration
+        while clock < end:
+            clock += interval
+            new_items = round(rate * interval)
+            interval = policy.observe('Reddit', new_items, new_items if event else 0, now=clock)
+            polls += 1
+            print(f"t={clock:7.1f}s  {new_items:4} posts{' (événement)' if event else '':13} "
+                  f"→ prochaine collecte dans {interval:6.1f}s")
+
+    fixed_polls = int(clock // 30)
+    print(f"\n✅ {polls} collectes adaptatives vs {fixed_polls} à période fixe (30s) sur {clock:.0f}s")
+    print(f"📊 {policy.get_statistics()}")
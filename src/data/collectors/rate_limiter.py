@@ -0,0 +1,434 @@
+"""
+RATE LIMITER - QUOTAS DES API PLATEFORMES
+==========================================
+
+Responsabilités:
+1. Un seau de jetons (token bucket) par plateforme: `limit` requêtes
+   par fenêtre de `window` secondes
+2. Étaler les requêtes uniformément sur la fenêtre (1 jeton toutes les
+   ~window/limit secondes, rafale bornée) plutôt que de vider le quota
+   en début de fenêtre puis d'attendre
+3. Tenir compte des réponses de l'API (429 + Retry-After, en-têtes
+   x-rate-limit-remaining / x-rate-limit-reset)
+4. Conserver l'état des quotas entre deux redémarrages (1 fichier JSON
+   par plateforme, écrit atomiquement)
+
+Technique clé: réservation. Un appel à acquire() prend un créneau (le
+solde peut devenir négatif = créneaux futurs déjà attribués) puis dort
+hors verrou jusqu'à ce créneau: des threads concurrents sont servis
+dans l'ordre, espacés régulièrement.
+
+Garantie: sur toute fenêtre de `window` secondes, au plus
+burst + (limit - burst) = limit requêtes partent.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+class TokenBucket:
+    """
+    Seau de jetons d'une plateforme (horloge murale: persistable)
+
+    Débit de recharge (limit - burst) / window: la rafale initiale plus
+    la recharge d'une fenêtre ne dépassent jamais le quota.
+    """
+
+    def __init__(self, limit: int, window: float, burst: int = 1):
+        if limit <= burst:
+            raise ValueError(f"Quota trop faible: limit={limit} doit dépasser burst={burst}")
+        self.limit = limit
+        self.window = window
+        self.burst = burst
+        self.rate = (limit - burst) / window  # jetons par seconde
+
+        self.tokens = float(burst)
+        self.updated_at = time.time()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float):
+        if now > self.updated_at:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def reserve(self, now: Optional[float] = None) -> float:
+        """
+        Réserve le prochain créneau
+
+        Returns:
+            Secondes à attendre avant d'envoyer la requête
+        """
+        now = time.time() if now is None else now
+        start = max(now, self.blocked_until)
+        self._refill(start)
+
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return start - now
+        return start - now + (-self.tokens) / self.rate
+
+    def cancel(self):
+        """Rend le jeton d'une réservation abandonnée"""
+        self.tokens = min(self.burst, self.tokens + 1)
+
+    def pause_until(self, until: float):
+        """Aucune requête avant `until` (429, quota épuisé côté API)"""
+        self._refill(time.time())
+        self.tokens = min(self.tokens, 0.0)
+        self.blocked_until = max(self.blocked_until, until)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'limit': self.limit,
+            'window': self.window,
+            'tokens': self.tokens,
+            'updated_at': self.updated_at,
+            'blocked_until': self.blocked_until
+        }
+
+    def load_state(self, data: Dict[str, Any]):
+        """Reprend le solde sauvegardé (borné par la rafale actuelle)"""
+        self.tokens = min(self.burst, float(data.get('tokens', self.burst)))
+        self.updated_at = float(data.get('updated_at', time.time()))
+        self.blocked_until = float(data.get('blocked_until', 0.0))
+
+
+class RateLimitScheduler:
+    """
+    Planificateur partagé par les collecteurs d'un processus
+
+    Exemple:
+        limiter = RateLimitScheduler({'twitter': (450, 900)}, state_dir='data/ratelimits')
+        if limiter.acquire('twitter', max_wait=30):
+            response = session.get(url)
+            limiter.observe('twitter', response.status_code, response.headers)
+
+    Une plateforme absente de `limits` n'est pas limitée.
+    """
+
+    def __init__(self, limits: Mapping[str, Tuple[int, float]],
+                 state_dir: Optional[str] = None, burst: int = 1,
+                 persist_interval: float = 5.0):
+        self.logger = logging.getLogger(__name__)
+        self.limits = {platform.lower(): limit for platform, limit in limits.items()}
+        self.state_dir = state_dir
+        self.burst = burst
+        self.persist_interval = persist_interval
+
+        self.lock = threading.Lock()
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.last_saved: Dict[str, float] = {}
+
+        self.stats = {
+            'acquired': 0,
+            'rejected': 0,
+            'throttled': 0,
+            'total_wait': 0.0,
+            'rate_limited_responses': 0
+        }
+
+    # ------------------------------------------------------------------
+    # Seaux
+    # ------------------------------------------------------------------
+
+    def _state_path(self, platform: str) -> str:
+        return os.path.join(self.state_dir, f"{platform}.json")
+
+    def _bucket(self, platform: str) -> Optional[TokenBucket]:
+        """Seau de la plateforme (créé puis restauré au premier usage)"""
+        bucket = self.buckets.get(platform)
+        if bucket is None and platform in self.limits:
+            limit, window = self.limits[platform]
+            bucket = TokenBucket(limit, window, burst=self.burst)
+
+            if self.state_dir and os.path.exists(self._state_path(platform)):
+                try:
+                    with open(self._state_path(platform), 'r', encoding='utf-8') as f:
+                        bucket.load_state(json.load(f))
+                    self.logger.info(f"⏳ Quota {platform} restauré ({bucket.tokens:.1f} jetons)")
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"⚠️  État du quota {platform} illisible, ignoré - {e}")
+
+            self.buckets[platform] = bucket
+        return bucket
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def reserve(self, platform: str, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Réserve le créneau de la prochaine requête vers `platform` sans
+        attendre (l'appelant dort lui-même, ex: asyncio.sleep)
+
+        Args:
+            max_wait: attente maximale acceptée (None = illimitée)
+
+        Returns:
+            Secondes à attendre, ou None si le créneau dépasse max_wait
+            (rien n'est consommé)
+        """
+        platform = platform.lower()
+        with self.lock:
+            bucket = self._bucket(platform)
+            if bucket is None:
+                return 0.0
+
+            delay = bucket.reserve()
+            if max_wait is not None and delay > max_wait:
+                bucket.cancel()
+                self.stats['rejected'] += 1
+                return None
+
+            self.stats['acquired'] += 1
+            if delay > 0:
+                self.stats['throttled'] += 1
+                self.stats['total_wait'] += delay
+            self._maybe_save(platform)
+        return delay
+
+    def acquire(self, platform: str, max_wait: Optional[float] = None) -> bool:
+        """
+        Attend le créneau de la prochaine requête vers `platform`
+
+        Returns:
+            False si le créneau dépasse max_wait (rien n'est consommé)
+        """
+        delay = self.reserve(platform, max_wait)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    def observe(self, platform: str, status: int, headers: Optional[Mapping[str, str]] = None):
+        """
+        Ajuste le seau d'après la réponse de l'API
+
+        429: pause jusqu'à Retry-After (ou la fin de fenêtre).
+        x-rate-limit-remaining = 0: pause jusqu'à x-rate-limit-reset
+        (timestamp Unix, convention Twitter).
+        """
+        platform = platform.lower()
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+
+        until = None
+        if status == 429:
+            self.stats['rate_limited_responses'] += 1
+            until = time.time() + self._retry_after(headers, platform)
+        elif headers.get('x-rate-limit-remaining') == '0' and 'x-rate-limit-reset' in headers:
+            try:
+                until = float(headers['x-rate-limit-reset'])
+            except ValueError:
+                until = None
+
+        if until is None:
+            return
+
+        with self.lock:
+            bucket = self._bucket(platform)
+            if bucket is not None:
+                bucket.pause_until(until)
+                self.logger.warning(f"🚦 {platform}: quota API atteint, pause {until - time.time():.1f}s")
+                self.save(platform)
+
+    def _retry_after(self, headers: Dict[str, str], platform: str) -> float:
+        try:
+            return max(0.0, float(headers['retry-after']))
+        except (KeyError, ValueError):
+            _, window = self.limits.get(platform, (0, 60.0))
+            return window
+
+    # ------------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------------
+
+    def _maybe_save(self, platform: str):
+        if self.state_dir and time.time() - self.last_saved.get(platform, 0.0) >= self.persist_interval:
+            self.save(platform)
+
+    def save(self, platform: Optional[str] = None):
+        """
+        Écrit l'état des quotas (atomique, 1 fichier par plateforme)
+
+        Un fichier par plateforme: chaque processus collecteur n'écrit
+        que les plateformes qu'il interroge.
+        """
+        if not self.state_dir:
+            return
+        platforms = [platform] if platform else list(self.buckets)
+
+        os.makedirs(self.state_dir, exist_ok=True)
+        for name in platforms:
+            bucket = self.buckets.get(name)
+            if bucket is None:
+                continue
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(prefix=f'.{name}-', dir=self.state_dir)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(bucket.to_dict(), f)
+                os.replace(temp_path, self._state_path(name))
+                self.last_saved[name] = time.time()
+            except OSError as e:
+                self.logger.error(f"❌ Sauvegarde du quota {name} impossible - {e}")
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+    def close(self):
+        with self.lock:
+            self.save()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        with self.lock:
+            now = time.time()
+            buckets = {}
+            for name, bucket in self.buckets.items():
+                bucket._refill(now)
+                buckets[name] = {
+                    'limit': bucket.limit,
+                    'window': bucket.window,
+                    'interval': round(1 / bucket.rate, 3),
+                    'tokens': round(bucket.tokens, 2),
+                    'blocked_for': round(max(0.0, bucket.blocked_until - now), 1)
+                }
+        return {**self.stats, 'total_wait': round(self.stats['total_wait'], 2), 'platforms': buckets}
+
+
+# Planificateur du processus courant (créé au premier usage)
+_rate_limiter: Optional[RateLimitScheduler] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimitScheduler:
+    """Planificateur partagé, configuré par config.rate_limits"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            from src.core.config.settings import config
+
+            _rate_limiter = RateLimitScheduler(
+                config.rate_limits.limits,
+                state_dir=config.rate_limits.state_dir,
+                burst=config.rate_limits.burst,
+                persist_interval=config.rate_limits.persist_interval
+            )
+        return _rate_limiter
+
+
+# ============================================
+# TEST UNITAIRE (API LOCALE SIMULÉE)
+# ============================================
+
+def _start_fake_api(limit: int, window: float):
+    """
+    API locale à fenêtre fixe: au-delà de `limit` requêtes par fenêtre,
+    répond 429 avec Retry-After
+
+    Returns:
+        (serveur, url, compteurs)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    counters = {'ok': 0, 'rejected': 0, 'window_start': time.time(), 'in_window': 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                now = time.time()
+                if now - counters['window_start'] >= window:
+                    counters['window_start'] += window * ((now - counters['window_start']) // window)
+                    counters['in_window'] = 0
+                counters['in_window'] += 1
+                allowed = counters['in_window'] <= limit
+                counters['ok' if allowed else 'rejected'] += 1
+                retry_after = counters['window_start'] + window - now
+
+            self.send_response(200 if allowed else 429)
+            if not allowed:
+                self.send_header('Retry-After', f"{retry_after:.2f}")
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/search", counters
+
+
+def _hammer(url: str, limiter: Optional[RateLimitScheduler], duration: float, threads: int = 4):
+    """Clients concurrents pendant `duration` secondes"""
+    import urllib.error
+    import urllib.request
+
+    deadline = time.time() + duration
+
+    def client():
+        while True:
+            if limiter is not None and not limiter.acquire('fakeapi', max_wait=deadline - time.time()):
+                return
+            if time.time() >= deadline:
+                return
+            try:
+                with urllib.request.urlopen(url, timeout=5) as response:
+                    status, headers = response.status, response.headers
+            except urllib.error.HTTPError as e:
+                status, headers = e.code, e.headers
+            if limiter is not None:
+                limiter.observe('fakeapi', status, dict(headers))
+
+    workers = [threading.Thread(target=client) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    import shutil
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    LIMIT, WINDOW, DURATION = 20, 2.0, 6.0
+    state_dir = tempfile.mkdtemp()
+
+    print(f"\n🧪 API simulée: {LIMIT} requêtes / {WINDOW}s, 4 clients pendant {DURATION}s\n")
+
+    server, url, counters = _start_fake_api(LIMIT, WINDOW)
+    _hammer(url, None, DURATION)
+    print(f"❌ Sans limiteur: {counters['ok']} acceptées, {counters['rejected']} refusées (429)")
+    server.shutdown()
+
+    server, url, counters = _start_fake_api(LIMIT, WINDOW)
+    limiter = RateLimitScheduler({'fakeapi': (LIMIT, WINDOW)}, state_dir=state_dir)
+    _hammer(url, limiter, DURATION)
+    limiter.close()
+    print(f"✅ Avec limiteur: {counters['ok']} acceptées, {counters['rejected']} refusées (429), "
+          f"plafond théorique {int(LIMIT * DURATION / WINDOW)}")
+    print(f"📊 {limiter.get_statistics()}")
+    server.shutdown()
+
+    # Redémarrage: le solde sauvegardé est repris (pas de rafale offerte)
+    limits = {'fakeapi': (LIMIT, WINDOW)}
+    before = RateLimitScheduler(limits, state_dir=state_dir, burst=5)
+    for _ in range(5):
+        before.acquire('fakeapi')
+    before.close()
+
+    restarted = RateLimitScheduler(limits, state_dir=state_dir, burst=5)
+    start = time.time()
+    for _ in range(5):
+        restarted.acquire('fakeapi')
+    print(f"🔁 Après redémarrage: 5 requêtes en {time.time() - start:.2f}s "
+          f"(rafale déjà consommée, intervalle {WINDOW / (LIMIT - 5):.2f}s)")
+
+    shutil.rmtree(state_dir)
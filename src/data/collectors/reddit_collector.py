@@ -10,16 +10,19 @@ Génère des posts réalistes qui évoluent à chaque itération:
 
 import logging
 import random
-from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+from src.data.collectors.cursors import SimulatedCursorMixin
+from src.data.collectors.registry import ShardMixin
 
 
-class DynamicRedditCollector:
+class DynamicRedditCollector(SimulatedCursorMixin, ShardMixin):
     """Collecteur Reddit avec données évolutives"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
+        # Générateur propre au collecteur: seed fixée = collecte reproductible
+        self.rng = random.Random(seed)
         self.iteration = 0
         self.post_id = 0
         
@@ -121,19 +124,19 @@ class DynamicRedditCollector:
             self.logger.info(f"🎯 Événement: {event_modifier['name']}")
         
         # Générer  posts par catégorie
-        for category, templates in self.post_templates.items():
+        for category, templates in self.shard_items(self.post_templates.items()):
             # Ratio sentiment varie selon événements
             positive_ratio = 0.6 + event_modifier['sentiment_shift']
-            postgenerated = random.randint(8, 12)
+            postgenerated = self.rng.randint(8, 12)
             for i in range(postgenerated):
-                is_positive = random.random() < positive_ratio
+                is_positive = self.rng.random() < positive_ratio
                 sentiment_type = 'positive' if is_positive else 'negative'
                 
                 # Choisir template aléatoire
-                content = random.choice(templates[sentiment_type])
+                content = self.rng.choice(templates[sentiment_type])
                 
                 # Métriques variables
-                base_upvotes = random.randint(100, 5000)
+                base_upvotes = self.rng.randint(100, 5000)
                 if event_modifier['viral_multiplier'] > 1:
                     base_upvotes = int(base_upvotes * event_modifier['viral_multiplier'])
                 
@@ -141,14 +144,14 @@ class DynamicRedditCollector:
                     id=f"reddit_{self.iteration}_{self.post_id}",
                     platform=Platform.REDDIT,
                     content=content,
-                    author=f"u/redditor_{random.randint(1000, 9999)}",
-                    author_followers=random.randint(5000, 50000),
-                    created_at=datetime.now() - timedelta(minutes=random.randint(1, 30)),
+                    author=f"u/redditor_{self.rng.randint(1000, 9999)}",
+                    author_followers=self.rng.randint(5000, 50000),
+                    created_at=self._new_post_time(),
                     url=f"https://reddit.com/r/{category.value}/comments/{self.post_id}",
                     metrics={
                         'upvotes': base_upvotes,
-                        'comments': random.randint(10, 300),
-                        'awards': random.randint(0, 10)
+                        'comments': self.rng.randint(10, 300),
+                        'awards': self.rng.randint(0, 10)
                     },
                     category=category,
                     metadata={
@@ -161,47 +164,48 @@ class DynamicRedditCollector:
                 posts.append(post)
                 self.post_id += 1
         
+        self._advance_watermark(posts)
         return posts
     def _get_event_modifier(self) -> dict:
-            rand = random.random()
+            rand = self.rng.random()
             
             # 10% événements très positifs
             if rand < 0.10:
                 return {
-                    'name': random.choice(['Viral Success', 'Product Launch', 'Award']),
-                    'sentiment_shift': random.uniform(0.5, 0.8),  # ✅ +50% à +80% positifs
-                    'viral_multiplier': random.uniform(5.0, 10.0)
+                    'name': self.rng.choice(['Viral Success', 'Product Launch', 'Award']),
+                    'sentiment_shift': self.rng.uniform(0.5, 0.8),  # ✅ +50% à +80% positifs
+                    'viral_multiplier': self.rng.uniform(5.0, 10.0)
                 }
             
             # 15% événements positifs
             elif rand < 0.25:
                 return {
-                    'name': random.choice(['Partnership', 'Review', 'Update']),
-                    'sentiment_shift': random.uniform(0.2, 0.4),  # ✅ +20% à +40% positifs
-                    'viral_multiplier': random.uniform(2.0, 4.0)
+                    'name': self.rng.choice(['Partnership', 'Review', 'Update']),
+                    'sentiment_shift': self.rng.uniform(0.2, 0.4),  # ✅ +20% à +40% positifs
+                    'viral_multiplier': self.rng.uniform(2.0, 4.0)
                 }
             
             # 10% événements très négatifs
             elif rand < 0.35:
                 return {
-                    'name': random.choice(['Data Breach', 'Scandal', 'Layoffs']),
-                    'sentiment_shift': random.uniform(-0.8, -0.5),  # ✅ +50% à +80% négatifs
-                    'viral_multiplier': random.uniform(6.0, 12.0)
+                    'name': self.rng.choice(['Data Breach', 'Scandal', 'Layoffs']),
+                    'sentiment_shift': self.rng.uniform(-0.8, -0.5),  # ✅ +50% à +80% négatifs
+                    'viral_multiplier': self.rng.uniform(6.0, 12.0)
                 }
             
             # 15% événements négatifs
             elif rand < 0.50:
                 return {
-                    'name': random.choice(['Outage', 'Price Hike', 'Complaints']),
-                    'sentiment_shift': random.uniform(-0.5, -0.3),  # ✅ +30% à +50% négatifs
-                    'viral_multiplier': random.uniform(3.0, 6.0)
+                    'name': self.rng.choice(['Outage', 'Price Hike', 'Complaints']),
+                    'sentiment_shift': self.rng.uniform(-0.5, -0.3),  # ✅ +30% à +50% négatifs
+                    'viral_multiplier': self.rng.uniform(3.0, 6.0)
                 }
             
             # 50% événements normaux
             else:
                 return {
                     'name': 'normal',
-                    'sentiment_shift': random.uniform(-0.15, 0.15),  # ✅ Légère variance
+                    'sentiment_shift': self.rng.uniform(-0.15, 0.15),  # ✅ Légère variance
                     'viral_multiplier': 1.0
                 }
 
@@ -0,0 +1,319 @@
+"""
+COLLECTOR REGISTRY - SOURCES DE COLLECTE DÉCLARATIVES
+======================================================
+
+Responsabilités:
+1. Déclarer chaque source (SourceSpec): collecteur à instancier,
+   méthode de collecte, parallélisme, taille de batch, échéance,
+   période de collecte
+2. Charger les sources depuis la configuration (config.collection.sources)
+   et depuis les entry points Python du groupe `social_intelligence.collectors`
+   (paquets tiers: aucun code du master à modifier)
+3. Planifier l'allocation des processus (plan_workers): 1 processus
+   minimum par source, le reste du budget réparti selon le parallélisme
+   déclaré. Seul un collecteur partitionnable (ShardMixin: set_shard)
+   reçoit plus d'un processus: chaque processus collecte alors sa part
+   des catégories au lieu de répéter les mêmes appels
+4. Fournir la fonction exécutée dans chaque processus (collect_source)
+5. Reporter les curseurs du checkpoint sur les processus du plan
+   courant (restore_cursors), fusionnés si le plan a changé
+
+Exemple d'entry point (pyproject.toml d'un paquet tiers):
+    [project.entry-points."social_intelligence.collectors"]
+    mastodon = "mastodon_source:SOURCE"     # SourceSpec ou dict
+"""
+
+import importlib
+import logging
+import multiprocessing
+from dataclasses import dataclass, field, fields
+from functools import partial
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.models.social_data import SocialPost
+
+ENTRY_POINT_GROUP = 'social_intelligence.collectors'
+
+
+class ShardMixin:
+    """
+    Collecteur partitionnable entre plusieurs processus
+
+    Le processus `shard` sur `shards` ne collecte que les éléments
+    (catégories, requêtes) d'indice shard, shard + shards, ...
+    """
+
+    shard: int = 0
+    shards: int = 1
+    # Ids tirés de compteurs propres au processus: suffixés "_s<shard>"
+    # pour rester distincts (False: ids globaux, ex: ids de l'API)
+    local_ids: bool = True
+
+    def set_shard(self, shard: int, shards: int):
+        """
+        Raises:
+            ValueError: shard hors de [0, shards)
+        """
+        if shards < 1 or not 0 <= shard < shards:
+            raise ValueError(f"Partition invalide: {shard}/{shards}")
+        self.shard = shard
+        self.shards = shards
+
+    def shard_items(self, items: Iterable[Any]) -> List[Any]:
+        """Part des éléments revenant à ce processus"""
+        return list(items)[self.shard::self.shards]
+
+
+@dataclass
+class SourceSpec:
+    """
+    Déclaration d'une source
+
+    Attributes:
+        name: Nom affiché (clé des statistiques, timeouts, curseurs)
+        factory: "module:Classe" du collecteur (importé dans le processus)
+        method: Méthode de collecte (sans argument, retourne List[SocialPost])
+        concurrency: Processus souhaités; plafonné à 1 si le collecteur
+                     n'est pas partitionnable (sinon chaque processus
+                     collecte sa part des catégories)
+        batch_size: Posts minimum par collecte (méthode rappelée si besoin, 0 = 1 appel)
+        timeout: Échéance par cycle en secondes (None = défaut du superviseur)
+        interval: Période de collecte en secondes (None = chaque cycle);
+                  période de base si la fréquence est adaptative
+        requests_per_poll: Requêtes API par collecte (plancher de période
+                           imposé par config.rate_limits)
+        options: Arguments du constructeur du collecteur
+        enabled: Source active
+    """
+    name: str
+    factory: str
+    method: str
+    concurrency: int = 1
+    batch_size: int = 0
+    timeout: Optional[float] = None
+    interval: Optional[float] = None
+    requests_per_poll: int = 1
+    options: Dict[str, Any] = field(default_factory=dict)
+    enabled: bool = True
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SourceSpec':
+        """
+        Raises:
+            ValueError: champ inconnu ou manquant
+        """
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Source {data.get('name', '?')}: champs inconnus {sorted(unknown)}")
+        missing = [key for key in ('name', 'factory', 'method') if not data.get(key)]
+        if missing:
+            raise ValueError(f"Source {data.get('name', '?')}: champs manquants {missing}")
+        return cls(**data)
+
+    def load_factory(self) -> Callable[..., Any]:
+        module_name, _, attribute = self.factory.partition(':')
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def partitionable(self) -> bool:
+        """Le collecteur sait se limiter à sa part (set_shard)"""
+        return hasattr(self.load_factory(), 'set_shard')
+
+
+class CollectorRegistry:
+    """
+    Ensemble des sources de collecte
+
+    Exemple:
+        registry = CollectorRegistry.from_config()
+        plan = registry.plan_workers(max_processes=32)   # {'Reddit': 2, ...}
+    """
+
+    def __init__(self, specs: Iterable[SourceSpec] = ()):
+        self.logger = logging.getLogger(__name__)
+        self.specs: Dict[str, SourceSpec] = {}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: SourceSpec):
+        if spec.name in self.specs:
+            self.logger.warning(f"⚠️  Source {spec.name} redéclarée: la dernière déclaration l'emporte")
+        self.specs[spec.name] = spec
+
+    @classmethod
+    def from_config(cls, sources: Optional[List[Dict[str, Any]]] = None,
+                    load_entry_points: bool = True) -> 'CollectorRegistry':
+        """Sources de config.collection.sources puis des entry points"""
+        if sources is None:
+            from src.core.config.settings import config
+            sources = config.collection.sources
+
+        registry = cls(SourceSpec.from_dict(dict(source)) for source in sources)
+        if load_entry_points:
+            registry.load_entry_points()
+        return registry
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> int:
+        """
+        Ajoute les sources publiées par les paquets installés
+
+        Returns:
+            Nombre de sources chargées (une source invalide est ignorée)
+        """
+        loaded = 0
+        for entry_point in entry_points(group=group):
+            try:
+                source = entry_point.load()
+                spec = source if isinstance(source, SourceSpec) else SourceSpec.from_dict(dict(source))
+            except Exception as e:
+                self.logger.error(f"❌ Entry point {entry_point.name}: source ignorée - {e}")
+                continue
+            self.register(spec)
+            loaded += 1
+        if loaded:
+            self.logger.info(f"🔌 {loaded} source(s) chargée(s) depuis les entry points")
+        return loaded
+
+    def enabled(self) -> List[SourceSpec]:
+        return [spec for spec in self.specs.values() if spec.enabled]
+
+    def plan_workers(self, max_processes: Optional[int] = None) -> Dict[str, int]:
+        """
+        Processus alloués à chaque source
+
+        1 processus par source (une source ne peut pas en partager un),
+        puis le budget restant attribué une unité à la fois à la source
+        la moins servie relativement à son parallélisme déclaré. Une
+        source non partitionnable reste à 1 processus: N processus
+        feraient N fois les mêmes appels (quota × N, doublons écartés).
+
+        Args:
+            max_processes: budget total (défaut: 2 × CPU, minimum 1 par source)
+        """
+        specs = self.enabled()
+        budget = max_processes if max_processes is not None else 2 * multiprocessing.cpu_count()
+        if budget < len(specs):
+            self.logger.warning(
+                f"⚠️  Budget de {budget} processus < {len(specs)} sources: 1 processus par source"
+            )
+
+        scalable = []
+        for spec in specs:
+            if spec.concurrency <= 1:
+                continue
+            if spec.partitionable():
+                scalable.append(spec)
+            else:
+                self.logger.warning(
+                    f"⚠️  Source {spec.name}: collecteur non partitionnable (set_shard), "
+                    f"concurrency={spec.concurrency} ramené à 1"
+                )
+
+        plan = {spec.name: 1 for spec in specs}
+        remaining = budget - len(specs)
+        while remaining > 0:
+            candidates = [spec for spec in scalable if plan[spec.name] < spec.concurrency]
+            if not candidates:
+                break
+            spec = min(candidates, key=lambda s: (plan[s.name] / s.concurrency, s.name))
+            plan[spec.name] += 1
+            remaining -= 1
+        return plan
+
+    def worker_functions(self, plan: Dict[str, int]) -> Dict[str, Tuple[SourceSpec, Callable]]:
+        """
+        Fonctions de collecte par processus (picklables: compatibles spawn)
+
+        Returns:
+            {nom du processus: (source, fonction)} - "Reddit" pour une
+            source à 1 processus, "Reddit#0", "Reddit#1"... sinon
+        """
+        workers = {}
+        for name, shards in plan.items():
+            spec = self.specs[name]
+            for shard in range(shards):
+                workers[worker_name(name, shard, shards)] = (spec, partial(collect_source, spec, shard, shards))
+        return workers
+
+    def restore_cursors(self, plan: Dict[str, int],
+                        saved: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Curseurs du checkpoint ({processus: curseur}) pour les processus du plan
+
+        Si les processus d'une source ont changé (budget ou CPU modifié:
+        "Reddit" → "Reddit#0", "Reddit#1"...), ses curseurs sont fusionnés
+        par le collecteur (merge_cursors) et chaque nouveau processus part
+        du curseur fusionné. Un collecteur sans merge_cursors repart sans
+        curseur (collecte complète, warning).
+        """
+        cursors = {}
+        for name, shards in plan.items():
+            workers = [worker_name(name, shard, shards) for shard in range(shards)]
+            previous = {key: cursor for key, cursor in saved.items() if key.partition('#')[0] == name}
+            if not previous or set(previous) == set(workers):
+                cursors.update(previous)
+                continue
+
+            merge = getattr(self.specs[name].load_factory(), 'merge_cursors', None)
+            change = f"{', '.join(sorted(previous))} → {', '.join(workers)}"
+            if merge is None:
+                self.logger.warning(f"⚠️  Source {name}: processus modifiés ({change}), curseurs réinitialisés")
+                continue
+            merged = merge(list(previous.values()))
+            cursors.update({worker: merged for worker in workers})
+            self.logger.warning(f"🔀 Source {name}: processus modifiés ({change}), curseurs fusionnés")
+        return cursors
+
+
+def worker_name(name: str, shard: int, shards: int) -> str:
+    """Nom du processus (clé des curseurs): Reddit ou Reddit#<shard>"""
+    return name if shards == 1 else f"{name}#{shard}"
+
+
+# ============================================
+# EXÉCUTÉ DANS LES PROCESSUS DE COLLECTE
+# ============================================
+
+# Collecteur de chaque processus (processus persistants: l'état survit
+# d'un cycle à l'autre)
+_collectors: Dict[Tuple[str, int], Any] = {}
+
+
+def collect_source(spec: SourceSpec, shard: int, shards: int,
+                   cursor: Optional[Dict[str, Any]] = None) -> Tuple[List[SocialPost], Optional[Dict[str, Any]]]:
+    """
+    Une collecte d'une source dans son processus
+
+    Le collecteur est repositionné sur le curseur envoyé par le parent.
+    Avec plusieurs processus, chacun ne collecte que sa part (set_shard)
+    et les ids locaux (local_ids) reçoivent le suffixe "_s<shard>"
+    (chaque processus a ses propres compteurs).
+
+    Une erreur de collecte remonte au superviseur (statut 'error',
+    source listée dans stale_platforms) au lieu d'un cycle vide.
+    """
+    key = (spec.name, shard)
+    collector = _collectors.get(key)
+    if collector is None:
+        collector = spec.load_factory()(**spec.options)
+        if shards > 1:
+            collector.set_shard(shard, shards)
+        _collectors[key] = collector
+    if cursor and hasattr(collector, 'set_cursor'):
+        collector.set_cursor(cursor)
+
+    collect = getattr(collector, spec.method)
+    posts = collect()
+    while posts and len(posts) < spec.batch_size:
+        more = collect()
+        if not more:
+            break
+        posts.extend(more)
+
+    if shards > 1 and getattr(collector, 'local_ids', True):
+        for post in posts:
+            post.id = f"{post.id}_s{shard}"
+
+    new_cursor = collector.get_cursor() if hasattr(collector, 'get_cursor') else None
+    return posts, new_cursor
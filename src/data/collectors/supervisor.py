@@ -0,0 +1,332 @@
+"""
+COLLECTOR SUPERVISOR - SUPERVISION DES PROCESSUS DE COLLECTE
+=============================================================
+
+Responsabilités:
+1. Garder 1 processus persistant par plateforme (pas de pool recréé
+   à chaque cycle)
+2. Donner à chaque plateforme sa propre échéance: le cycle garde ce qui
+   est arrivé à temps, une plateforme lente n'annule pas les autres
+3. Récupérer au cycle suivant les résultats arrivés en retard
+4. Redémarrer en arrière-plan un processus planté ou bloqué
+5. Décrire le cycle (statut par plateforme, plateformes en retard)
+6. Garder le curseur de chaque plateforme côté parent: envoyé avec
+   chaque requête, un processus redémarré reprend où l'ancien s'était
+   arrêté
+
+Contrat d'une fonction de collecte: collect(curseur) -> (posts, curseur)
+
+Technique clé: multiprocessing.Process + Pipe par plateforme,
+multiprocessing.connection.wait pour attendre toutes les plateformes
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.models.social_data import SocialPost
+from src.data.collectors.polling import active_event_count
+
+
+# collect(curseur) -> (posts, nouveau curseur)
+CollectFunction = Callable[[Optional[Dict[str, Any]]], Tuple[List[SocialPost], Optional[Dict[str, Any]]]]
+
+
+def _platform_worker_loop(conn, collect: CollectFunction):
+    """Boucle d'un processus plateforme: 1 requête (curseur) → 1 collecte"""
+    while True:
+        try:
+            _, cursor = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            conn.send(('ok', collect(cursor)))
+        except Exception as e:
+            conn.send(('error', str(e)))
+
+
+class PlatformWorker:
+    """
+    Processus persistant d'une plateforme
+
+    États: prêt, occupé (collecte en cours), redémarrage en cours.
+    """
+
+    def __init__(self, name: str, collect: CollectFunction, context,
+                 cursor: Optional[Dict[str, Any]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.collect = collect
+        self.context = context
+        # Curseur du dernier résultat reçu (envoyé avec la requête suivante)
+        self.cursor = cursor
+
+        self.process = None
+        self.conn = None
+        self.busy_since: Optional[float] = None
+        self.restarting = False
+        self.last_success: Optional[float] = None
+
+        self.stats = {
+            'collections': 0,
+            'timeouts': 0,
+            'late_results': 0,
+            'errors': 0,
+            'crashes': 0,
+            'restarts': 0
+        }
+
+    def start(self):
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=_platform_worker_loop,
+            args=(child_conn, self.collect),
+            name=f"collector-{self.name.lower()}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+
+        self.process, self.conn = process, parent_conn
+        self.busy_since = None
+
+    @property
+    def busy(self) -> bool:
+        return self.busy_since is not None
+
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def submit(self) -> bool:
+        """Lance une collecte (False si occupé, en redémarrage ou mort)"""
+        if self.restarting or self.busy or not self.alive():
+            return False
+        try:
+            self.conn.send(('collect', self.cursor))
+        except OSError:
+            return False
+        self.busy_since = time.monotonic()
+        return True
+
+    def receive(self) -> Tuple[str, Any]:
+        """
+        Lit la réponse disponible sur la connexion
+
+        Returns:
+            ('ok', posts), ('error', message) ou ('crashed', message)
+            (le curseur reçu avec les posts est conservé dans self.cursor)
+        """
+        try:
+            status, payload = self.conn.recv()
+        except (EOFError, OSError) as e:
+            status, payload = 'crashed', f"processus terminé ({e or 'EOF'})"
+
+        self.busy_since = None
+        if status == 'ok':
+            payload, cursor = payload
+            if cursor is not None:
+                self.cursor = cursor
+            self.stats['collections'] += 1
+            self.last_success = time.time()
+        elif status == 'error':
+            self.stats['errors'] += 1
+        return status, payload
+
+    def restart_async(self, reason: str):
+        """Remplace le processus en arrière-plan (le cycle n'attend pas)"""
+        if self.restarting:
+            return
+        self.restarting = True
+        self.logger.warning(f"🔁 {self.name}: redémarrage du processus ({reason})")
+
+        def restart():
+            try:
+                if self.process is not None and self.process.is_alive():
+                    self.process.terminate()
+                    self.process.join(timeout=5)
+                if self.conn is not None:
+                    self.conn.close()
+                self.start()
+                self.stats['restarts'] += 1
+            except Exception as e:
+                self.logger.error(f"❌ {self.name}: redémarrage impossible - {e}")
+            finally:
+                self.restarting = False
+
+        threading.Thread(target=restart, name=f"restart-{self.name.lower()}", daemon=True).start()
+
+    def stop(self):
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5)
+        if self.conn is not None:
+            self.conn.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'alive': self.alive(),
+            'busy': self.busy,
+            'restarting': self.restarting,
+            'last_success': self.last_success,
+            'cursor': self.cursor
+        }
+
+
+class CollectorSupervisor:
+    """
+    Collecte supervisée multi-plateformes
+
+    Exemple:
+        supervisor = CollectorSupervisor({'Reddit': collect_reddit, ...},
+                                         timeouts={'Reddit': 30})
+        posts, metadata = supervisor.collect_cycle()
+    """
+
+    def __init__(self, collectors: Dict[str, CollectFunction],
+                 timeouts: Optional[Dict[str, float]] = None,
+                 default_timeout: float = 30.0,
+                 hang_timeout: float = 120.0,
+                 cursors: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.timeouts = timeouts or {}
+        self.default_timeout = default_timeout
+        self.hang_timeout = hang_timeout
+
+        # spawn: le processus pipeline a déjà des threads
+        context = multiprocessing.get_context('spawn')
+        cursors = cursors or {}
+        self.workers = {
+            name: PlatformWorker(name, collect, context, cursor=cursors.get(name))
+            for name, collect in collectors.items()
+        }
+        self.started = False
+
+    def start(self):
+        for worker in self.workers.values():
+            worker.start()
+        self.started = True
+        self.logger.info(f"🧭 Superviseur: {len(self.workers)} processus plateformes démarrés")
+
+    def timeout_for(self, name: str) -> float:
+        return self.timeouts.get(name, self.default_timeout)
+
+    def collect_cycle(self, names: Optional[Iterable[str]] = None) -> Tuple[List[SocialPost], Dict[str, Any]]:
+        """
+        Un cycle de collecte borné par l'échéance de chaque plateforme
+
+        Args:
+            names: plateformes à lancer (None = toutes); les autres ne
+                   figurent dans le rapport que pour un résultat en retard
+
+        Returns:
+            (posts, métadonnées) - métadonnées: statut par plateforme
+            ('ok', 'timeout', 'error', 'crashed', 'busy', 'restarting'),
+            posts arrivés en retard récupérés (late_posts) et liste des
+            plateformes sans résultat frais (stale_platforms)
+        """
+        if not self.started:
+            self.start()
+
+        start = time.monotonic()
+        posts: List[SocialPost] = []
+        report: Dict[str, Dict[str, Any]] = {}
+
+        # 1. Résultats arrivés après l'échéance du cycle précédent
+        for name, worker in self.workers.items():
+            if worker.busy and not worker.restarting and worker.conn.poll():
+                status, payload = worker.receive()
+                if status == 'ok':
+                    worker.stats['late_results'] += 1
+                    posts.extend(payload)
+                    self.logger.info(f"📬 {name}: {len(payload)} posts arrivés en retard récupérés")
+                    report[name] = {'late_posts': len(payload)}
+                elif status == 'crashed':
+                    worker.stats['crashes'] += 1
+                    worker.restart_async(payload)
+
+        # 2. Lancer les plateformes demandées et disponibles
+        selected = set(self.workers) if names is None else set(names)
+        deadlines: Dict[Any, Tuple[str, float]] = {}
+        for name, worker in self.workers.items():
+            if name not in selected:
+                continue
+            entry = report.setdefault(name, {})
+            if worker.restarting:
+                entry['status'] = 'restarting'
+            elif not worker.alive():
+                worker.stats['crashes'] += 1
+                worker.restart_async("processus mort")
+                entry['status'] = 'restarting'
+            elif worker.busy:
+                # Collecte précédente toujours en cours
+                busy_for = time.monotonic() - worker.busy_since
+                entry['status'] = 'busy'
+                if busy_for > self.hang_timeout:
+                    worker.stats['crashes'] += 1
+                    worker.restart_async(f"bloqué depuis {busy_for:.0f}s")
+                    entry['status'] = 'restarting'
+            elif worker.submit():
+                deadlines[worker.conn] = (name, start + self.timeout_for(name))
+            else:
+                entry['status'] = 'error'
+                worker.restart_async("envoi de la requête impossible")
+
+        # 3. Attendre chaque plateforme jusqu'à sa propre échéance
+        while deadlines:
+            next_deadline = min(deadline for _, deadline in deadlines.values())
+            ready = wait(list(deadlines), timeout=max(0.0, next_deadline - time.monotonic()))
+
+            for conn in ready:
+                name, _ = deadlines.pop(conn)
+                worker = self.workers[name]
+                status, payload = worker.receive()
+                entry = report[name]
+                entry['status'] = status
+                entry['duration'] = round(time.monotonic() - start, 2)
+
+                if status == 'ok':
+                    posts.extend(payload)
+                    entry['posts'] = len(payload)
+                    entry['events'] = active_event_count(payload)
+                else:
+                    entry['error'] = payload
+                    self.logger.error(f"❌ {name}: ERREUR - {payload}")
+                    if status == 'crashed':
+                        worker.stats['crashes'] += 1
+                        worker.restart_async(payload)
+
+            # Échéances dépassées: la plateforme continue, le cycle non
+            now = time.monotonic()
+            for conn, (name, deadline) in list(deadlines.items()):
+                if now >= deadline:
+                    del deadlines[conn]
+                    self.workers[name].stats['timeouts'] += 1
+                    report[name]['status'] = 'timeout'
+                    self.logger.error(f"⏱️  {name}: TIMEOUT (> {self.timeout_for(name):.0f}s), "
+                                      f"résultat récupéré au prochain cycle")
+
+        # Entrée sans statut: plateforme non lancée, résultat en retard seul
+        stale = sorted(name for name, entry in report.items() if entry.get('status', 'ok') != 'ok')
+        metadata = {
+            'platforms': report,
+            'stale_platforms': stale,
+            'complete': not stale,
+            'duration': round(time.monotonic() - start, 2)
+        }
+        return posts, metadata
+
+    def cursors(self) -> Dict[str, Dict[str, Any]]:
+        """Curseur courant de chaque plateforme (à checkpointer)"""
+        return {name: worker.cursor for name, worker in self.workers.items() if worker.cursor is not None}
+
+    def stop(self):
+        for worker in self.workers.values():
+            worker.stop()
+        self.started = False
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {name: worker.get_statistics() for name, worker in self.workers.items()}
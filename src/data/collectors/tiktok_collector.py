@@ -6,15 +6,18 @@ Ajout de posts positifs/négatifs + événements dynamiques
 
 import logging
 import random
-from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+from src.data.collectors.cursors import SimulatedCursorMixin
+from src.data.collectors.registry import ShardMixin
 
 
-class DynamicTikTokCollector:
+class DynamicTikTokCollector(SimulatedCursorMixin, ShardMixin):
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
+        # Générateur propre au collecteur: seed fixée = collecte reproductible
+        self.rng = random.Random(seed)
         self.iteration = 0
         self.post_id = 0
         self.trending_hashtags = []
@@ -124,44 +127,44 @@ class DynamicTikTokCollector:
        
         
         # Générer posts pour chaque catégorie
-        for category, templates in self.tiktok_templates.items():
+        for category, templates in self.shard_items(self.tiktok_templates.items()):
             # Calculer nombre de posts par catégorie 
-            posts_per_category = random.randint(10, 15)
+            posts_per_category = self.rng.randint(10, 15)
             # Calculer ratio positif/négatif selon événement
             base_ratio = 0.5
             positive_ratio = max(0.0, min(1.0, base_ratio + event['sentiment_shift']))
             
             for i in range(posts_per_category):
                 # Choisir sentiment selon ratio
-                is_positive = random.random() < positive_ratio
+                is_positive = self.rng.random() < positive_ratio
                 sentiment_type = 'positive' if is_positive else 'negative'
                 
                 # Choisir template aléatoire
-                content = random.choice(templates[sentiment_type])
+                content = self.rng.choice(templates[sentiment_type])
                 
                 # Ajouter hashtags trending si disponibles
-                if self.trending_hashtags and random.random() > 0.5:
-                    content += f" {random.choice(self.trending_hashtags)}"
+                if self.trending_hashtags and self.rng.random() > 0.5:
+                    content += f" {self.rng.choice(self.trending_hashtags)}"
                 
                 # Métriques réalistes TikTok (basées sur vues)
-                base_views = random.randint(10000, 1000000)
+                base_views = self.rng.randint(10000, 1000000)
                 
                 # Multiplicateur si événement viral
                 if event.get('is_viral', False):
                     base_views = int(base_views * event['viral_multiplier'])
                 
                 # TikTok: likes sont ~10% des vues
-                likes = int(base_views * random.uniform(0.05, 0.15))
-                comments = int(base_views * random.uniform(0.005, 0.015))
-                shares = int(base_views * random.uniform(0.002, 0.008))
+                likes = int(base_views * self.rng.uniform(0.05, 0.15))
+                comments = int(base_views * self.rng.uniform(0.005, 0.015))
+                shares = int(base_views * self.rng.uniform(0.002, 0.008))
                 
                 post = SocialPost(
                     id=f"tiktok_{self.iteration}_{self.post_id}",
                     platform=Platform.TIKTOK,
                     content=content,
-                    author=f"@tiktok{random.randint(100, 999)}",
-                    author_followers=random.randint(10000, 1000000),
-                    created_at=datetime.now() - timedelta(minutes=random.randint(1, 30)),
+                    author=f"@tiktok{self.rng.randint(100, 999)}",
+                    author_followers=self.rng.randint(10000, 1000000),
+                    created_at=self._new_post_time(),
                     url=f"https://tiktok.com/@user/video/{self.post_id}",
                     metrics={
                         'likes': likes,
@@ -179,6 +182,7 @@ class DynamicTikTokCollector:
                 posts.append(post)
                 self.post_id += 1
         
+        self._advance_watermark(posts)
         return posts
     
     def _get_event_modifier(self) -> dict:
@@ -186,41 +190,41 @@ class DynamicTikTokCollector:
         Génère événements avec forte variance pour sentiments dynamiques
         Identique à la logique des autres collecteurs
         """
-        rand = random.random()
+        rand = self.rng.random()
         
         # 10% événements très positifs
         if rand < 0.10:
             return {
-                'name': random.choice(['Viral Video', 'Challenge Success', 'Creator Award']),
-                'sentiment_shift': random.uniform(0.5, 0.8),
-                'viral_multiplier': random.uniform(5.0, 10.0),
+                'name': self.rng.choice(['Viral Video', 'Challenge Success', 'Creator Award']),
+                'sentiment_shift': self.rng.uniform(0.5, 0.8),
+                'viral_multiplier': self.rng.uniform(5.0, 10.0),
                 'is_viral': True
             }
         
         # 15% événements positifs
         elif rand < 0.25:
             return {
-                'name': random.choice(['Trend Starting', 'Positive Collab', 'Milestone']),
-                'sentiment_shift': random.uniform(0.2, 0.4),
-                'viral_multiplier': random.uniform(2.0, 4.0),
+                'name': self.rng.choice(['Trend Starting', 'Positive Collab', 'Milestone']),
+                'sentiment_shift': self.rng.uniform(0.2, 0.4),
+                'viral_multiplier': self.rng.uniform(2.0, 4.0),
                 'is_viral': False
             }
         
         # 10% événements très négatifs
         elif rand < 0.35:
             return {
-                'name': random.choice(['Platform Ban', 'Scandal Exposed', 'Lawsuit']),
-                'sentiment_shift': random.uniform(-0.8, -0.5),
-                'viral_multiplier': random.uniform(6.0, 12.0),
+                'name': self.rng.choice(['Platform Ban', 'Scandal Exposed', 'Lawsuit']),
+                'sentiment_shift': self.rng.uniform(-0.8, -0.5),
+                'viral_multiplier': self.rng.uniform(6.0, 12.0),
                 'is_viral': True
             }
         
         # 15% événements négatifs
         elif rand < 0.50:
             return {
-                'name': random.choice(['Algorithm Change', 'Drama', 'Criticism']),
-                'sentiment_shift': random.uniform(-0.5, -0.3),
-                'viral_multiplier': random.uniform(3.0, 6.0),
+                'name': self.rng.choice(['Algorithm Change', 'Drama', 'Criticism']),
+                'sentiment_shift': self.rng.uniform(-0.5, -0.3),
+                'viral_multiplier': self.rng.uniform(3.0, 6.0),
                 'is_viral': True
             }
         
@@ -228,7 +232,7 @@ class DynamicTikTokCollector:
         else:
             return {
                 'name': 'normal',
-                'sentiment_shift': random.uniform(-0.15, 0.15),
+                'sentiment_shift': self.rng.uniform(-0.15, 0.15),
                 'viral_multiplier': 1.0,
                 'is_viral': False
             }
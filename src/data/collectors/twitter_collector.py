@@ -5,15 +5,18 @@ TWITTER COLLECTOR - SIMULATION TEMPS RÉEL
 
 import logging
 import random
-from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from src.core.models.social_data import SocialPost, Platform, BusinessCategory
+from src.data.collectors.cursors import SimulatedCursorMixin
+from src.data.collectors.registry import ShardMixin
 
 
-class DynamicTwitterCollector:
+class DynamicTwitterCollector(SimulatedCursorMixin, ShardMixin):
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
+        # Générateur propre au collecteur: seed fixée = collecte reproductible
+        self.rng = random.Random(seed)
         self.iteration = 0
         self.post_id = 0
         self.trending_hashtags = []
@@ -113,33 +116,33 @@ class DynamicTwitterCollector:
             self.logger.info(f"🔥 Event: {event['name']}")
         
         #  tweets par catégorie
-        for category, templates in self.tweet_templates.items():
+        for category, templates in self.shard_items(self.tweet_templates.items()):
             base_ratio = 0.3
             positive_ratio = max(0.0, min(1.0, base_ratio + event['sentiment_shift']))
             
-            posts_per_category = random.randint(8, 12)
+            posts_per_category = self.rng.randint(8, 12)
             for i in range(posts_per_category):
-                is_positive = random.random() < positive_ratio
-                content = random.choice(templates['positive' if is_positive else 'negative'])
+                is_positive = self.rng.random() < positive_ratio
+                content = self.rng.choice(templates['positive' if is_positive else 'negative'])
                 
                 # Métriques réalistes Twitter
-                likes = random.randint(50, 5000)
+                likes = self.rng.randint(50, 5000)
                 if event['viral']:
-                    likes *= random.randint(2, 10)
+                    likes *= self.rng.randint(2, 10)
                 
                 post = SocialPost(
                     id=f"twitter_{self.iteration}_{self.post_id}",
                     platform=Platform.TWITTER,
                     content=content,
-                    author=f"@user{random.randint(1000, 9999)}",
-                    author_followers=random.randint(1000, 100000),
-                    created_at=datetime.now() - timedelta(minutes=random.randint(1, 30)),
+                    author=f"@user{self.rng.randint(1000, 9999)}",
+                    author_followers=self.rng.randint(1000, 100000),
+                    created_at=self._new_post_time(),
                     url=f"https://twitter.com/status/{self.post_id}",
                     metrics={
                         'likes': likes,
-                        'retweets': likes // random.randint(5, 10),
-                        'replies': likes // random.randint(10, 20),
-                        'quotes': likes // random.randint(20, 50)
+                        'retweets': likes // self.rng.randint(5, 10),
+                        'replies': likes // self.rng.randint(10, 20),
+                        'quotes': likes // self.rng.randint(20, 50)
                     },
                     category=category,
                     metadata={
@@ -152,45 +155,46 @@ class DynamicTwitterCollector:
                 posts.append(post)
                 self.post_id += 1
         
+        self._advance_watermark(posts)
         return posts
     
   
     def _get_event_type(self) -> dict:
-        rand = random.random()
+        rand = self.rng.random()
     
         # 10% événements très positifs
         if rand < 0.10:
             return {
-                'name': random.choice(['Viral Success', 'Product Launch', 'Award']),
-                'sentiment_shift': random.uniform(0.5, 0.8), 
-                'viral_multiplier': random.uniform(5.0, 10.0),
+                'name': self.rng.choice(['Viral Success', 'Product Launch', 'Award']),
+                'sentiment_shift': self.rng.uniform(0.5, 0.8), 
+                'viral_multiplier': self.rng.uniform(5.0, 10.0),
                 'viral': True
             }
         
         # 15% événements positifs
         elif rand < 0.25:
             return {
-                'name': random.choice(['Partnership', 'Review', 'Update']),
-                'sentiment_shift': random.uniform(0.2, 0.4), 
-                'viral_multiplier': random.uniform(2.0, 4.0),
+                'name': self.rng.choice(['Partnership', 'Review', 'Update']),
+                'sentiment_shift': self.rng.uniform(0.2, 0.4), 
+                'viral_multiplier': self.rng.uniform(2.0, 4.0),
                 'viral': True
             }
         
         # 10% événements très négatifs
         elif rand < 0.35:
             return {
-                'name': random.choice(['Data Breach', 'Scandal', 'Layoffs']),
-                'sentiment_shift': random.uniform(-0.8, -0.5),  
-                'viral_multiplier': random.uniform(6.0, 12.0),
+                'name': self.rng.choice(['Data Breach', 'Scandal', 'Layoffs']),
+                'sentiment_shift': self.rng.uniform(-0.8, -0.5),  
+                'viral_multiplier': self.rng.uniform(6.0, 12.0),
                 'viral': True
             }
         
         # 15% événements négatifs
         elif rand < 0.50:
             return {
-                'name': random.choice(['Outage', 'Price Hike', 'Complaints']),
-                'sentiment_shift': random.uniform(-0.5, -0.3),  
-                'viral_multiplier': random.uniform(3.0, 6.0),
+                'name': self.rng.choice(['Outage', 'Price Hike', 'Complaints']),
+                'sentiment_shift': self.rng.uniform(-0.5, -0.3),  
+                'viral_multiplier': self.rng.uniform(3.0, 6.0),
                 'viral': True
             }
         
@@ -198,7 +202,7 @@ class DynamicTwitterCollector:
         else:
             return {
                 'name': 'normal',
-                'sentiment_shift': random.uniform(-0.15, 0.15),  
+                'sentiment_shift': self.rng.uniform(-0.15, 0.15),  
                 'viral_multiplier': 1.0,
                 'viral': False
             }
\ No newline at end of file
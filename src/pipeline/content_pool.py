@@ -0,0 +1,194 @@
+"""
+CONTENT POOL - TEXTES DES POSTS PARTAGÉS DANS L'HISTORIQUE
+===========================================================
+
+Responsabilités:
+1. Garder un seul exemplaire de chaque texte de post de l'historique
+   (gabarits des collecteurs, retweets, contenus TikTok + hashtag
+   tendance, ...): les posts reçus des processus de collecte arrivent
+   avec leur propre copie, remplacée par l'exemplaire du pool
+2. Compter les références (posts de l'historique par texte)
+3. Libérer un texte quand son dernier post expire
+4. Exposer les métriques (textes uniques, taux de partage, octets)
+
+La mémoire des textes de l'historique suit ainsi le nombre de textes
+distincts et non le nombre de posts.
+
+Technique clé: table id → texte + compteurs de références (array),
+dictionnaire texte → id pour la recherche, ids libérés réutilisés.
+"""
+
+import logging
+import sys
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.core.models.social_data import SocialPost
+from src.core.models.post_batch import PostBatch
+
+
+class ContentPool:
+    """
+    Pool de textes à comptage de références
+
+    Exemple:
+        pool = ContentPool()
+        pool.intern_posts(posts)      # post.content → exemplaire partagé
+        pool.release_posts(expired)   # textes sans post libérés
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+
+        self._ids: Dict[str, int] = {}             # texte → id
+        self._texts: List[Optional[str]] = []      # id → texte (None = libre)
+        self._refs = array('I')                    # id → nombre de posts
+        self._free: List[int] = []                 # ids réutilisables
+
+        self._unique_bytes = 0
+        self._referenced_bytes = 0
+
+        self.stats = {
+            'acquired': 0,
+            'hits': 0,
+            'released': 0,
+            'freed': 0
+        }
+
+    def _acquire(self, text: str) -> str:
+        content_id = self._ids.get(text)
+        size = sys.getsizeof(text)
+        self.stats['acquired'] += 1
+        self._referenced_bytes += size
+
+        if content_id is not None:
+            self._refs[content_id] += 1
+            self.stats['hits'] += 1
+            return self._texts[content_id]
+
+        if self._free:
+            content_id = self._free.pop()
+            self._texts[content_id] = text
+            self._refs[content_id] = 1
+        else:
+            content_id = len(self._texts)
+            self._texts.append(text)
+            self._refs.append(1)
+        self._ids[text] = content_id
+        self._unique_bytes += size
+        return text
+
+    def _release(self, text: str):
+        content_id = self._ids.get(text)
+        if content_id is None:
+            return
+        size = sys.getsizeof(text)
+        self.stats['released'] += 1
+        self._referenced_bytes -= size
+
+        self._refs[content_id] -= 1
+        if not self._refs[content_id]:
+            del self._ids[text]
+            self._texts[content_id] = None
+            self._free.append(content_id)
+            self._unique_bytes -= size
+            self.stats['freed'] += 1
+
+    def acquire(self, text: str) -> str:
+        """Exemplaire partagé du texte (une référence de plus)"""
+        with self.lock:
+            return self._acquire(text)
+
+    def release(self, text: str):
+        """Une référence de moins (texte libéré à zéro)"""
+        with self.lock:
+            self._release(text)
+
+    def intern_posts(self, posts: Iterable[SocialPost]):
+        """Posts entrant dans l'historique: contenu remplacé par l'exemplaire du pool"""
+        with self.lock:
+            for post in posts:
+                post.content = self._acquire(post.content)
+        if isinstance(posts, PostBatch):
+            # Colonne texte construite avant: elle garderait les anciennes copies
+            posts.release_text('content')
+
+    def release_posts(self, posts: Iterable[SocialPost]):
+        """Posts sortis de l'historique"""
+        with self.lock:
+            for post in posts:
+                self._release(post.content)
+
+    def content_id(self, text: str) -> Optional[int]:
+        return self._ids.get(text)
+
+    def get(self, content_id: int) -> Optional[str]:
+        return self._texts[content_id] if 0 <= content_id < len(self._texts) else None
+
+    def references(self, text: str) -> int:
+        content_id = self._ids.get(text)
+        return self._refs[content_id] if content_id is not None else 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        acquired = self.stats['acquired']
+        return {
+            **self.stats,
+            'unique_contents': len(self._ids),
+            'references': self.stats['acquired'] - self.stats['released'],
+            'hit_rate': round(self.stats['hits'] / acquired, 4) if acquired else 0.0,
+            'unique_bytes': self._unique_bytes,
+            # Taille des textes avec une copie par post
+            'referenced_bytes': self._referenced_bytes
+        }
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    import gc
+    import pickle
+    import tracemalloc
+
+    from src.data.collectors.tiktok_collector import DynamicTikTokCollector
+    from src.data.collectors.twitter_collector import DynamicTwitterCollector
+
+    logging.basicConfig(level=logging.WARNING)
+
+    def history(cycles: int) -> List[SocialPost]:
+        """Historique reçu des processus de collecte (1 copie par post)"""
+        collectors = [DynamicTwitterCollector(seed=1), DynamicTikTokCollector(seed=2)]
+        posts = []
+        for _ in range(cycles):
+            posts += pickle.loads(pickle.dumps(
+                collectors[0].collect_business_trends() + collectors[1].collect_trending_content()
+            ))
+        return posts
+
+    for use_pool in (False, True):
+        gc.collect()
+        tracemalloc.start()
+        pool = ContentPool()
+        posts = history(200)
+        if use_pool:
+            pool.intern_posts(posts)
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        label = 'avec pool' if use_pool else 'sans pool'
+        print(f"🧱 {label}: {len(posts):,} posts, {size / 1e6:.1f} Mo")
+
+    stats = pool.get_statistics()
+    print(f"📚 {stats['unique_contents']} textes uniques, hit rate {stats['hit_rate']:.1%}, "
+          f"{stats['unique_bytes'] / 1e3:.0f} Ko de textes (vs {stats['referenced_bytes'] / 1e6:.1f} Mo "
+          f"avec une copie par post)")
+
+    # Expiration: les textes sans post sont libérés
+    pool.release_posts(posts)
+    print(f"🧹 Après expiration: {len(pool)} textes, {pool.get_statistics()['unique_bytes']} octets")
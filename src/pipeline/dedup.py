@@ -0,0 +1,203 @@
+"""
+DEDUP - INDEX DE DÉDUPLICATION INTER-CYCLES
+============================================
+
+Responsabilités:
+1. Écarter avant l'analyse les posts déjà vus: même identité
+   (plateforme + id) ou, pour les plateformes choisies
+   (content_platforms), même contenu (plateforme + auteur + texte
+   normalisé, ex: page d'API rechargée, repost sous un autre id)
+2. Oublier les posts plus anciens que la fenêtre (expiration)
+3. Borner la mémoire (nombre d'empreintes max)
+4. Exposer les taux de doublons (métriques)
+
+Technique clé: ensemble de hachages par générations. Chaque génération
+couvre window/generations secondes; à la rotation la plus ancienne est
+supprimée en bloc (pas de parcours des entrées). Une génération pleine
+déclenche une rotation anticipée: la mémoire reste bornée, au prix
+d'une fenêtre effective plus courte sous forte charge.
+
+Empreintes: blake2b 64 bits (entiers), ~70 octets par entrée au lieu
+d'une chaîne par post.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+from src.core.models.social_data import SocialPost
+
+
+def _fingerprint(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def identity_key(post: SocialPost) -> int:
+    """Empreinte de l'identité (plateforme + id)"""
+    return _fingerprint(f"id|{post.platform.value}|{post.id}")
+
+
+def content_key(post: SocialPost) -> int:
+    """Empreinte du contenu (plateforme + auteur + texte normalisé)"""
+    text = ' '.join(post.content.lower().split())
+    return _fingerprint(f"content|{post.platform.value}|{post.author.lower()}|{text}")
+
+
+class DedupIndex:
+    """
+    Index borné à expiration
+
+    Exemple:
+        index = DedupIndex(window_seconds=86400, max_entries=1_000_000)
+        unique = index.filter(posts)      # posts jamais vus (ordre conservé)
+
+    content_platforms: plateformes dédupliquées aussi par contenu
+    (None = toutes, vide = identité seule). Les collecteurs simulés
+    réutilisent gabarits et auteurs: leur contenu n'identifie pas un post.
+    """
+
+    def __init__(self, window_seconds: float = 86400, max_entries: int = 1_000_000,
+                 generations: int = 4, content_platforms: Optional[Iterable[str]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.window_seconds = window_seconds
+        self.content_platforms = None if content_platforms is None else frozenset(content_platforms)
+        self.generations = max(2, generations)
+        self.generation_span = window_seconds / self.generations
+        self.generation_capacity = max(1, max_entries // self.generations)
+
+        self.lock = threading.Lock()
+        self._generations: Deque[Set[int]] = deque([set()], maxlen=self.generations)
+        self._generation_started = time.monotonic()
+
+        self.stats = {
+            'checked': 0,
+            'unique': 0,
+            'duplicate_ids': 0,
+            'duplicate_contents': 0,
+            'rotations': 0,
+            'early_rotations': 0
+        }
+
+    def _rotate_if_needed(self):
+        now = time.monotonic()
+        elapsed = now - self._generation_started
+        if elapsed >= self.generation_span:
+            # Générations entièrement expirées (longue inactivité comprise)
+            for _ in range(min(self.generations, int(elapsed // self.generation_span))):
+                self._generations.append(set())
+                self.stats['rotations'] += 1
+            self._generation_started = now
+        elif len(self._generations[-1]) >= self.generation_capacity:
+            self._generations.append(set())
+            self._generation_started = now
+            self.stats['rotations'] += 1
+            self.stats['early_rotations'] += 1
+
+    def _seen(self, key: int) -> bool:
+        return any(key in generation for generation in self._generations)
+
+    def _dedups_content(self, post: SocialPost) -> bool:
+        return self.content_platforms is None or post.platform.value in self.content_platforms
+
+    def filter(self, posts: Iterable[SocialPost]) -> List[SocialPost]:
+        """
+        Posts jamais vus dans la fenêtre (doublons internes au batch
+        compris), enregistrés dans l'index
+        """
+        posts = list(posts)
+        return [posts[i] for i in self.unique_indices(posts)]
+
+    def unique_indices(self, posts: Iterable[SocialPost]) -> List[int]:
+        """
+        Positions des posts jamais vus (voir filter), pour extraire le
+        sous-batch sans reconstruire ses colonnes: batch.take(indices)
+        """
+        unique = []
+        with self.lock:
+            self._rotate_if_needed()
+            current = self._generations[-1]
+
+            for index, post in enumerate(posts):
+                if len(current) >= self.generation_capacity:
+                    self._rotate_if_needed()
+                    current = self._generations[-1]
+
+                self.stats['checked'] += 1
+                identity = identity_key(post)
+                if self._seen(identity):
+                    self.stats['duplicate_ids'] += 1
+                    continue
+
+                current.add(identity)
+                if self._dedups_content(post):
+                    content = content_key(post)
+                    if self._seen(content):
+                        # Nouvel id pour un contenu connu: id retenu aussi
+                        self.stats['duplicate_contents'] += 1
+                        continue
+                    current.add(content)
+
+                unique.append(index)
+                self.stats['unique'] += 1
+        return unique
+
+    def add(self, posts: Iterable[SocialPost]):
+        """Enregistre des posts sans filtrer (ex: état restauré)"""
+        with self.lock:
+            self._rotate_if_needed()
+            current = self._generations[-1]
+            for post in posts:
+                if len(current) >= self.generation_capacity:
+                    self._rotate_if_needed()
+                    current = self._generations[-1]
+                current.add(identity_key(post))
+                if self._dedups_content(post):
+                    current.add(content_key(post))
+
+    def __len__(self) -> int:
+        return sum(len(generation) for generation in self._generations)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        checked = self.stats['checked']
+        duplicates = self.stats['duplicate_ids'] + self.stats['duplicate_contents']
+        return {
+            **self.stats,
+            'duplicates': duplicates,
+            'hit_rate': round(duplicates / checked, 4) if checked else 0.0,
+            'entries': len(self),
+            'window_seconds': self.window_seconds,
+            'content_platforms': None if self.content_platforms is None else sorted(self.content_platforms)
+        }
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    from src.data.collectors.reddit_collector import DynamicRedditCollector
+
+    logging.basicConfig(level=logging.WARNING)
+
+    collector = DynamicRedditCollector()
+    index = DedupIndex(window_seconds=3600, max_entries=10_000)
+
+    batch = collector.collect_business_data()
+    first = index.filter(batch)
+
+    # Page rechargée + même contenu republié sous un autre id
+    reposts = [post.replace(id=post.id + '_repost') for post in batch[:10]]
+    second = index.filter(batch + reposts)
+
+    print(f"✅ 1er batch: {len(first)}/{len(batch)} uniques")
+    print(f"✅ 2e batch: {len(second)}/{len(batch) + len(reposts)} uniques")
+    print(f"📊 {index.get_statistics()}")
+
+    start = time.time()
+    posts = [post.replace(id=f"{post.id}_{i}", author=f"a{i}") for i in range(4000) for post in batch[:5]]
+    index.filter(posts)
+    print(f"⚡ {len(posts)} posts filtrés en {time.time() - start:.3f}s, "
+          f"{index.stats['early_rotations']} rotations anticipées, {len(index)} empreintes")
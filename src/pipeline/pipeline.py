@@ -0,0 +1,668 @@
+"""
+PIPELINE - API EMBARQUABLE INDÉPENDANTE DE FLASK
+=================================================
+
+Responsabilités:
+1. Assembler collecteur, analyseur et détecteur de tendances
+2. Exécuter un cycle unique (run_once) ou un flux continu (start/stop)
+3. Maintenir l'état (historique 7 jours, fenêtre 24h, tendances, métriques)
+   et le publier à chaque cycle sous forme de StateSnapshot immuable
+4. Notifier les abonnés à chaque cycle publié (dashboard, exports, ...)
+5. Créer les composants à la demande (warm_up) pour un démarrage rapide
+6. Sauvegarder périodiquement l'état (snapshot) et le restaurer au
+   démarrage (redémarrage à chaud)
+7. Écarter avant l'analyse les posts déjà vus (DedupIndex)
+8. Partager les textes identiques de l'historique (ContentPool)
+9. Faire circuler les posts en batchs colonnaires (PostBatch): fenêtre
+   et statistiques calculées sur les colonnes NumPy
+
+Usage:
+    pipeline = Pipeline(update_interval=30)
+    pipeline.subscribe(lambda result: print(len(result.analyzed_posts)))
+    pipeline.warm_up_async()          # optionnel: charger les moteurs en fond
+    result = pipeline.run_once()      # un cycle, thread appelant
+    snapshot = pipeline.current       # dernier état publié (lecture sans verrou)
+    pipeline.start()                  # flux continu (1 thread par étape)
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.core.config.settings import config
+from src.core.models.post_batch import PostBatch
+from src.core.models.serialization import Encoded, encode_posts, encode_trends
+from src.core.models.social_data import SocialPost, Trend
+from src.pipeline.content_pool import ContentPool
+from src.pipeline.dedup import DedupIndex
+from src.pipeline.snapshot import SnapshotStore
+from src.pipeline.staged import StagedPipeline
+
+if TYPE_CHECKING:
+    from src.analytics.sentiment.analyzer import SentimentAnalyzer
+    from src.analytics.trends.detector import TrendDetector
+    from src.data.collectors.master_collector import MasterCollector
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """
+    État publié par un cycle: immuable et versionné
+
+    Remplacé en bloc (une affectation de référence) à chaque cycle:
+    un lecteur qui garde sa référence voit un cycle complet et cohérent,
+    sans verrou. Les dictionnaires ne sont jamais modifiés après
+    publication; les vues JSON sont calculées une fois par snapshot
+    (le JSON de chaque post une fois pour toutes, voir to_json).
+    """
+    version: int = 0
+    created_at: Optional[datetime] = None
+    posts: Sequence[SocialPost] = ()            # fenêtre glissante 24h (PostBatch)
+    trends: Tuple[Trend, ...] = ()
+    sentiment_stats: Dict[str, Any] = field(default_factory=dict)
+    performance_metrics: Dict[str, Any] = field(default_factory=lambda: {
+        'posts_processed': 0,
+        'processing_speed': 0,
+        'last_processing_time': 0,
+        'total_iterations': 0,
+        'system_uptime': 0,
+        'platform_stats': {}
+    })
+
+    @cached_property
+    def trends_encoded(self) -> Encoded:
+        """Tendances en JSON (bytes)"""
+        return encode_trends(self.trends)
+
+    def recent_posts_encoded(self, limit: int = 100) -> Encoded:
+        """`limit` posts les plus récents (max 100) en JSON, joints depuis le cache des posts"""
+        return encode_posts(self.posts[-min(limit, 100):] if limit > 0 else ())
+
+
+@dataclass
+class CycleResult:
+    """Batch d'un cycle, complété étape par étape"""
+    iteration: int
+    source: str
+    posts: PostBatch
+    start_time: float = field(default_factory=time.time)
+    analyzed_posts: PostBatch = field(default_factory=PostBatch.empty)
+    trends: List[Trend] = field(default_factory=list)
+    elapsed: float = 0.0
+    metadata: Dict[str, Any] = field(default_factory=dict)  # statut collecte par plateforme
+    duplicates: int = 0                          # posts écartés avant analyse
+    snapshot: Optional[StateSnapshot] = None     # état publié par ce cycle
+
+
+class PipelineState:
+    """État interne modifiable (écrit par l'étape publish uniquement)"""
+
+    def __init__(self):
+        self.is_running = False
+        # Historique history_days: 1 segment (PostBatch) par cycle,
+        # fusionnés au nettoyage
+        self.history: List[PostBatch] = []
+        self.start_time = None
+
+    @property
+    def history_size(self) -> int:
+        return sum(len(segment) for segment in self.history)
+
+
+class Pipeline:
+    """
+    Pipeline collecte → analyse → tendances → publication
+
+    Sans dépendance web: utilisable par le dashboard, les jobs batch
+    et les benchmarks.
+
+    Les composants non fournis sont créés par warm_up() (au premier
+    usage ou en fond via warm_up_async); `readiness` passe de
+    'starting' à 'warming' puis 'ready' (ou 'failed').
+    """
+
+    def __init__(self, collector: Optional['MasterCollector'] = None,
+                 analyzer: Optional['SentimentAnalyzer'] = None,
+                 detector: Optional['TrendDetector'] = None,
+                 update_interval: Optional[float] = None,
+                 queue_size: Optional[int] = None,
+                 missed_tick_policy: Optional[str] = None,
+                 error_backoff: Optional[float] = None,
+                 window_hours: int = 24,
+                 history_days: int = 7,
+                 snapshot_store: Optional[SnapshotStore] = None,
+                 snapshot_interval: Optional[float] = None,
+                 snapshot_max_age: Optional[float] = None,
+                 dedup: Optional[DedupIndex] = None,
+                 content_pool: Optional[ContentPool] = None):
+        self.logger = logging.getLogger(__name__)
+
+        self._collector = collector
+        self._analyzer = analyzer
+        self._detector = detector
+
+        self.readiness = 'starting'
+        self.warm_up_error: Optional[str] = None
+        self.warm_up_time: Optional[float] = None
+        self._warm_up_lock = threading.Lock()
+
+        analysis = config.analysis
+        self.update_interval = update_interval if update_interval is not None else analysis.update_interval
+        # Fréquence adaptative: le pipeline vérifie les échéances des
+        # sources à chaque tick, le collecteur décide qui collecter
+        self.poll_interval = (
+            min(self.update_interval, config.polling.min_interval)
+            if config.polling.adaptive else self.update_interval
+        )
+        self._next_collect = 0.0
+        self.queue_size = queue_size if queue_size is not None else analysis.pipeline_queue_size
+        self.missed_tick_policy = missed_tick_policy or analysis.missed_tick_policy
+        self.error_backoff = error_backoff if error_backoff is not None else analysis.error_backoff
+        self.window_hours = window_hours
+        self.history_days = history_days
+
+        self.snapshot_store = snapshot_store
+        self.snapshot_interval = snapshot_interval if snapshot_interval is not None else config.snapshot.interval
+        self.snapshot_max_age = snapshot_max_age if snapshot_max_age is not None else config.snapshot.max_age
+        self.restored = False
+        self._last_snapshot = time.monotonic()
+
+        self.dedup = dedup if dedup is not None else DedupIndex(
+            window_seconds=config.dedup.window_seconds,
+            max_entries=config.dedup.max_entries,
+            generations=config.dedup.generations,
+            content_platforms=config.dedup.content_platforms
+        )
+
+        # Textes de l'historique (1 exemplaire par texte distinct)
+        self.content_pool = content_pool if content_pool is not None else ContentPool()
+
+        self.state = PipelineState()
+        self.current = StateSnapshot()
+        # Dernier batch analysé de chaque plateforme (entrée du détecteur)
+        self.latest_by_platform: Dict[str, PostBatch] = {}
+        self.subscribers: List[Callable[[CycleResult], None]] = []
+
+        self.staged: Optional[StagedPipeline] = None
+        self.control_lock = threading.Lock()
+        self.iteration = 0
+
+    # ============================================
+    # INITIALISATION DIFFÉRÉE
+    # ============================================
+
+    def warm_up(self) -> bool:
+        """
+        Crée les composants manquants et charge les moteurs IA
+
+        Idempotent et thread-safe: les appels concurrents attendent
+        la fin du premier.
+
+        Returns:
+            True si le pipeline est prêt
+        """
+        if self.readiness == 'ready':
+            return True
+
+        with self._warm_up_lock:
+            if self.readiness == 'ready':
+                return True
+
+            self.readiness = 'warming'
+            start = time.time()
+            try:
+                # Imports lourds (NLP, collecteurs) payés ici et non à l'import
+                if self._collector is None:
+                    from src.data.collectors.master_collector import MasterCollector
+                    self._collector = MasterCollector()
+                if self._analyzer is None:
+                    self._analyzer = self._create_analyzer()
+                if self._detector is None:
+                    from src.analytics.trends.detector import TrendDetector
+                    self._detector = TrendDetector()
+
+                # État précédent disponible avant le chargement des moteurs NLP
+                if not self.restored:
+                    self.restore()
+
+                self._analyzer.warm_up()
+            except Exception as e:
+                self.readiness = 'failed'
+                self.warm_up_error = str(e)
+                self.logger.error(f"❌ Initialisation pipeline: ERREUR - {e}", exc_info=True)
+                return False
+
+            self.warm_up_time = round(time.time() - start, 2)
+            self.warm_up_error = None
+            self.readiness = 'ready'
+            self.logger.info(f"🔥 Pipeline prêt en {self.warm_up_time:.2f}s")
+            return True
+
+    def _create_analyzer(self) -> 'SentimentAnalyzer':
+        """Analyseur local, ou distribué si des workers sont configurés"""
+        distributed = config.distributed
+        if distributed.workers:
+            from src.analytics.sentiment.distributed import (
+                DistributedSentimentAnalyzer, parse_worker_addresses
+            )
+            return DistributedSentimentAnalyzer(
+                parse_worker_addresses(distributed.workers),
+                distributed.authkey.encode('utf-8'),
+                chunk_size=distributed.chunk_size,
+                timeout=distributed.timeout,
+                max_attempts=distributed.max_attempts,
+                reconnect_delay=distributed.reconnect_delay,
+                max_workers=config.analysis.max_workers
+            )
+
+        from src.analytics.sentiment.analyzer import SentimentAnalyzer
+        return SentimentAnalyzer(max_workers=config.analysis.max_workers)
+
+    def restore(self) -> bool:
+        """
+        Recharge le dernier snapshot (posts de la fenêtre, tendances,
+        statistiques, volumes du détecteur)
+
+        L'historique du détecteur n'est restauré que si le snapshot a
+        moins de snapshot_max_age secondes: au-delà, comparer le cycle
+        courant à des volumes anciens fausserait la croissance.
+
+        Returns:
+            True si un snapshot a été appliqué
+        """
+        self.restored = True
+        if self.snapshot_store is None:
+            return False
+
+        snapshot = self.snapshot_store.load()
+        if snapshot is None:
+            return False
+
+        state = self.state
+        previous = self.current
+        cutoff = datetime.now() - timedelta(hours=self.window_hours)
+        posts = PostBatch.from_posts(snapshot['posts']).since(cutoff)
+
+        self.content_pool.intern_posts(posts)
+        state.history.insert(0, posts)
+        self.dedup.add(posts)
+        self.current = StateSnapshot(
+            version=previous.version + 1,
+            created_at=snapshot['saved_at'],
+            posts=PostBatch.concat(state.history),
+            trends=tuple(snapshot['trends']),
+            sentiment_stats=snapshot['sentiment_stats'],
+            performance_metrics={
+                **previous.performance_metrics,
+                'posts_processed': state.history_size,
+                'posts_active_window': state.history_size,
+                'platform_stats': snapshot['platform_stats']
+            }
+        )
+
+        age = (datetime.now() - snapshot['saved_at']).total_seconds()
+        volumes = snapshot['detector'].get('previous_volumes') or {}
+        if age <= self.snapshot_max_age:
+            self.detector.load_state(volumes)
+
+        self.logger.info(
+            f"♻️  Snapshot restauré ({age:.0f}s): {len(posts)} posts, "
+            f"{len(self.current.trends)} tendances, "
+            f"{len(volumes) if age <= self.snapshot_max_age else 0} volumes détecteur"
+        )
+        return True
+
+    def save_snapshot(self) -> bool:
+        """Sauvegarde l'état courant (sans effet si aucun store)"""
+        if self.snapshot_store is None or self._detector is None:
+            return False
+
+        self._last_snapshot = time.monotonic()
+        current = self.current
+        return self.snapshot_store.save(
+            posts=list(current.posts),
+            trends=list(current.trends),
+            sentiment_stats=current.sentiment_stats,
+            platform_stats=current.performance_metrics.get('platform_stats', {}),
+            detector_state=self._detector.get_state()
+        )
+
+    def warm_up_async(self) -> threading.Thread:
+        """Lance warm_up() dans un thread de fond"""
+        thread = threading.Thread(target=self.warm_up, name="pipeline-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def _require(self, component):
+        if component is None and not self.warm_up():
+            raise RuntimeError(f"Pipeline non initialisé: {self.warm_up_error}")
+
+    @property
+    def collector(self) -> 'MasterCollector':
+        self._require(self._collector)
+        return self._collector
+
+    @property
+    def analyzer(self) -> 'SentimentAnalyzer':
+        self._require(self._analyzer)
+        return self._analyzer
+
+    @property
+    def detector(self) -> 'TrendDetector':
+        self._require(self._detector)
+        return self._detector
+
+    # ============================================
+    # ABONNEMENTS
+    # ============================================
+
+    def subscribe(self, callback: Callable[[CycleResult], None]):
+        """Appelé après chaque cycle publié (thread de l'étape publish)"""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[CycleResult], None]):
+        self.subscribers.remove(callback)
+
+    # ============================================
+    # EXÉCUTION
+    # ============================================
+
+    def run_once(self, posts: Optional[List[SocialPost]] = None) -> CycleResult:
+        """
+        Exécute un cycle complet dans le thread appelant
+
+        Args:
+            posts: Posts à traiter (collecte multi-plateformes si None)
+        """
+        if self.is_alive():
+            raise RuntimeError("run_once() indisponible pendant l'exécution continue")
+
+        if self.state.start_time is None:
+            self.state.start_time = datetime.now()
+
+        cycle = self._collect() if posts is None else self._make_cycle(posts, 'manual')
+        return self._publish(self._detect(self._analyze(cycle)))
+
+    def start(self, join_timeout: float = 5.0) -> str:
+        """
+        Démarre le flux continu (une seule boucle active garantie)
+
+        Returns:
+            'started', 'already_running' ou 'stopping' (arrêt précédent
+            encore en cours après join_timeout)
+        """
+        with self.control_lock:
+            if self.state.is_running:
+                return 'already_running'
+
+            # Arrêt précédent encore en cours: attendre la fin de ses étapes
+            if self.staged is not None and self.staged.is_alive():
+                self.staged.join(timeout=join_timeout)
+                if self.staged.is_alive():
+                    return 'stopping'
+
+            self.state.is_running = True
+            self.state.start_time = datetime.now()
+            self.iteration = 0
+
+            self.staged = self._build_staged()
+            self.staged.start()
+
+        return 'started'
+
+    def stop(self):
+        """
+        Arrête le flux continu (immédiat: réveille les attentes en cours)
+        puis sauvegarde un snapshot de l'état
+        """
+        with self.control_lock:
+            self.state.is_running = False
+            if self.staged is not None:
+                self.staged.stop()
+
+        self.save_snapshot()
+
+    def join(self, timeout: Optional[float] = None):
+        if self.staged is not None:
+            self.staged.join(timeout=timeout)
+
+    def is_alive(self) -> bool:
+        return self.staged is not None and self.staged.is_alive()
+
+    def submit(self, posts: List[SocialPost], source: str = 'ingest') -> bool:
+        """
+        Injecte des posts externes en entrée de l'analyse (non-bloquant)
+
+        Returns:
+            False si arrêté ou si la file d'analyse est pleine
+        """
+        if not self.state.is_running or self.staged is None:
+            return False
+        return self.staged.submit('analyze', self._make_cycle(posts, source))
+
+    def retry_after(self) -> int:
+        """Délai conseillé (s) après un refus de submit()"""
+        if self.staged is None:
+            return 1
+        return max(1, round(self.staged.stages[1].stats['last_duration']))
+
+    def _build_staged(self) -> StagedPipeline:
+        """
+        1. Collecte (Multiprocessing)
+        2. Analyse (Multithreading)
+        3. Détection tendances
+        4. Mise à jour état + notification abonnés
+
+        La collecte du cycle N+1 démarre pendant l'analyse du cycle N.
+        """
+        staged = StagedPipeline(queue_size=self.queue_size)
+        staged.add_source(
+            'collect', self._collect_when_due,
+            interval=self.poll_interval,
+            missed_tick_policy=self.missed_tick_policy,
+            error_backoff=self.error_backoff
+        )
+        staged.add_stage('analyze', self._analyze)
+        staged.add_stage('detect', self._detect)
+        staged.add_stage('publish', self._publish)
+        return staged
+
+    # ============================================
+    # ÉTAPES
+    # ============================================
+
+    def _make_cycle(self, posts: List[SocialPost], source: str) -> CycleResult:
+        return CycleResult(iteration=self.iteration, source=source, posts=PostBatch.from_posts(posts))
+
+    def _collect(self, due_only: bool = False) -> CycleResult:
+        """
+        Étape 1: collecte multi-plateformes
+
+        Args:
+            due_only: seulement les sources à échéance (collect_due)
+        """
+        self.iteration += 1
+        self.logger.info(f"📡 Collecte cycle #{self.iteration}...")
+        cycle = self._make_cycle([], 'collect')
+        collect_due = getattr(self.collector, 'collect_due', None) if due_only else None
+        posts = collect_due() if collect_due is not None else self.collector.collect_all_platforms_parallel()
+        cycle.posts = PostBatch.from_posts(posts)
+        cycle.metadata = dict(getattr(self.collector, 'last_cycle', {}))
+        return cycle
+
+    def _collect_when_due(self) -> Optional[CycleResult]:
+        """Étape 1 à chaque tick: collecte si une source est à échéance (None sinon)"""
+        seconds_until_due = getattr(self.collector, 'seconds_until_due', None)
+        if seconds_until_due is not None:
+            due = seconds_until_due() <= 0
+        else:
+            # Collecteur sans échéances par source: période du pipeline
+            due = time.monotonic() >= self._next_collect
+        if not due:
+            return None
+        self._next_collect = time.monotonic() + self.update_interval
+        return self._collect(due_only=True)
+
+    def _analyze(self, cycle: CycleResult) -> CycleResult:
+        """Étape 2: déduplication puis analyse sentiments"""
+        received = len(cycle.posts)
+        cycle.posts = cycle.posts.take(self.dedup.unique_indices(cycle.posts))
+        cycle.duplicates = received - len(cycle.posts)
+        if cycle.duplicates:
+            self.logger.info(f"♊ {cycle.duplicates}/{received} posts déjà vus écartés")
+
+        self.logger.info(f"🧠 Analyse sentiments cycle #{cycle.iteration} ({cycle.source})...")
+        cycle.analyzed_posts = self.analyzer.analyze_batch(cycle.posts)
+        return cycle
+
+    def _detect(self, cycle: CycleResult) -> CycleResult:
+        """
+        Étape 3: détection tendances
+
+        Chaque source a sa période: un cycle n'apporte qu'une partie des
+        plateformes. La détection porte sur le dernier batch de chaque
+        plateforme (celui de ce cycle s'il y en a un): volumes, croissance
+        et tendances publiées couvrent toujours toutes les plateformes.
+        """
+        self.logger.info(f"🔍 Détection tendances cycle #{cycle.iteration}...")
+        self.latest_by_platform.update(cycle.analyzed_posts.split_platforms())
+        cycle.trends = self.detector.detect_business_trends(
+            PostBatch.concat(self.latest_by_platform.values())
+        )
+        return cycle
+
+    def _publish(self, cycle: CycleResult) -> CycleResult:
+        """
+        Étape 4: mise à jour état, métriques, publication du snapshot,
+        notification abonnés
+        """
+        state = self.state
+        self.content_pool.intern_posts(cycle.analyzed_posts)
+        if len(cycle.analyzed_posts):
+            state.history.append(cycle.analyzed_posts)
+
+        # Fenêtre glissante 24h (filtre sur la colonne created_at)
+        now = datetime.now()
+        cutoff = now - timedelta(hours=self.window_hours)
+        window = PostBatch.concat(segment.since(cutoff) for segment in state.history)
+
+        # Statistiques plateformes (comptes mis en cache par segment)
+        platform_stats = Counter()
+        for segment in state.history:
+            platform_stats.update(segment.platform_counts())
+
+        # MÉTRIQUES PERFORMANCE (latence de bout en bout du cycle)
+        cycle.elapsed = time.time() - cycle.start_time
+        pipeline_stats = self.staged.get_statistics() if self.staged is not None else {}
+        previous = self.current
+
+        # Nouveau snapshot construit à part, publié par une seule affectation
+        cycle.snapshot = StateSnapshot(
+            version=previous.version + 1,
+            created_at=now,
+            posts=window,
+            trends=tuple(cycle.trends),
+            sentiment_stats=self.analyzer.get_sentiment_summary(window),
+            performance_metrics={
+                **previous.performance_metrics,
+                'posts_processed': state.history_size,
+                'posts_active_window': len(window),
+                'processing_speed': len(cycle.posts) / cycle.elapsed if cycle.elapsed > 0 else 0,
+                'last_processing_time': round(cycle.elapsed, 2),
+                'total_iterations': self.iteration,
+                'system_uptime': (now - state.start_time).total_seconds(),
+                'platform_stats': dict(platform_stats),
+                'pipeline': pipeline_stats,
+                'scheduling_lag': pipeline_stats.get('scheduling_lag', 0.0),
+                'duplicates_last_cycle': cycle.duplicates,
+                'dedup': self.dedup.get_statistics(),
+                'content_pool': self.content_pool.get_statistics(),
+                'stale_platforms': cycle.metadata.get(
+                    'stale_platforms', previous.performance_metrics.get('stale_platforms', [])
+                )
+            }
+        )
+        self.current = cycle.snapshot
+
+        self._notify(cycle)
+
+        self.logger.info(f"✅ Itération #{cycle.iteration} terminée en {cycle.elapsed:.2f}s")
+        self.logger.info(f"📊 {len(cycle.posts)} nouveaux posts, "
+                         f"{state.history_size} total, "
+                         f"{len(cycle.trends)} tendances")
+
+        # Nettoyage (garder history_days max)
+        if cycle.source == 'collect' and cycle.iteration % 10 == 0:
+            self._expire_history()
+
+        # Snapshot périodique (redémarrage à chaud)
+        if time.monotonic() - self._last_snapshot >= self.snapshot_interval:
+            self.save_snapshot()
+
+        return cycle
+
+    def _notify(self, cycle: CycleResult):
+        for callback in list(self.subscribers):
+            try:
+                callback(cycle)
+            except Exception as e:
+                self.logger.error(f"❌ Erreur abonné pipeline: {e}", exc_info=True)
+
+    def _expire_history(self):
+        """
+        Supprime les posts plus anciens que history_days et fusionne les
+        segments de l'historique (un seul batch après nettoyage)
+        """
+        state = self.state
+        cutoff = datetime.now() - timedelta(days=self.history_days)
+        kept = PostBatch.concat(segment.since(cutoff) for segment in state.history)
+        removed = 0
+        for segment in state.history:
+            expired = segment.before(cutoff)
+            self.content_pool.release_posts(expired)
+            removed += len(expired)
+        state.history = [kept] if len(kept) else []
+        if removed > 0:
+            self.logger.info(f"🧹 Nettoyage: {removed} posts > {self.history_days} jours supprimés")
+
+    # ============================================
+    # MÉTRIQUES
+    # ============================================
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'is_running': self.state.is_running,
+            'readiness': self.readiness,
+            'iteration': self.iteration,
+            'version': self.current.version,
+            'stages': self.staged.get_statistics() if self.staged is not None else {},
+            'snapshot': self.snapshot_store.get_statistics() if self.snapshot_store is not None else None,
+            'dedup': self.dedup.get_statistics(),
+            'content_pool': self.content_pool.get_statistics(),
+            'performance': self.current.performance_metrics
+        }
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    pipeline = Pipeline()
+    pipeline.subscribe(lambda result: print(
+        f"📬 Cycle #{result.iteration}: {len(result.analyzed_posts)} posts, "
+        f"{len(result.trends)} tendances en {result.elapsed:.2f}s"
+    ))
+
+    for _ in range(2):
+        pipeline.run_once()
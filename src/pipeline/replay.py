@@ -0,0 +1,259 @@
+"""
+REPLAY / BACKFILL - RETRAITEMENT HORS-LIGNE
+============================================
+
+Responsabilités:
+1. Relire des posts archivés (NDJSON, .gz/.bz2/.xz, .zip, dossiers);
+   les fichiers NDJSON bruts sont lus par mmap et parsés en parallèle
+2. Les analyser à pleine vitesse (1 processus par CPU)
+3. Fenêtrer par temps événement (created_at) et non par horloge murale
+4. Détecter les tendances par fenêtre (croissance fenêtre N vs N-1)
+5. Écrire les résultats enrichis en bloc (1 écriture par fenêtre)
+
+Usage:
+    python -m src.pipeline.replay archive.ndjson.gz -o enriched.ndjson \\
+        --windows windows.ndjson --window 1800 --processes 8
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+from src.analytics.sentiment.analyzer import SentimentAnalyzer
+from src.analytics.trends.detector import TrendDetector
+from src.core.config.settings import config
+from src.core.models.social_data import SocialPost
+from src.core.models.post_batch import PostBatch
+from src.core.models.serialization import encode_object, encode_posts_ndjson, encode_trends
+from src.data.collectors.file_collector import NDJSONFileCollector
+from src.data.collectors.ndjson_reader import iter_ndjson_streams, iter_post_batches
+
+
+class ReplayRunner:
+    """
+    Rejoue des posts archivés à travers analyse + détection de tendances
+
+    Fenêtres fixes (tumbling) de `window_seconds` alignées sur l'epoch.
+    Un post plus ancien que la fenêtre courante (désordre) est rattaché
+    à la fenêtre courante et compté comme tardif.
+    """
+
+    def __init__(self, posts_output: TextIO, windows_output: Optional[TextIO] = None,
+                 window_seconds: int = 1800, batch_size: int = 1000,
+                 processes: int = 1):
+        self.logger = logging.getLogger(__name__)
+        self.posts_output = posts_output
+        self.windows_output = windows_output
+        self.window_seconds = window_seconds
+        self.batch_size = batch_size
+        self.processes = max(1, processes)
+
+        self.analyzer = SentimentAnalyzer(max_workers=1)
+        self.detector = TrendDetector()
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+        self.window_start: Optional[float] = None
+        self.window_posts: List[SocialPost] = []
+        self.parse_errors = []
+
+        self.stats = {
+            'posts_read': 0,
+            'posts_written': 0,
+            'windows': 0,
+            'late_posts': 0,
+            'parse_errors': 0,
+            'elapsed': 0.0
+        }
+
+    def run(self, paths: Iterable[str]) -> Dict[str, Any]:
+        """Rejoue tous les fichiers puis retourne les statistiques"""
+        start = time.time()
+
+        if self.processes > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                initializer=_init_worker
+            )
+
+        try:
+            for path in paths:
+                if os.path.isfile(path) and path.lower().endswith(_PLAIN_EXTENSIONS):
+                    # Fichier brut: mmap + parsing parallèle des plages
+                    self.logger.info(f"📂 Replay (mmap): {path}")
+                    collector = NDJSONFileCollector(
+                        path,
+                        batch_size=self.batch_size,
+                        processes=self.processes,
+                        executor=self.executor
+                    )
+                    self._replay_batches(collector.iter_batches())
+                    self.parse_errors.extend(collector.errors)
+                    continue
+
+                for name, stream in iter_ndjson_streams(path):
+                    self.logger.info(f"📂 Replay: {name}")
+                    batches = iter_post_batches(stream, self.batch_size, errors=self.parse_errors)
+                    self._replay_batches(batch for _, batch in batches)
+
+            self._flush_window()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+        self.stats['parse_errors'] = len(self.parse_errors)
+        self.stats['elapsed'] = round(time.time() - start, 2)
+        return self.stats
+
+    def _replay_batches(self, batches: Iterable[List[SocialPost]]):
+        """Répartit les posts dans les fenêtres temps événement"""
+        for batch in batches:
+            self.stats['posts_read'] += len(batch)
+
+            for post in batch:
+                post_window = self._window_of(post.created_at)
+
+                if self.window_start is None:
+                    self.window_start = post_window
+                elif post_window > self.window_start:
+                    self._flush_window()
+                    self.window_start = post_window
+                elif post_window < self.window_start:
+                    self.stats['late_posts'] += 1
+
+                self.window_posts.append(post)
+
+    def _window_of(self, created_at: datetime) -> float:
+        """Début de la fenêtre (epoch) contenant created_at"""
+        timestamp = created_at.timestamp()
+        return timestamp - (timestamp % self.window_seconds)
+
+    def _flush_window(self):
+        """Analyse, détecte et écrit la fenêtre courante"""
+        if not self.window_posts:
+            return
+
+        window_start = datetime.fromtimestamp(self.window_start)
+        window_end = window_start + timedelta(seconds=self.window_seconds)
+
+        analyzed = self._analyze(self.window_posts)
+        trends = self.detector.detect_business_trends(analyzed, now=window_end)
+
+        # Écriture en bloc (JSON de chaque post encodé une fois)
+        self.posts_output.write(encode_posts_ndjson(analyzed).decode('utf-8'))
+
+        if self.windows_output is not None:
+            self.windows_output.write(encode_object({
+                'window_start': window_start.isoformat(),
+                'window_end': window_end.isoformat(),
+                'posts': len(analyzed),
+                'sentiment': self.analyzer.get_sentiment_summary(analyzed, now=window_end),
+                'trends': encode_trends(trends)
+            }).decode('utf-8') + '\n')
+
+        self.stats['posts_written'] += len(analyzed)
+        self.stats['windows'] += 1
+        self.logger.info(
+            f"🪟 Fenêtre {window_start:%Y-%m-%d %H:%M} → {len(analyzed)} posts, "
+            f"{len(trends)} tendances"
+        )
+
+        self.window_posts = []
+
+    def _analyze(self, posts: List[SocialPost]) -> PostBatch:
+        """Analyse sentiment répartie sur les processus (batchs des chunks concaténés)"""
+        chunks = [posts[i:i + self.batch_size] for i in range(0, len(posts), self.batch_size)]
+
+        if self.executor is None:
+            return PostBatch.concat(self.analyzer.analyze_batch(chunk) for chunk in chunks)
+        return PostBatch.concat(self.executor.map(_analyze_in_worker, chunks))
+
+
+_PLAIN_EXTENSIONS = ('.ndjson', '.jsonl', '.json')
+
+
+# ============================================
+# FONCTIONS WORKER (PROCESSUS SÉPARÉS)
+# ============================================
+
+_worker_analyzer: Optional[SentimentAnalyzer] = None
+
+
+def _init_worker():
+    """Initialise un analyseur par processus (logs réduits)"""
+    global _worker_analyzer
+    logging.getLogger('src.analytics.sentiment.analyzer').setLevel(logging.WARNING)
+    _worker_analyzer = SentimentAnalyzer(max_workers=1)
+
+
+def _analyze_in_worker(posts: List[SocialPost]) -> PostBatch:
+    """Analyse un chunk dans un processus worker"""
+    return _worker_analyzer.analyze_batch(posts)
+
+
+# ============================================
+# CLI
+# ============================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay/backfill hors-ligne: analyse + tendances sur posts archivés"
+    )
+    parser.add_argument('inputs', nargs='+',
+                        help="Fichiers NDJSON, archives (.gz/.bz2/.xz/.zip) ou dossiers")
+    parser.add_argument('-o', '--output', required=True,
+                        help="Fichier NDJSON des posts enrichis")
+    parser.add_argument('--windows', default=None,
+                        help="Fichier NDJSON des résultats par fenêtre (sentiment + tendances)")
+    parser.add_argument('--window', type=int, default=config.replay.window_seconds,
+                        help="Taille des fenêtres temps événement (secondes)")
+    parser.add_argument('--batch-size', type=int, default=config.replay.batch_size,
+                        help="Posts par batch d'analyse")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help="Processus d'analyse parallèles")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Logs détaillés de l'analyseur")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    if not args.verbose:
+        logging.getLogger('src.analytics.sentiment.analyzer').setLevel(logging.WARNING)
+        logging.getLogger('src.analytics.trends.detector').setLevel(logging.WARNING)
+
+    windows_output = open(args.windows, 'w', encoding='utf-8') if args.windows else None
+    try:
+        with open(args.output, 'w', encoding='utf-8') as posts_output:
+            runner = ReplayRunner(
+                posts_output,
+                windows_output,
+                window_seconds=args.window,
+                batch_size=args.batch_size,
+                processes=args.processes
+            )
+            stats = runner.run(args.inputs)
+    finally:
+        if windows_output is not None:
+            windows_output.close()
+
+    for error in runner.parse_errors[:10]:
+        logging.warning(f"⚠️  {error}")
+
+    rate = stats['posts_written'] / stats['elapsed'] if stats['elapsed'] > 0 else 0
+    logging.info(
+        f"✅ Replay terminé: {stats['posts_written']} posts, {stats['windows']} fenêtres, "
+        f"{stats['late_posts']} tardifs, {stats['parse_errors']} erreurs "
+        f"en {stats['elapsed']:.1f}s ({rate:.0f} posts/sec)"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
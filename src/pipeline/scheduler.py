@@ -0,0 +1,119 @@
+"""
+CYCLE SCHEDULER - ORDONNANCEMENT À CADENCE FIXE
+================================================
+
+Responsabilités:
+1. Déclencher les cycles à cadence fixe (t0, t0+T, t0+2T, ...)
+   sans dérive liée au temps de traitement
+2. Appliquer une politique pour les ticks manqués (skip / catch_up)
+3. Attentes interruptibles via threading.Event (arrêt instantané)
+4. Mesurer le retard d'ordonnancement (lag)
+
+Technique clé: horloge monotone + Event.wait(timeout)
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class CycleScheduler:
+    """
+    Ordonnanceur à cadence fixe
+
+    Politiques de ticks manqués (traitement plus long que l'intervalle):
+    - skip: les ticks dépassés sont abandonnés, reprise au prochain tick futur
+    - catch_up: les ticks dépassés sont déclenchés immédiatement, l'un après
+      l'autre (limité à max_catch_up pour éviter une rafale)
+    """
+
+    SKIP = 'skip'
+    CATCH_UP = 'catch_up'
+
+    def __init__(self, interval: float, missed_tick_policy: str = SKIP,
+                 stop_event: Optional[threading.Event] = None,
+                 max_catch_up: int = 3):
+        if missed_tick_policy not in (self.SKIP, self.CATCH_UP):
+            raise ValueError(f"Politique de ticks manqués inconnue: {missed_tick_policy}")
+
+        self.interval = interval
+        self.missed_tick_policy = missed_tick_policy
+        self.stop_event = stop_event or threading.Event()
+        self.max_catch_up = max_catch_up
+
+        self.next_tick: Optional[float] = None
+
+        self.stats = {
+            'ticks': 0,
+            'missed_ticks': 0,
+            'caught_up_ticks': 0,
+            'last_lag': 0.0,
+            'max_lag': 0.0,
+            'average_lag': 0.0
+        }
+
+    def wait_next(self) -> bool:
+        """
+        Attend le prochain tick
+
+        Returns:
+            True si le tick est déclenché, False si arrêt demandé
+        """
+        now = time.monotonic()
+        if self.next_tick is None:
+            # Premier tick: immédiat
+            self.next_tick = now
+
+        elif now > self.next_tick + self.interval:
+            # Traitement plus long que l'intervalle: ticks manqués
+            missed = int((now - self.next_tick) // self.interval)
+            if self.missed_tick_policy == self.SKIP:
+                self.next_tick += missed * self.interval
+                self.stats['missed_ticks'] += missed
+            elif missed > self.max_catch_up:
+                dropped = missed - self.max_catch_up
+                self.next_tick += dropped * self.interval
+                self.stats['missed_ticks'] += dropped
+
+        delay = self.next_tick - now
+        if delay > 0 and self.stop_event.wait(delay):
+            return False
+        if self.stop_event.is_set():
+            return False
+
+        self._record_tick(time.monotonic() - self.next_tick)
+        self.next_tick += self.interval
+        return True
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Pause interruptible (ex: backoff après erreur)
+
+        Returns:
+            True si la pause est allée à son terme, False si arrêt demandé
+        """
+        return not self.stop_event.wait(seconds)
+
+    def stop(self):
+        """Réveille immédiatement toute attente en cours"""
+        self.stop_event.set()
+
+    def _record_tick(self, lag: float):
+        """Met à jour les métriques de retard"""
+        lag = max(lag, 0.0)
+        if lag >= self.interval:
+            self.stats['caught_up_ticks'] += 1
+
+        self.stats['ticks'] += 1
+        self.stats['last_lag'] = round(lag, 3)
+        self.stats['max_lag'] = round(max(self.stats['max_lag'], lag), 3)
+        self.stats['average_lag'] = round(
+            (self.stats['average_lag'] * (self.stats['ticks'] - 1) + lag) / self.stats['ticks'], 3
+        )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'interval': self.interval,
+            'missed_tick_policy': self.missed_tick_policy
+        }
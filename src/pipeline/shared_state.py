@@ -0,0 +1,237 @@
+"""
+SHARED STATE - ÉTAT PUBLIÉ PARTAGÉ ENTRE PROCESSUS (MMAP)
+==========================================================
+
+Responsabilités:
+1. Publier le dernier état (JSON) dans un fichier mappé en mémoire
+2. Le lire depuis d'autres processus sans verrou (workers API)
+3. Garantir qu'un lecteur ne voit jamais une écriture partielle
+
+Format du fichier:
+    [magic 8o][séquence 8o][longueur 8o][payload JSON ...]
+
+Technique clé: seqlock. L'écrivain passe la séquence à une valeur
+impaire, écrit le payload, puis la repasse à une valeur paire. Le
+lecteur recommence si la séquence est impaire ou a changé pendant sa
+copie.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+
+_MAGIC = b'SBISTAT1'
+_HEADER = struct.Struct('<8sQQ')
+_SEQUENCE = struct.Struct('<Q')
+_SEQUENCE_OFFSET = 8
+
+
+class SharedStateWriter:
+    """
+    Écrivain unique (processus pipeline)
+
+    Le fichier est dimensionné une fois (capacity); un état plus gros
+    n'est pas publié (compté dans stats['oversize']).
+    """
+
+    def __init__(self, path: str, capacity: int = 16 * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.capacity = capacity
+        self.sequence = 0
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._file = open(path, 'w+b')
+        self._file.truncate(_HEADER.size + capacity)
+        self._mm = mmap.mmap(self._file.fileno(), _HEADER.size + capacity)
+        self._mm[:_HEADER.size] = _HEADER.pack(_MAGIC, 0, 0)
+
+        self.stats = {
+            'published': 0,
+            'oversize': 0,
+            'last_size_bytes': 0,
+            'last_write_time': 0.0
+        }
+
+    def publish(self, state: Union[Dict[str, Any], bytes]) -> bool:
+        """
+        Publie un état (remplace le précédent)
+
+        Args:
+            state: état, ou état déjà encodé en JSON UTF-8
+
+        Returns:
+            False si l'état dépasse la capacité du fichier
+        """
+        if isinstance(state, bytes):
+            payload = state
+        else:
+            payload = json.dumps(state, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if len(payload) > self.capacity:
+            self.stats['oversize'] += 1
+            self.logger.error(
+                f"❌ État partagé trop gros: {len(payload)} octets > {self.capacity}"
+            )
+            return False
+
+        start = time.time()
+        with self.lock:
+            # Séquence impaire: écriture en cours
+            self.sequence += 1
+            _SEQUENCE.pack_into(self._mm, _SEQUENCE_OFFSET, self.sequence)
+
+            self._mm[_HEADER.size:_HEADER.size + len(payload)] = payload
+            _HEADER.pack_into(self._mm, 0, _MAGIC, self.sequence, len(payload))
+
+            # Séquence paire: état cohérent
+            self.sequence += 1
+            _SEQUENCE.pack_into(self._mm, _SEQUENCE_OFFSET, self.sequence)
+
+        self.stats['published'] += 1
+        self.stats['last_size_bytes'] = len(payload)
+        self.stats['last_write_time'] = round(time.time() - start, 4)
+        return True
+
+    def close(self):
+        with self.lock:
+            self._mm.close()
+            self._file.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {'path': self.path, 'sequence': self.sequence, **self.stats}
+
+
+class SharedStateReader:
+    """
+    Lecteur (workers API), un par processus
+
+    L'état décodé est mis en cache jusqu'à la publication suivante:
+    une requête ne coûte qu'une lecture de la séquence.
+    """
+
+    def __init__(self, path: str, max_retries: int = 100):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_retries = max_retries
+
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, _, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Fichier d'état partagé invalide: {path}")
+
+        self._cached_sequence = -1
+        self._cached_state: Dict[str, Any] = {}
+
+        self.stats = {
+            'reads': 0,
+            'decodes': 0,
+            'retries': 0
+        }
+
+    def sequence(self) -> int:
+        return _SEQUENCE.unpack_from(self._mm, _SEQUENCE_OFFSET)[0]
+
+    def read(self) -> Tuple[int, Dict[str, Any]]:
+        """
+        Dernier état publié
+
+        Returns:
+            (séquence, état) - état vide si rien n'a encore été publié
+
+        Raises:
+            TimeoutError: écritures concurrentes trop fréquentes
+        """
+        self.stats['reads'] += 1
+        if self.sequence() == self._cached_sequence:
+            return self._cached_sequence, self._cached_state
+
+        for _ in range(self.max_retries):
+            _, before, length = _HEADER.unpack_from(self._mm, 0)
+            if before % 2 == 1:
+                self.stats['retries'] += 1
+                time.sleep(0)
+                continue
+
+            payload = self._mm[_HEADER.size:_HEADER.size + length]
+            if self.sequence() != before:
+                self.stats['retries'] += 1
+                continue
+
+            self._cached_state = json.loads(payload) if length else {}
+            self._cached_sequence = before
+            self.stats['decodes'] += 1
+            return self._cached_sequence, self._cached_state
+
+        raise TimeoutError("État partagé: lecture cohérente impossible")
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {'path': self.path, 'sequence': self._cached_sequence, **self.stats}
+
+
+def wait_for_shared_state(path: str, timeout: float = 10.0) -> Optional[SharedStateReader]:
+    """Ouvre un lecteur dès que l'écrivain a créé le fichier"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            try:
+                return SharedStateReader(path)
+            except (OSError, ValueError, struct.error):
+                pass
+        time.sleep(0.1)
+    return None
+
+
+def _stress_reader(path: str, rounds: int, results):
+    """Lecteur du test unitaire: compte les états incohérents"""
+    reader = SharedStateReader(path)
+    torn = 0
+    for _ in range(rounds):
+        _, state = reader.read()
+        if state and state['values'] != [state['version']] * len(state['values']):
+            torn += 1
+    results.put((torn, reader.stats['decodes'], reader.stats['retries']))
+
+
+# ============================================
+# TEST UNITAIRE
+# ============================================
+
+if __name__ == "__main__":
+    import multiprocessing
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), 'state.bin')
+    writer = SharedStateWriter(path, capacity=1024 * 1024)
+    writer.publish({'version': 0, 'values': [0] * 1000})
+
+    results = multiprocessing.Queue()
+    readers = [multiprocessing.Process(target=_stress_reader, args=(path, 20000, results))
+               for _ in range(4)]
+    for process in readers:
+        process.start()
+
+    version = 0
+    while any(process.is_alive() for process in readers):
+        version += 1
+        writer.publish({'version': version, 'values': [version] * 1000})
+
+    for process in readers:
+        process.join()
+    outcomes = [results.get() for _ in readers]
+
+    print(f"✅ {version} publications, {len(readers)} lecteurs")
+    print(f"📖 (lectures incohérentes, décodages, relectures) par lecteur: {outcomes}")
@@ -0,0 +1,142 @@
+"""
+SNAPSHOT - SAUVEGARDE / RESTAURATION DE L'ÉTAT DU PIPELINE
+===========================================================
+
+Responsabilités:
+1. Capturer l'état utile au redémarrage: posts récents (fenêtre 24h),
+   tendances, statistiques sentiment/plateformes, volumes du détecteur
+2. L'écrire de façon atomique (fichier temporaire + os.replace):
+   un crash pendant l'écriture laisse le snapshot précédent intact
+3. Le recharger au démarrage (JSON compressé gzip)
+
+Un nœud redémarré sert ainsi des dashboards corrects en quelques
+secondes, et la croissance des tendances est calculée par rapport au
+dernier cycle réel (et non à zéro).
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.core.models.serialization import encode_object, encode_posts, encode_trends
+from src.core.models.social_data import SocialPost, Trend
+
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotStore:
+    """
+    Fichier snapshot unique, remplacé atomiquement à chaque sauvegarde
+
+    Format: JSON compact compressé (gzip), une clé `version` pour
+    ignorer les snapshots d'un format incompatible.
+    """
+
+    def __init__(self, path: str, max_posts: int = 5000):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_posts = max_posts
+
+        self.stats = {
+            'saved': 0,
+            'loaded': 0,
+            'errors': 0,
+            'last_save_time': 0.0,
+            'last_size_bytes': 0
+        }
+
+    def save(self, posts: List[SocialPost], trends: List[Trend],
+             sentiment_stats: Dict[str, Any], platform_stats: Dict[str, int],
+             detector_state: Dict[str, int]) -> bool:
+        """
+        Écrit le snapshot (atomique)
+
+        Returns:
+            False en cas d'erreur (loggée, l'ancien snapshot est conservé)
+        """
+        start = time.time()
+        saved_posts = posts[-self.max_posts:]
+        # Posts: JSON déjà encodé par post (réutilisé d'un snapshot à l'autre)
+        payload = encode_object({
+            'version': SNAPSHOT_VERSION,
+            'saved_at': datetime.now().isoformat(),
+            'posts': encode_posts(saved_posts),
+            'trends': encode_trends(trends),
+            'sentiment_stats': sentiment_stats,
+            'platform_stats': platform_stats,
+            'detector': {'previous_volumes': detector_state}
+        })
+        data = gzip.compress(payload, compresslevel=5)
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        temp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Même dossier que la cible: os.replace reste atomique
+            fd, temp_path = tempfile.mkstemp(prefix='.snapshot-', dir=directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            temp_path = None
+        except OSError as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"❌ Snapshot {self.path}: ERREUR - {e}")
+            return False
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self.stats['saved'] += 1
+        self.stats['last_save_time'] = round(time.time() - start, 3)
+        self.stats['last_size_bytes'] = len(data)
+        self.logger.info(
+            f"💾 Snapshot: {len(saved_posts)} posts, {len(trends)} tendances, "
+            f"{len(data) / 1024:.0f} Ko en {self.stats['last_save_time']:.2f}s"
+        )
+        return True
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Charge le snapshot
+
+        Returns:
+            {'saved_at', 'posts', 'trends', 'sentiment_stats',
+             'platform_stats', 'detector'} ou None (absent, illisible
+             ou version incompatible)
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with gzip.open(self.path, 'rb') as f:
+                payload = json.loads(f.read())
+
+            if payload.get('version') != SNAPSHOT_VERSION:
+                self.logger.warning(f"⚠️  Snapshot ignoré: version {payload.get('version')}")
+                return None
+
+            snapshot = {
+                'saved_at': datetime.fromisoformat(payload['saved_at']),
+                'posts': [SocialPost.from_dict(data) for data in payload['posts']],
+                'trends': [Trend.from_dict(data) for data in payload['trends']],
+                'sentiment_stats': payload.get('sentiment_stats') or {},
+                'platform_stats': payload.get('platform_stats') or {},
+                'detector': payload.get('detector') or {}
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"❌ Snapshot illisible {self.path}: {e}")
+            return None
+
+        self.stats['loaded'] += 1
+        return snapshot
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {'path': self.path, **self.stats}
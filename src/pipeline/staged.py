@@ -0,0 +1,245 @@
+"""
+STAGED PIPELINE - EXÉCUTION PIPELINÉE DES ÉTAPES
+=================================================
+
+Responsabilités:
+1. Exécuter chaque étape (collecte, analyse, tendances, publication)
+   dans son propre thread
+2. Transmettre les batches entre étapes via des files bornées
+3. Permettre la collecte du cycle N+1 pendant l'analyse du cycle N
+4. Mesurer l'utilisation de chaque étape et la profondeur des files
+   (identification du goulot d'étranglement)
+
+Technique clé: threading + queue.Queue bornées (backpressure)
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.pipeline.scheduler import CycleScheduler
+
+
+class Stage:
+    """
+    Étape du pipeline exécutée dans un thread dédié
+
+    Lit ses entrées dans input_queue, écrit le résultat dans output_queue.
+    Un résultat None n'est pas transmis (batch filtré).
+    """
+
+    def __init__(self, name: str, func: Callable[[Any], Any],
+                 stop_event: threading.Event,
+                 input_queue: Optional[queue.Queue] = None,
+                 output_queue: Optional[queue.Queue] = None):
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.func = func
+        self.stop_event = stop_event
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.thread: Optional[threading.Thread] = None
+
+        self.stats = {
+            'processed': 0,
+            'errors': 0,
+            'busy_time': 0.0,
+            'blocked_time': 0.0,
+            'last_duration': 0.0
+        }
+        self.started_at = None
+
+    def start(self):
+        self.started_at = time.time()
+        self.thread = threading.Thread(target=self._run, name=f"stage-{self.name}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        """Boucle de l'étape: attendre une entrée, traiter, transmettre"""
+        while not self.stop_event.is_set():
+            try:
+                item = self.input_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            result = self._process(item)
+            if result is not None:
+                self._forward(result)
+
+    def _process(self, *args) -> Any:
+        """Exécute la fonction de l'étape et mesure le temps actif"""
+        start = time.time()
+        try:
+            result = self.func(*args)
+            self.stats['processed'] += 1
+            return result
+        except Exception as e:
+            self.stats['errors'] += 1
+            self.logger.error(f"❌ Étape {self.name}: ERREUR - {e}", exc_info=True)
+            return None
+        finally:
+            duration = time.time() - start
+            self.stats['busy_time'] += duration
+            self.stats['last_duration'] = round(duration, 3)
+
+    def _forward(self, result: Any):
+        """Transmet à l'étape suivante (bloque si la file est pleine)"""
+        if self.output_queue is None:
+            return
+
+        start = time.time()
+        while not self.stop_event.is_set():
+            try:
+                self.output_queue.put(result, timeout=0.5)
+                break
+            except queue.Full:
+                continue
+        self.stats['blocked_time'] += time.time() - start
+
+    def is_alive(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        elapsed = time.time() - self.started_at if self.started_at else 0
+        return {
+            **self.stats,
+            'busy_time': round(self.stats['busy_time'], 2),
+            'blocked_time': round(self.stats['blocked_time'], 2),
+            'utilization': round(self.stats['busy_time'] / elapsed, 3) if elapsed > 0 else 0.0
+        }
+
+
+class SourceStage(Stage):
+    """
+    Première étape: produit un batch à chaque tick (sans file d'entrée)
+
+    Cadence fixe donnée par un CycleScheduler: le temps de traitement
+    ne décale pas les cycles suivants.
+    """
+
+    def __init__(self, name: str, func: Callable[[], Any],
+                 stop_event: threading.Event, scheduler: CycleScheduler,
+                 error_backoff: float = 30.0,
+                 output_queue: Optional[queue.Queue] = None):
+        super().__init__(name, func, stop_event, output_queue=output_queue)
+        self.scheduler = scheduler
+        self.error_backoff = error_backoff
+
+    def _run(self):
+        while self.scheduler.wait_next():
+            errors_before = self.stats['errors']
+            result = self._process()
+            if result is not None:
+                self._forward(result)
+
+            # Backoff interruptible après une erreur
+            if self.stats['errors'] > errors_before:
+                self.scheduler.sleep(self.error_backoff)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **super().get_statistics(),
+            'schedule': self.scheduler.get_statistics()
+        }
+
+
+class StagedPipeline:
+    """
+    Pipeline d'étapes chaînées par des files bornées
+
+    Exemple:
+        pipeline = StagedPipeline(queue_size=2)
+        pipeline.add_source('collect', collect, interval=30, missed_tick_policy='skip')
+        pipeline.add_stage('analyze', analyze)
+        pipeline.add_stage('publish', publish)
+        pipeline.start()
+    """
+
+    def __init__(self, queue_size: int = 2):
+        self.logger = logging.getLogger(__name__)
+        self.queue_size = queue_size
+        self.stop_event = threading.Event()
+        self.stages: List[Stage] = []
+        self.queues: Dict[str, queue.Queue] = {}
+        self.rejected: Dict[str, int] = {}
+
+    def add_source(self, name: str, func: Callable[[], Any], interval: float,
+                   missed_tick_policy: str = CycleScheduler.SKIP,
+                   error_backoff: float = 30.0) -> 'StagedPipeline':
+        """Ajoute l'étape source (doit être la première)"""
+        if self.stages:
+            raise ValueError("La source doit être la première étape du pipeline")
+
+        scheduler = CycleScheduler(interval, missed_tick_policy, stop_event=self.stop_event)
+        self.stages.append(SourceStage(name, func, self.stop_event, scheduler, error_backoff))
+        return self
+
+    def add_stage(self, name: str, func: Callable[[Any], Any]) -> 'StagedPipeline':
+        """Ajoute une étape alimentée par la précédente"""
+        if not self.stages:
+            raise ValueError("Ajouter une source avant les autres étapes")
+
+        # File bornée entre l'étape précédente et celle-ci
+        link = queue.Queue(maxsize=self.queue_size)
+        self.queues[name] = link
+        self.rejected[name] = 0
+        self.stages[-1].output_queue = link
+        self.stages.append(Stage(name, func, self.stop_event, input_queue=link))
+        return self
+
+    def submit(self, stage_name: str, item: Any) -> bool:
+        """
+        Injecte un batch directement en entrée d'une étape (non-bloquant)
+
+        Returns:
+            False si la file de l'étape est pleine (backpressure)
+        """
+        if self.stop_event.is_set():
+            return False
+        try:
+            self.queues[stage_name].put_nowait(item)
+            return True
+        except queue.Full:
+            self.rejected[stage_name] += 1
+            return False
+
+    def start(self):
+        """Démarre un thread par étape"""
+        for stage in self.stages:
+            stage.start()
+        self.logger.info(
+            f"🔗 Pipeline démarré: {' → '.join(s.name for s in self.stages)} "
+            f"(files: {self.queue_size})"
+        )
+
+    def stop(self):
+        """Demande l'arrêt (non-bloquant, réveille les attentes en cours)"""
+        self.stop_event.set()
+
+    def join(self, timeout: Optional[float] = None):
+        """Attend la fin des threads d'étapes (timeout global)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for stage in self.stages:
+            if stage.thread:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                stage.thread.join(timeout=remaining)
+
+    def is_alive(self) -> bool:
+        return any(stage.is_alive() for stage in self.stages)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Utilisation par étape, profondeur des files, goulot"""
+        stages = {stage.name: stage.get_statistics() for stage in self.stages}
+        bottleneck = max(stages, key=lambda name: stages[name]['utilization']) if stages else None
+
+        return {
+            'stages': stages,
+            'queues': {
+                name: {'depth': q.qsize(), 'capacity': q.maxsize, 'rejected': self.rejected[name]}
+                for name, q in self.queues.items()
+            },
+            'bottleneck': bottleneck,
+            'scheduling_lag': self.stages[0].scheduler.stats['last_lag'] if self.stages else 0.0
+        }
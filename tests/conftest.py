@@ -0,0 +1,58 @@
+"""
+Configuration pytest: racine du dépôt dans sys.path (imports `src.`)
+
+Lancement: python -m pytest -q (depuis la racine du dépôt)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from src.analytics.sentiment.analyzer import SentimentAnalyzer
+from src.core.models.social_data import BusinessCategory, Platform, SocialPost
+
+
+class LexiconAnalyzer(SentimentAnalyzer):
+    """SentimentAnalyzer sans TextBlob/VADER: score tiré d'un lexique fixe"""
+
+    LEXICON = {'great': 0.8, 'love': 0.6, 'broken': -0.6, 'scam': -0.9}
+
+    def warm_up(self):
+        pass
+
+    def _hybrid_sentiment_analysis(self, text: str) -> float:
+        words = text.lower().split()
+        return max(-1.0, min(1.0, sum(self.LEXICON.get(word, 0.0) for word in words)))
+
+
+@pytest.fixture
+def analyzer() -> SentimentAnalyzer:
+    return LexiconAnalyzer(max_workers=2)
+
+
+def build_posts(count: int, platform: Platform = Platform.TWITTER, start: int = 0,
+                now: datetime = None) -> List[SocialPost]:
+    """Posts récents (dernière heure), contenus et auteurs distincts"""
+    now = now or datetime.now()
+    texts = ['great AI startup', 'crypto scam again', 'love this gaming setup', 'remote work is broken']
+    return [
+        SocialPost(
+            id=f"{platform.value}_{start + i}", platform=platform,
+            content=f"{texts[i % len(texts)]} #{start + i}",
+            author=f"@user{start + i}", author_followers=100 + i,
+            created_at=now - timedelta(minutes=(count - i) % 60), url=f"https://example.com/{start + i}",
+            metrics={'likes': i, 'comments': i % 7}, category=list(BusinessCategory)[i % len(BusinessCategory)]
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def make_posts():
+    return build_posts
@@ -0,0 +1,114 @@
+"""
+Tests DedupIndex: identité, contenu, fenêtre d'expiration, mémoire bornée
+"""
+
+import pytest
+
+from src.core.models.social_data import Platform
+from src.pipeline import dedup as dedup_module
+from src.pipeline.dedup import DedupIndex
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(dedup_module.time, 'monotonic', clock)
+    return clock
+
+
+def test_identity_duplicates(make_posts):
+    index = DedupIndex()
+    posts = make_posts(10)
+    assert index.filter(posts) == posts
+    assert index.filter(posts) == []
+    assert index.stats['duplicate_ids'] == 10
+
+
+def test_duplicates_within_batch(make_posts):
+    posts = make_posts(5)
+    assert DedupIndex().unique_indices(posts + posts[:2]) == [0, 1, 2, 3, 4]
+
+
+def test_content_duplicates_all_platforms_by_default(make_posts):
+    index = DedupIndex()
+    posts = make_posts(5)
+    index.filter(posts)
+    reposts = [post.replace(id=post.id + '_repost') for post in posts]
+    assert index.filter(reposts) == []
+    assert index.stats['duplicate_contents'] == 5
+    # L'id du repost est retenu: revu, il compte comme doublon d'identité
+    index.filter(reposts)
+    assert index.stats['duplicate_ids'] == 5
+
+
+def test_content_dedup_scoped_to_platforms(make_posts):
+    index = DedupIndex(content_platforms=['reddit'])
+    twitter = make_posts(5)
+    reddit = make_posts(5, platform=Platform.REDDIT)
+    index.filter(twitter + reddit)
+
+    reposts = [post.replace(id=post.id + '_repost') for post in twitter + reddit]
+    assert index.filter(reposts) == reposts[:5]
+    assert index.stats['duplicate_contents'] == 5
+
+
+def test_content_dedup_disabled(make_posts):
+    index = DedupIndex(content_platforms=())
+    posts = make_posts(5)
+    index.filter(posts)
+    reposts = [post.replace(id=post.id + '_repost') for post in posts]
+    assert index.filter(reposts) == reposts
+    assert len(index) == 10
+
+
+def test_window_expiry(clock, make_posts):
+    index = DedupIndex(window_seconds=400, generations=4)
+    posts = make_posts(3)
+    index.filter(posts)
+
+    clock.now += 300          # encore dans la fenêtre
+    assert index.filter(posts) == []
+
+    clock.now += 101          # 401s: toutes les générations du 1er passage expirées
+    assert index.filter(posts) == posts
+
+
+def test_long_idle_clears_index(clock, make_posts):
+    index = DedupIndex(window_seconds=400, generations=4)
+    index.filter(make_posts(3))
+    clock.now += 10_000
+    index._rotate_if_needed()
+    assert len(index) == 0
+
+
+def test_memory_bounded_by_early_rotation(make_posts):
+    index = DedupIndex(window_seconds=3600, max_entries=40, generations=4)
+    index.filter(make_posts(200))
+    assert len(index) <= 40 + 2
+    assert index.stats['early_rotations'] > 0
+
+
+def test_add_registers_without_filtering(make_posts):
+    index = DedupIndex()
+    posts = make_posts(4)
+    index.add(posts)
+    assert index.filter(posts) == []
+    assert index.stats['checked'] == 4
+
+
+def test_statistics(make_posts):
+    index = DedupIndex(content_platforms=['twitter'])
+    posts = make_posts(4)
+    index.filter(posts + posts)
+    stats = index.get_statistics()
+    assert stats['duplicates'] == 4
+    assert stats['hit_rate'] == 0.5
+    assert stats['content_platforms'] == ['twitter']
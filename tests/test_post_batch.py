@@ -0,0 +1,111 @@
+"""
+Tests PostBatch: construction, take / since / before, concat, lignes à la demande
+"""
+
+import gc
+import pickle
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.core.models.post_batch import PostBatch
+from src.core.models.social_data import Platform
+from src.data.collectors.load_generator import LoadGenerator
+
+
+def generated_batch(n: int = 500) -> PostBatch:
+    batches = [batch.to_post_batch() for batch in LoadGenerator(seed=7).generate(n)]
+    return PostBatch.concat(batches)
+
+
+def test_from_posts_columns(make_posts):
+    posts = make_posts(10) + make_posts(5, platform=Platform.REDDIT, start=10)
+    batch = PostBatch.from_posts(posts)
+    assert len(batch) == 15
+    assert list(batch) == posts
+    assert batch.platform_counts() == {'twitter': 10, 'reddit': 5}
+    assert sum(batch.category_counts().values()) == 15
+    assert batch.sentiment_counts() == {None: 15}
+    assert PostBatch.from_posts(batch) is batch
+
+
+def test_take_keeps_row_objects(make_posts):
+    posts = make_posts(10)
+    batch = PostBatch.from_posts(posts)
+    child = batch.take([7, 2, 5])
+    assert [post.id for post in child] == [posts[7].id, posts[2].id, posts[5].id]
+    assert child[0] is posts[7]
+    assert list(batch.take(np.ones(10, dtype=bool))) == posts
+    assert len(batch.take([])) == 0
+
+
+def test_getitem(make_posts):
+    posts = make_posts(6)
+    batch = PostBatch.from_posts(posts)
+    assert batch[-1] is posts[-1]
+    assert list(batch[1:5:2]) == posts[1:5:2]
+
+
+def test_since_before_partition(make_posts):
+    now = datetime(2024, 6, 1, 12, 0)
+    posts = make_posts(60, now=now)
+    batch = PostBatch.from_posts(posts)
+    cutoff = now - timedelta(minutes=30)
+    recent, older = batch.since(cutoff), batch.before(cutoff)
+    assert len(recent) + len(older) == 60
+    assert all(post.created_at >= cutoff for post in recent)
+    assert all(post.created_at < cutoff for post in older)
+    assert batch.newest() == max(post.created_at for post in posts)
+
+
+def test_concat(make_posts):
+    first, second = make_posts(4), make_posts(3, platform=Platform.REDDIT, start=4)
+    batch = PostBatch.concat([PostBatch.from_posts(first), second, []])
+    assert list(batch) == first + second
+    assert batch.platform_counts() == {'twitter': 4, 'reddit': 3}
+    assert len(PostBatch.concat([])) == 0
+
+
+def test_split_platforms(make_posts):
+    posts = make_posts(4) + make_posts(3, platform=Platform.REDDIT, start=4)
+    parts = PostBatch.from_posts(posts).split_platforms()
+    assert {name: list(part) for name, part in parts.items()} == {'twitter': posts[:4], 'reddit': posts[4:]}
+
+
+def test_lazy_rows_match_generator():
+    generators = LoadGenerator(seed=7).generate(300)
+    batch = PostBatch.concat([generated.to_post_batch() for generated in generators])
+    expected = [post for generated in generators for post in generated.to_posts()]
+    assert [post.to_dict() for post in batch] == [post.to_dict() for post in expected]
+
+
+def test_take_on_lazy_batch_does_not_reference_parent():
+    parent = generated_batch()
+    child = parent.since(datetime(1970, 1, 1)).take(np.arange(0, 500, 3))
+    assert child._row_factory is None
+    assert parent not in gc.get_referents(child)
+    expected = [parent[i].to_dict() for i in range(0, 500, 3)]
+    del parent
+    assert [post.to_dict() for post in child] == expected
+
+
+def test_take_on_column_batch_builds_rows_from_own_columns(make_posts):
+    posts = make_posts(6)
+    source = PostBatch.from_posts(posts)
+    columns = {name: column for name, column in source.columns.items()}
+    for name in ('id', 'content', 'author', 'url'):
+        columns[name] = source.text(name)
+    metrics = {'likes': np.array([post.metrics['likes'] for post in posts], dtype=np.int64)}
+    lazy = PostBatch(columns, metrics=metrics)
+
+    child = lazy.take([1, 3])
+    assert child._row_factory is None
+    assert [post.id for post in child] == [posts[1].id, posts[3].id]
+    assert [post.metrics['likes'] for post in child] == [1, 3]
+
+
+def test_pickle_round_trip(make_posts):
+    posts = make_posts(5)
+    restored = pickle.loads(pickle.dumps(PostBatch.from_posts(posts).take([0, 4])))
+    assert list(restored) == [posts[0], posts[4]]
+    assert restored.platform_counts() == {'twitter': 2}
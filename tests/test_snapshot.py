@@ -0,0 +1,110 @@
+"""
+Tests snapshots: SnapshotStore (save/load) et Pipeline.save_snapshot / restore
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from src.analytics.trends.detector import TrendDetector
+from src.core.models.social_data import Platform
+from src.pipeline.pipeline import Pipeline
+from src.pipeline.snapshot import SnapshotStore
+
+
+@pytest.fixture
+def store(tmp_path) -> SnapshotStore:
+    return SnapshotStore(str(tmp_path / 'snapshots' / 'state.json.gz'), max_posts=50)
+
+
+def make_pipeline(analyzer, store, **options) -> Pipeline:
+    return Pipeline(collector=object(), analyzer=analyzer, detector=TrendDetector(),
+                    snapshot_store=store, **options)
+
+
+def test_store_round_trip(store, analyzer, make_posts):
+    posts = list(analyzer.analyze_batch(make_posts(20)))
+    trends = TrendDetector().detect_business_trends(posts)
+    assert store.save(posts, trends, {'total': 20}, {'twitter': 20}, {'AI': 5})
+
+    snapshot = store.load()
+    assert snapshot['posts'] == posts
+    assert [trend.to_dict() for trend in snapshot['trends']] == [trend.to_dict() for trend in trends]
+    assert snapshot['sentiment_stats'] == {'total': 20}
+    assert snapshot['platform_stats'] == {'twitter': 20}
+    assert snapshot['detector'] == {'previous_volumes': {'AI': 5}}
+
+
+def test_store_keeps_most_recent_posts(store, make_posts):
+    posts = make_posts(80)
+    store.save(posts, [], {}, {}, {})
+    assert store.load()['posts'] == posts[-50:]
+
+
+def test_store_missing_or_unreadable(store):
+    assert store.load() is None
+    os.makedirs(os.path.dirname(store.path))
+    with open(store.path, 'wb') as f:
+        f.write(b'not gzip')
+    assert store.load() is None
+    assert store.stats['errors'] == 1
+
+
+def test_store_ignores_other_version(store, make_posts):
+    store.save(make_posts(3), [], {}, {}, {})
+    with gzip.open(store.path, 'rb') as f:
+        payload = json.loads(f.read())
+    payload['version'] = 999
+    with gzip.open(store.path, 'wb') as f:
+        f.write(json.dumps(payload).encode('utf-8'))
+    assert store.load() is None
+
+
+def test_failed_save_keeps_previous_snapshot(tmp_path, make_posts):
+    store = SnapshotStore(str(tmp_path / 'state.json.gz'))
+    store.save(make_posts(3), [], {}, {}, {})
+    # Dossier cible remplacé par un fichier: écriture impossible
+    blocked = SnapshotStore(str(tmp_path / 'state.json.gz' / 'nested.json.gz'))
+    assert not blocked.save(make_posts(5), [], {}, {}, {})
+    assert len(store.load()['posts']) == 3
+    assert [name for name in os.listdir(tmp_path) if name.startswith('.snapshot-')] == []
+
+
+def test_pipeline_restore(store, analyzer, make_posts):
+    first = make_pipeline(analyzer, store)
+    first.run_once(make_posts(30))
+    first.run_once(make_posts(30, platform=Platform.REDDIT, start=30))
+    assert first.save_snapshot()
+    assert first.detector.get_state()
+
+    restored = make_pipeline(analyzer, store)
+    assert restored.restore()
+    current = restored.current
+    assert list(current.posts) == list(first.current.posts)[-50:]
+    assert [trend.name for trend in current.trends] == [trend.name for trend in first.current.trends]
+    assert current.sentiment_stats == first.current.sentiment_stats
+    assert restored.detector.get_state() == first.detector.get_state()
+    assert current.version == 1
+
+    # Posts restaurés connus de l'index de déduplication
+    cycle = restored.run_once(make_posts(30, platform=Platform.REDDIT, start=30))
+    assert cycle.duplicates == 30
+
+
+def test_pipeline_restore_skips_stale_detector_state(store, analyzer, make_posts):
+    first = make_pipeline(analyzer, store)
+    first.run_once(make_posts(30))
+    first.save_snapshot()
+
+    restored = make_pipeline(analyzer, store, snapshot_max_age=-1)
+    assert restored.restore()
+    assert restored.detector.get_state() == {}
+    assert len(restored.current.posts) == 30
+
+
+def test_pipeline_restore_without_snapshot(store, analyzer):
+    pipeline = make_pipeline(analyzer, store)
+    assert not pipeline.restore()
+    assert pipeline.current.version == 0
@@ -0,0 +1,110 @@
+"""
+Tests SocialPost: aller-retour dict/JSON, cache to_json, métriques
+"""
+
+import json
+import pickle
+from datetime import datetime
+
+import pytest
+
+from src.core.models.social_data import BusinessCategory, Platform, SocialPost
+
+
+def make_post(**changes) -> SocialPost:
+    values = dict(
+        id='reddit_1_0',
+        platform=Platform.REDDIT,
+        content='AI startup raises funds',
+        author='u/alice',
+        author_followers=120,
+        created_at=datetime(2024, 5, 1, 12, 30),
+        url='https://reddit.com/r/technology/comments/0',
+        metrics={'upvotes': 1200, 'comments': 45},
+        category=BusinessCategory.TECHNOLOGY,
+        metadata={'subreddit': 'r/technology'}
+    )
+    values.update(changes)
+    return SocialPost(**values)
+
+
+def test_dict_round_trip():
+    post = make_post(sentiment='positive', sentiment_score=0.6, engagement_rate=0.1, business_potential=7)
+    assert SocialPost.from_dict(post.to_dict()) == post
+
+
+def test_json_round_trip():
+    post = make_post(content='Café ☕ et croissance', sentiment='neutral')
+    data = json.loads(post.to_json())
+    assert data == post.to_dict()
+    assert SocialPost.from_dict(data) == post
+
+
+def test_pickle_round_trip():
+    post = make_post(metadata={'subreddit': 'r/technology', 'event': 'launch'})
+    restored = pickle.loads(pickle.dumps(post))
+    assert restored == post
+    assert restored.get_metadata('event') == 'launch'
+
+
+def test_replace_keeps_original():
+    post = make_post()
+    copy = post.replace(id='reddit_1_1')
+    assert copy.id == 'reddit_1_1'
+    assert post.id == 'reddit_1_0'
+    assert copy.metrics == post.metrics
+
+
+@pytest.mark.parametrize('field, value', [
+    ('id', 'reddit_1_0_s1'),
+    ('content', 'Blockchain gaming is back'),
+    ('created_at', datetime(2024, 5, 2)),
+    ('url', 'https://reddit.com/x'),
+    ('author_followers', 5),
+    ('category', BusinessCategory.GAMING),
+    ('sentiment', 'negative'),
+    ('sentiment_score', -0.4),
+    ('author', 'u/bob'),
+    ('metrics', {'upvotes': 1}),
+    ('metadata', {'subreddit': 'r/gaming'}),
+])
+def test_to_json_cache_invalidated_on_assignment(field, value):
+    post = make_post()
+    before = post.to_json()
+    setattr(post, field, value)
+    after = json.loads(post.to_json())
+    assert after == post.to_dict()
+    assert post.to_json() != before
+
+
+def test_to_json_is_cached():
+    post = make_post()
+    assert post.to_json() is post.to_json()
+
+
+def test_metadata_in_place_change_needs_reassignment():
+    post = make_post()
+    post.to_json()
+    metadata = post.metadata
+    metadata['event'] = 'launch'
+    post.metadata = metadata
+    assert json.loads(post.to_json())['metadata']['event'] == 'launch'
+
+
+@pytest.mark.parametrize('metrics', [
+    {'likes': 0.75, 'views': 3},         # non entier: pas de troncature
+    {'views': 10 ** 30},                 # au-delà de 64 bits
+    {'views': 2 ** 63},
+])
+def test_metrics_out_of_range_kept_in_tuple(metrics):
+    post = make_post(metrics=metrics)
+    assert isinstance(post._metric_values, tuple)
+    assert dict(post.metrics) == metrics
+    assert json.loads(post.to_json())['metrics'] == metrics
+    assert pickle.loads(pickle.dumps(post)).metrics == metrics
+
+
+def test_metrics_compact_arrays():
+    assert make_post(metrics={'likes': 10})._metric_values.typecode == 'I'
+    assert make_post(metrics={'likes': -1})._metric_values.typecode == 'q'
+    assert make_post(metrics={'likes': 2 ** 40})._metric_values.typecode == 'q'
@@ -0,0 +1,49 @@
+"""
+Tests StateSnapshot: état publié immuable et versionné
+"""
+
+import dataclasses
+import json
+
+import pytest
+
+from src.analytics.trends.detector import TrendDetector
+from src.core.models.social_data import Platform
+from src.pipeline.pipeline import Pipeline
+
+
+@pytest.fixture
+def pipeline(analyzer) -> Pipeline:
+    return Pipeline(collector=object(), analyzer=analyzer, detector=TrendDetector())
+
+
+def test_each_cycle_publishes_new_version(pipeline, make_posts):
+    first = pipeline.run_once(make_posts(20)).snapshot
+    second = pipeline.run_once(make_posts(20, platform=Platform.REDDIT, start=20)).snapshot
+    assert (first.version, second.version) == (1, 2)
+    assert pipeline.current is second
+
+
+def test_reader_reference_unchanged_by_later_cycles(pipeline, make_posts):
+    pipeline.run_once(make_posts(20))
+    held = pipeline.current
+    posts, stats = list(held.posts), dict(held.performance_metrics)
+
+    pipeline.run_once(make_posts(20, platform=Platform.REDDIT, start=20))
+    assert list(held.posts) == posts
+    assert held.performance_metrics == stats
+    assert len(pipeline.current.posts) == 40
+
+
+def test_snapshot_is_frozen(pipeline, make_posts):
+    snapshot = pipeline.run_once(make_posts(5)).snapshot
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.version = 99
+
+
+def test_encoded_views(pipeline, make_posts):
+    snapshot = pipeline.run_once(make_posts(120)).snapshot
+    assert json.loads(snapshot.recent_posts_encoded(20)) == [post.to_dict() for post in list(snapshot.posts)[-20:]]
+    assert len(json.loads(snapshot.recent_posts_encoded(500))) == 100
+    assert json.loads(snapshot.recent_posts_encoded(0)) == []
+    assert json.loads(snapshot.trends_encoded) == [trend.to_dict() for trend in snapshot.trends]